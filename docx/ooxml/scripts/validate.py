@@ -2,8 +2,12 @@
 """
 Command line tool to validate Office document XML files against XSD schemas and tracked changes.
 
+The document can be an unpacked directory or the .docx/.pptx file itself; packed
+files are validated in memory without extracting them.
+
 Usage:
     python validate.py <dir> --original <original_file>
+    python validate.py <file.docx|file.pptx> [--original <original_file>] [--quick]
 """
 
 import argparse
@@ -17,12 +21,16 @@ def main():
     parser = argparse.ArgumentParser(description="Validate Office document XML files")
     parser.add_argument(
         "unpacked_dir",
-        help="Path to unpacked Office document directory",
+        help="Path to unpacked Office document directory, or to a .docx/.pptx file",
     )
     parser.add_argument(
         "--original",
-        required=True,
-        help="Path to original file (.docx/.pptx/.xlsx)",
+        help="Path to original file (.docx/.pptx/.xlsx); required for a directory",
+    )
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="Skip XSD schema validation (structural checks only)",
     )
     parser.add_argument(
         "-v",
@@ -34,12 +42,16 @@ def main():
 
     # Validate paths
     unpacked_dir = Path(args.unpacked_dir)
-    original_file = Path(args.original)
-    file_extension = original_file.suffix.lower()
-    assert unpacked_dir.is_dir(), f"Error: {unpacked_dir} is not a directory"
-    assert original_file.is_file(), f"Error: {original_file} is not a file"
+    original_file = Path(args.original) if args.original else None
+    assert unpacked_dir.exists(), f"Error: {unpacked_dir} does not exist"
+    assert unpacked_dir.is_file() or original_file, (
+        f"Error: --original is required to validate the directory {unpacked_dir}"
+    )
+    if original_file:
+        assert original_file.is_file(), f"Error: {original_file} is not a file"
+    file_extension = (original_file or unpacked_dir).suffix.lower()
     assert file_extension in [".docx", ".pptx", ".xlsx"], (
-        f"Error: {original_file} must be a .docx, .pptx, or .xlsx file"
+        f"Error: {original_file or unpacked_dir} must be a .docx, .pptx, or .xlsx file"
     )
 
     # Run validations
@@ -55,7 +67,15 @@ def main():
     # Run validators
     success = True
     for V in validators:
-        validator = V(unpacked_dir, original_file, verbose=args.verbose)
+        if V is RedliningValidator:
+            if not original_file:
+                print("Skipping tracked changes validation (no --original given)")
+                continue
+            validator = V(unpacked_dir, original_file, verbose=args.verbose)
+        else:
+            validator = V(
+                unpacked_dir, original_file, verbose=args.verbose, quick=args.quick
+            )
         if not validator.validate():
             success = False
 
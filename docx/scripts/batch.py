@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Run one edit script over many Word documents.
+
+Each .docx is unpacked, opened as a Document, passed to the edit function,
+validated, and packed into the output directory. Documents are processed in a
+pool of worker processes; each worker loads the edit script and the XSD schemas
+once and reuses them for every document it handles. A summary line per
+document (edits applied, validation status, timings) is written as JSON Lines.
+
+The edit function receives the Document and may return the number of edits it
+made (an int, a list of created nodes, or a dict of counts):
+
+    # review.py
+    def edit(doc):
+        return doc.apply_edits([(None, "within 30 days", "within 45 days")])
+
+Usage (from the docx skill root):
+    python -m scripts.batch contracts/ --script review.py --output-dir reviewed/
+    python -m scripts.batch a.docx b.docx --script review.py:edit --output-dir out/ --workers 4
+"""
+
+import argparse
+import contextlib
+import importlib
+import importlib.util
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+from ooxml.scripts.pack import pack_document
+from ooxml.scripts.unpack import unpack_document
+
+from .document import Document, _generate_rsid
+
+# Last lines of captured output kept in a summary when a document fails
+OUTPUT_TAIL_LINES = 20
+
+# Settings of the current worker process (set by _init_worker)
+_worker = {}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run an edit script over many Word documents.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python -m scripts.batch contracts/ --script review.py --output-dir reviewed/
+    Runs edit(doc) from review.py on every .docx in contracts/
+
+  python -m scripts.batch a.docx b.docx --script review.py:redline --output-dir out/ --workers 4
+    Runs redline(doc) on two files with 4 worker processes
+
+  python -m scripts.batch contracts/ --script review.py --output-dir out/ --author "Legal" --initials L
+    Uses a custom author for tracked changes and comments
+        """,
+    )
+    parser.add_argument("inputs", nargs="+", help=".docx files or directories of .docx files")
+    parser.add_argument(
+        "--script",
+        required=True,
+        help="Edit function as file.py[:function] or module:function (default function: edit)",
+    )
+    parser.add_argument("--output-dir", required=True, help="Directory for edited documents")
+    parser.add_argument(
+        "--summary",
+        help="JSON Lines summary file (default: <output-dir>/batch_summary.jsonl)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Worker processes (default: 0 = one per CPU core)",
+    )
+    parser.add_argument("--author", default="Claude", help="Author for changes and comments")
+    parser.add_argument("--initials", default="C", help="Author initials for comments")
+    parser.add_argument("--rsid", help="RSID shared by all documents (default: generated)")
+    parser.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="Skip schema and redlining validation",
+    )
+
+    args = parser.parse_args()
+
+    try:
+        documents = find_documents(args.inputs)
+        summaries = run_batch(
+            documents,
+            args.script,
+            args.output_dir,
+            summary_path=args.summary,
+            workers=args.workers,
+            author=args.author,
+            initials=args.initials,
+            rsid=args.rsid,
+            validate=not args.no_validate,
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    statuses = [summary["status"] for summary in summaries]
+    print(
+        f"\nProcessed {len(summaries)} document(s): {statuses.count('ok')} ok, "
+        f"{statuses.count('invalid')} invalid, {statuses.count('error')} error(s)"
+    )
+    if statuses.count("ok") != len(statuses):
+        sys.exit(1)
+
+
+def find_documents(inputs):
+    """Expand files and directories into a sorted list of .docx paths.
+
+    Raises:
+        ValueError: If an input does not exist, no documents are found, or two
+            documents share a file name (outputs would collide)
+    """
+    documents = []
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            documents.extend(sorted(p for p in path.glob("*.docx") if not p.name.startswith("~$")))
+        elif path.is_file():
+            documents.append(path)
+        else:
+            raise ValueError(f"Input not found: {item}")
+
+    if not documents:
+        raise ValueError("No .docx files found")
+    names = [document.name for document in documents]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate file names: {', '.join(duplicates)}")
+    return documents
+
+
+def load_edit_function(spec):
+    """Load an edit function from "file.py[:function]" or "module:function".
+
+    Raises:
+        ValueError: If the script or function cannot be found
+    """
+    target, _, function_name = spec.partition(":")
+    function_name = function_name or "edit"
+
+    if target.endswith(".py"):
+        script_path = Path(target)
+        if not script_path.exists():
+            raise ValueError(f"Edit script not found: {target}")
+        module_spec = importlib.util.spec_from_file_location(script_path.stem, script_path)
+        module = importlib.util.module_from_spec(module_spec)
+        module_spec.loader.exec_module(module)  # type: ignore
+    else:
+        try:
+            module = importlib.import_module(target)
+        except ImportError as e:
+            raise ValueError(f"Cannot import edit module {target}: {e}")
+
+    function = getattr(module, function_name, None)
+    if not callable(function):
+        raise ValueError(f"Edit script {target} has no function '{function_name}'")
+    return function
+
+
+def run_batch(
+    documents,
+    script,
+    output_dir,
+    summary_path=None,
+    workers=0,
+    author="Claude",
+    initials="C",
+    rsid=None,
+    validate=True,
+):
+    """Process documents with an edit function in a bounded process pool.
+
+    Args:
+        documents: List of .docx paths
+        script: Edit function, or a spec string for load_edit_function()
+            (functions must be importable by the worker processes)
+        output_dir: Directory for edited documents (same file names)
+        summary_path: JSON Lines summary file (default: <output_dir>/batch_summary.jsonl)
+        workers: Worker processes (0 = one per CPU core, 1 = in this process)
+        author: Author for tracked changes and comments
+        initials: Author initials for comments
+        rsid: RSID shared by all documents (generated if None)
+        validate: Run schema and redlining validation before packing
+
+    Returns:
+        list: Per-document summaries, in completion order
+    """
+    if isinstance(script, str):
+        load_edit_function(script)  # Fail fast on a bad spec, before starting workers
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    summary_path = Path(summary_path) if summary_path else output_dir / "batch_summary.jsonl"
+    workers = workers or os.cpu_count() or 1
+    settings = {
+        "author": author,
+        "initials": initials,
+        "rsid": rsid or _generate_rsid(),
+        "validate": validate,
+    }
+    jobs = [(str(document), str(output_dir / Path(document).name)) for document in documents]
+
+    summaries = []
+    with open(summary_path, "w", encoding="utf-8") as summary_file:
+
+        def record(summary):
+            summaries.append(summary)
+            summary_file.write(json.dumps(summary) + "\n")
+            summary_file.flush()
+            detail = f"{summary['edits']} edit(s)" if summary["edits"] is not None else ""
+            if summary["error"]:
+                detail = summary["error"].splitlines()[0]
+            print(
+                f"[{len(summaries)}/{len(jobs)}] {summary['status']:<7} "
+                f"{Path(summary['input']).name} ({summary['timings']['total']:.2f}s) {detail}"
+            )
+
+        if workers == 1:
+            _init_worker(script, settings)
+            for job in jobs:
+                record(process_document(*job))
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(script, settings),
+            ) as executor:
+                # Keep at most two jobs per worker queued so memory stays flat
+                pending = set()
+                for job in jobs:
+                    pending.add(executor.submit(process_document, *job))
+                    if len(pending) >= workers * 2:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            record(future.result())
+                for future in wait(pending).done:
+                    record(future.result())
+
+    print(f"Summary saved to: {summary_path}")
+    return summaries
+
+
+def _init_worker(script, settings):
+    """Load the edit function and session settings once per worker process."""
+    _worker.clear()
+    _worker.update(settings)
+    _worker["edit"] = load_edit_function(script) if isinstance(script, str) else script
+
+
+def process_document(input_path, output_path):
+    """Unpack, edit, validate and pack one document (runs in a worker).
+
+    Returns:
+        dict: Summary with input, output, status ("ok", "invalid" or "error"),
+            edits, validation ("passed", "failed" or "skipped"), error and timings
+    """
+    summary = {
+        "input": input_path,
+        "output": None,
+        "status": "error",
+        "edits": None,
+        "validation": None,
+        "error": None,
+        "timings": {},
+    }
+    timings = summary["timings"]
+    started = time.perf_counter()
+    output = io.StringIO()
+
+    try:
+        with contextlib.redirect_stdout(output), tempfile.TemporaryDirectory() as temp_dir:
+            step = time.perf_counter()
+            unpacked = Path(temp_dir) / "unpacked"
+            unpack_document(input_path, unpacked)
+            doc = Document(
+                unpacked,
+                rsid=_worker["rsid"],
+                author=_worker["author"],
+                initials=_worker["initials"],
+                original_docx=input_path,
+            )
+            timings["load"] = round(time.perf_counter() - step, 4)
+
+            step = time.perf_counter()
+            summary["edits"] = _count_edits(_worker["edit"](doc))
+            timings["edit"] = round(time.perf_counter() - step, 4)
+
+            step = time.perf_counter()
+            try:
+                doc.save(validate=_worker["validate"])
+                summary["validation"] = "passed" if _worker["validate"] else "skipped"
+            except ValueError as e:
+                summary["validation"] = "failed"
+                summary["status"] = "invalid"
+                summary["error"] = f"{e}\n" + _tail(output.getvalue())
+            timings["validate"] = round(time.perf_counter() - step, 4)
+
+            if summary["validation"] != "failed":
+                step = time.perf_counter()
+                # Write edited parts in packed form so packing copies them as-is
+                condensed = []
+                for editor in doc._editors.values():
+                    editor.save(force=True, condensed=True)
+                    condensed.append(editor.xml_path)
+                pack_document(doc.unpacked_path, output_path, validate=False, condensed=condensed)
+                timings["pack"] = round(time.perf_counter() - step, 4)
+                summary["output"] = output_path
+                summary["status"] = "ok"
+            del doc
+    except Exception as e:
+        summary["error"] = f"{type(e).__name__}: {e}\n" + _tail(
+            output.getvalue() + traceback.format_exc()
+        )
+
+    timings["total"] = round(time.perf_counter() - started, 4)
+    return summary
+
+
+def _count_edits(result):
+    """Interpret an edit function's return value as a number of edits (or None)."""
+    if isinstance(result, bool) or result is None:
+        return None
+    if isinstance(result, int):
+        return result
+    if isinstance(result, dict):
+        counts = list(result.values())
+        return sum(counts) if all(isinstance(c, int) for c in counts) else len(counts)
+    try:
+        return len(result)
+    except TypeError:
+        return None
+
+
+def _tail(text):
+    """Last lines of captured output, for failure summaries."""
+    return "\n".join(text.strip().splitlines()[-OUTPUT_TAIL_LINES:])
+
+
+if __name__ == "__main__":
+    main()
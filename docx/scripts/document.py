@@ -12,6 +12,7 @@ Usage:
     # Find nodes
     node = doc["word/document.xml"].get_node(tag="w:del", attrs={"w:id": "1"})
     node = doc["word/document.xml"].get_node(tag="w:p", line_number=10)
+    match = doc["word/document.xml"].find_text("text split across runs")[0]
 
     # Add comments
     doc.add_comment(start=node, end=node, text="Comment text")
@@ -19,19 +20,29 @@ Usage:
 
     # Suggest tracked changes
     doc["word/document.xml"].suggest_deletion(node)  # Delete content
+    doc["word/document.xml"].suggest_deletion(match)  # Delete a character range
     doc["word/document.xml"].revert_insertion(ins_node)  # Reject insertion
     doc["word/document.xml"].revert_deletion(del_node)  # Reject deletion
 
+    # Apply many text edits as tracked changes in one pass
+    doc.apply_edits([(None, "within 30 days", "within 45 days")])
+
     # Save
     doc.save()
 """
 
+import bisect
 import html
+import itertools
+import os
 import random
+import re
 import shutil
 import tempfile
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any, List, Tuple
 
 from defusedxml import minidom
 from ooxml.scripts.pack import pack_document
@@ -418,7 +429,7 @@ class DocxXMLEditor(XMLEditor):
                 ins_elem.appendChild(new_run)
 
             # Insert the new insertion after the deletion
-            nodes = self.insert_after(del_elem, ins_elem.toxml())
+            nodes = self.insert_after(del_elem, ins_elem)
 
             # If processing a single w:del, track the created insertion
             if is_single_del and nodes:
@@ -479,22 +490,33 @@ class DocxXMLEditor(XMLEditor):
 
         return para.toxml()
 
-    def suggest_deletion(self, elem):
+    def suggest_deletion(self, elem, start=None, end=None):
         """Mark a w:r or w:p element as deleted with tracked changes (in-place DOM manipulation).
 
         For w:r: wraps in <w:del>, converts <w:t> to <w:delText>, preserves w:rPr
         For w:p (regular): wraps content in <w:del>, converts <w:t> to <w:delText>
         For w:p (numbered list): adds <w:del/> to w:rPr in w:pPr, wraps content in <w:del>
+        For a character range (TextMatch, or w:p with start and end): splits runs at
+        the range boundaries and wraps only the range in <w:del>
 
         Args:
-            elem: A w:r or w:p DOM element without existing tracked changes
+            elem: A w:r or w:p DOM element without existing tracked changes, or a TextMatch
+            start: Start offset in the paragraph text (w:p only, with end)
+            end: End offset in the paragraph text (w:p only, with start)
 
         Returns:
-            Element: The modified element
+            Element: The modified element (list of created w:del elements for ranges)
 
         Raises:
             ValueError: If element has existing tracked changes or invalid structure
+
+        Example:
+            match = doc["word/document.xml"].find_text("and its affiliates")[0]
+            doc["word/document.xml"].suggest_deletion(match)
         """
+        if isinstance(elem, TextMatch) or start is not None or end is not None:
+            return self.suggest_replacement(elem, "", start, end)
+
         if elem.nodeName == "w:r":
             # Check for existing w:delText
             if elem.getElementsByTagName("w:delText"):
@@ -592,6 +614,797 @@ class DocxXMLEditor(XMLEditor):
         else:
             raise ValueError(f"Element must be w:r or w:p, got {elem.nodeName}")
 
+    def apply_edits(self, edits):
+        """Apply many text edits as tracked changes in one pass.
+
+        Each edit is a (paragraph, old_text, new_text) triple. The paragraph
+        locator is one of:
+        - a w:p element
+        - a w14:paraId string (e.g. "3A2B1C0D")
+        - a line number (int) where the w:p opens
+        - a dict of get_node() filters (tag defaults to "w:p")
+        - None to search every paragraph for old_text
+
+        old_text must appear exactly once in the located paragraph and may span
+        runs with different formatting; runs are split at the edit boundaries.
+        Only the words that differ are marked: "within 30 days" → "within 45 days"
+        produces <w:del>30</w:del><w:ins>45</w:ins>. An empty new_text deletes.
+
+        All edits are resolved before the document is modified, so a failing
+        edit leaves the document untouched.
+
+        Args:
+            edits: Iterable of (paragraph, old_text, new_text) triples
+
+        Returns:
+            list: For each edit, the list of created w:del/w:ins elements
+
+        Raises:
+            ValueError: If any edit cannot be located or overlaps another edit
+                or an existing tracked change (all failures are reported)
+
+        Example:
+            doc["word/document.xml"].apply_edits([
+                (None, "within 30 days", "within 45 days"),
+                ("3A2B1C0D", "monthly", "quarterly"),
+                (None, "and its affiliates", ""),
+            ])
+        """
+        edits = list(edits)
+        index = self.text_index()
+        planned = []
+        errors = []
+        for edit_index, (locator, old_text, new_text) in enumerate(edits):
+            old_text = html.unescape(old_text)
+            new_text = html.unescape(new_text or "")
+            try:
+                if not old_text:
+                    raise ValueError("old text must not be empty")
+                para = index.resolve(locator, old_text)
+                text = index.paragraph(para).text
+                count = text.count(old_text)
+                if count != 1:
+                    raise ValueError(
+                        f"'{old_text}' appears {count} times in the paragraph; "
+                        f"use a longer old text"
+                    )
+                start = text.index(old_text)
+                prefix, suffix = _unchanged_affixes(old_text, new_text)
+                start, end = start + prefix, start + len(old_text) - suffix
+                new_text = new_text[prefix : len(new_text) - suffix]
+                self._check_editable(index.paragraph(para), start, end)
+            except ValueError as e:
+                errors.append(f"edit {edit_index}: {e}")
+                continue
+            if start < end or new_text:
+                planned.append((edit_index, para, start, end, new_text))
+
+        by_paragraph = {}
+        for plan in planned:
+            by_paragraph.setdefault(plan[1], []).append(plan)
+        for plans in by_paragraph.values():
+            plans.sort(key=lambda plan: (plan[2], plan[3]))
+            for previous, current in zip(plans, plans[1:]):
+                if current[2] < previous[3] or current[2] == previous[2]:
+                    errors.append(
+                        f"edit {current[0]}: overlaps edit {previous[0]} "
+                        f"in the same paragraph"
+                    )
+
+        if errors:
+            raise ValueError(
+                f"Could not apply {len(errors)} edit(s):\n  " + "\n  ".join(errors)
+            )
+
+        # Apply right to left so earlier offsets in each paragraph stay valid
+        results = [[] for _ in edits]
+        change_ids = itertools.count(self._get_next_change_id())
+        for edit_index, para, start, end, new_text in sorted(
+            planned, key=lambda plan: plan[2], reverse=True
+        ):
+            results[edit_index] = self._suggest_text_change(
+                para, start, end, new_text, change_ids
+            )
+        return results
+
+    def text_index(self):
+        """Build a TextIndex over the current paragraphs of this part.
+
+        The index reflects the document at the time it is built; build a new
+        one after editing.
+        """
+        return TextIndex(self)
+
+    def find_text(self, pattern: str, regex: bool = False):
+        """Find text anywhere in this part, including text split across runs.
+
+        Args:
+            pattern: Substring to find (entities such as &#8220; are decoded),
+                or a regular expression if regex is True
+            regex: Treat pattern as a regular expression
+
+        Returns:
+            List[TextMatch]: Matches in document order, each with its paragraph,
+                character offsets and the runs it spans
+
+        Example:
+            match = doc["word/document.xml"].find_text("30 days")[0]
+            doc["word/document.xml"].suggest_replacement(match, "45 days")
+        """
+        return self.text_index().find(pattern, regex=regex)
+
+    def suggest_replacement(self, target, new_text, start=None, end=None):
+        """Replace a character range of a paragraph with tracked changes.
+
+        Runs are split at the range boundaries so only the range is marked;
+        the inserted run copies the formatting of the first deleted run.
+
+        Args:
+            target: TextMatch, or a w:p element together with start and end
+            new_text: Replacement text ("" to delete; tabs and newlines become
+                w:tab and w:br)
+            start: Start offset in the paragraph text (w:p targets only)
+            end: End offset in the paragraph text (w:p targets only)
+
+        Returns:
+            list: Created w:del elements followed by the w:ins (if any)
+
+        Raises:
+            ValueError: If the range is invalid or overlaps a tracked change
+        """
+        para, start, end = self._resolve_range(target, start, end)
+        self._check_editable(ParagraphText(para), start, end)
+        return self._suggest_text_change(
+            para, start, end, new_text, itertools.count(self._get_next_change_id())
+        )
+
+    def resolve_tracked_changes(self, accept: bool, matches) -> int:
+        """Accept or reject every tracked change selected by a filter, in one pass.
+
+        Handles w:ins, w:del, w:moveFrom and w:moveTo containers, inserted or
+        deleted paragraph marks (merging paragraphs where needed), inserted or
+        deleted table rows, and move range markers. The part is walked once
+        and each selected change is resolved in place, so the cost is linear in
+        the size of the part. Resolving is not itself tracked.
+
+        Args:
+            accept: True to accept the changes, False to reject them
+            matches: Callable taking a change element and returning True if it
+                should be resolved (see Document.accept_changes for filters)
+
+        Returns:
+            int: Number of tracked changes resolved (move range markers that are
+                removed along with a move are not counted)
+        """
+        changes = []
+        range_ends = {}
+        stack = [self.dom.documentElement]
+        while stack:
+            node = stack.pop()
+            tag = node.tagName
+            if tag in _REVISION_TAGS or tag in _MOVE_RANGE_STARTS:
+                if matches(node):
+                    changes.append(node)
+            elif tag in _MOVE_RANGE_ENDS:
+                range_ends.setdefault(node.getAttribute("w:id"), []).append(node)
+            stack.extend(
+                child
+                for child in reversed(node.childNodes)
+                if child.nodeType == child.ELEMENT_NODE
+            )
+
+        # Last to first, so nested changes and following paragraphs are
+        # resolved before the changes that contain or merge into them
+        for elem in reversed(changes):
+            tag = elem.tagName
+            parent = elem.parentNode
+            removes_content = (accept and tag in _DELETION_TAGS) or (
+                not accept and tag in _INSERTION_TAGS
+            )
+            if tag in _MOVE_RANGE_STARTS:
+                for range_end in range_ends.get(elem.getAttribute("w:id"), []):
+                    if range_end.parentNode is not None:
+                        range_end.parentNode.removeChild(range_end)
+                parent.removeChild(elem)
+            elif parent.nodeName == "w:trPr":
+                # Inserted or deleted table row
+                row = parent.parentNode
+                _remove_marker(elem)
+                if removes_content and row.parentNode is not None:
+                    table = row.parentNode
+                    while table is not None and table.nodeName != "w:tbl":
+                        table = table.parentNode
+                    row.parentNode.removeChild(row)
+                    # A table without rows is invalid; drop it with its last row
+                    if table is not None and not table.getElementsByTagName("w:tr"):
+                        table.parentNode.removeChild(table)
+            elif parent.nodeName == "w:rPr":
+                # Inserted or deleted paragraph mark (or run property marker)
+                pPr = parent.parentNode
+                para = pPr.parentNode if pPr.nodeName == "w:pPr" else None
+                _remove_marker(elem)
+                if removes_content and para is not None:
+                    self._merge_with_next_paragraph(para)
+            elif removes_content:
+                parent.removeChild(elem)
+            else:
+                if tag in _DELETION_TAGS:
+                    self._restore_deleted_text(elem)
+                while elem.firstChild:
+                    parent.insertBefore(elem.firstChild, elem)
+                parent.removeChild(elem)
+        return sum(1 for elem in changes if elem.tagName in _REVISION_TAGS)
+
+    def _restore_deleted_text(self, elem):
+        """Convert w:delText/w:delInstrText back to w:t/w:instrText below elem."""
+        for old_tag, new_tag in _DELETED_TEXT_TAGS.items():
+            for old in list(elem.getElementsByTagName(old_tag)):
+                new = self.dom.createElement(new_tag)
+                while old.firstChild:
+                    new.appendChild(old.firstChild)
+                for i in range(old.attributes.length):
+                    attr = old.attributes.item(i)
+                    new.setAttribute(attr.name, attr.value)
+                text = _node_text(new)
+                if text[:1].isspace() or text[-1:].isspace():
+                    new.setAttribute("xml:space", "preserve")
+                old.parentNode.replaceChild(new, old)
+
+    def _merge_with_next_paragraph(self, para):
+        """Join a paragraph whose mark was removed with the following paragraph.
+
+        The content moves to the start of the next paragraph, which keeps its
+        own properties, matching Word. A paragraph without a following
+        paragraph (e.g. last in a cell) is left as is.
+        """
+        next_para = para.nextSibling
+        while next_para is not None and next_para.nodeType != next_para.ELEMENT_NODE:
+            next_para = next_para.nextSibling
+        if next_para is None or next_para.tagName != "w:p":
+            return
+        pPr = _first_child_element(next_para, "w:pPr")
+        anchor = pPr.nextSibling if pPr is not None else next_para.firstChild
+        for child in [c for c in para.childNodes if c.nodeName != "w:pPr"]:
+            next_para.insertBefore(child, anchor)
+        para.parentNode.removeChild(para)
+
+    def _resolve_range(self, target, start, end):
+        """Normalize a TextMatch or (w:p, start, end) into (para, start, end)."""
+        if isinstance(target, TextMatch):
+            return target.para, target.start, target.end
+        if getattr(target, "nodeName", None) != "w:p" or start is None or end is None:
+            raise ValueError("Character ranges need a TextMatch or a w:p with start and end")
+        length = len(ParagraphText(target).text)
+        if not 0 <= start <= end <= length:
+            raise ValueError(f"Invalid range {start}-{end} for paragraph of length {length}")
+        return target, start, end
+
+    def _check_editable(self, paragraph_text, start, end):
+        """Raise if text[start:end] of a paragraph lies inside an existing tracked change."""
+        for run in paragraph_text.runs(start, end):
+            parent = run.parentNode
+            while parent is not None and parent is not paragraph_text.para:
+                if parent.nodeName in _TRACKED_CONTAINERS:
+                    raise ValueError(
+                        f"'{paragraph_text.text[start:end]}' overlaps an existing "
+                        f"tracked change; use replace_node() to edit inside it"
+                    )
+                parent = parent.parentNode
+
+    def _split_run_at(self, segments, offset):
+        """Split the run holding character offset so that a run starts there.
+
+        Args:
+            segments: ParagraphText.segments of the paragraph
+            offset: Character offset in the paragraph text
+        """
+        for start, end, run, child in segments:
+            if start <= offset < end:
+                break
+        else:
+            return  # End of the paragraph is already a run boundary
+
+        index = offset - start
+        moved = []
+        if index > 0:
+            # Split the w:t itself; only w:t children hold more than one character
+            value = _node_text(child)
+            _set_node_text(child, value[:index])
+            tail = self.dom.createElement("w:t")
+            _set_node_text(tail, value[index:])
+            for t_elem in (child, tail):
+                if _node_text(t_elem)[:1].isspace() or _node_text(t_elem)[-1:].isspace():
+                    t_elem.setAttribute("xml:space", "preserve")
+            moved.append(tail)
+        else:
+            previous = child.previousSibling
+            while previous is not None and (
+                previous.nodeType != previous.ELEMENT_NODE or previous.tagName == "w:rPr"
+            ):
+                previous = previous.previousSibling
+            if previous is None:
+                return  # Offset is already at the start of the run
+            moved.append(child)
+
+        sibling = child.nextSibling
+        while sibling is not None:
+            moved.append(sibling)
+            sibling = sibling.nextSibling
+
+        new_run = self.dom.createElement("w:r")
+        for i in range(run.attributes.length):
+            attr = run.attributes.item(i)
+            new_run.setAttribute(attr.name, attr.value)
+        rPr = _first_child_element(run, "w:rPr")
+        if rPr is not None:
+            new_run.appendChild(rPr.cloneNode(True))
+        for node in moved:
+            new_run.appendChild(node)
+        run.parentNode.insertBefore(new_run, run.nextSibling)
+
+    def _mark_run_deleted(self, run):
+        """Convert a run's text to deleted text (w:t → w:delText, w:rsidR → w:rsidDel)."""
+        for t_elem in list(run.getElementsByTagName("w:t")):
+            del_text = self.dom.createElement("w:delText")
+            while t_elem.firstChild:
+                del_text.appendChild(t_elem.firstChild)
+            for i in range(t_elem.attributes.length):
+                attr = t_elem.attributes.item(i)
+                del_text.setAttribute(attr.name, attr.value)
+            t_elem.parentNode.replaceChild(del_text, t_elem)
+        if run.hasAttribute("w:rsidR"):
+            run.setAttribute("w:rsidDel", run.getAttribute("w:rsidR"))
+            run.removeAttribute("w:rsidR")
+        elif not run.hasAttribute("w:rsidDel"):
+            run.setAttribute("w:rsidDel", self.rsid)
+
+    def _text_run(self, text, template):
+        """Build a w:r for text, copying run properties from template (or None)."""
+        run = self.dom.createElement("w:r")
+        rPr = _first_child_element(template, "w:rPr") if template else None
+        if rPr is not None:
+            run.appendChild(rPr.cloneNode(True))
+        for part in re.split(r"([\t\n])", text):
+            if part == "\t":
+                run.appendChild(self.dom.createElement("w:tab"))
+            elif part == "\n":
+                run.appendChild(self.dom.createElement("w:br"))
+            elif part:
+                t_elem = self.dom.createElement("w:t")
+                _set_node_text(t_elem, part)
+                run.appendChild(t_elem)
+        return run
+
+    def _suggest_text_change(self, para, start, end, new_text, change_ids):
+        """Replace text[start:end] of a paragraph with new_text as tracked changes.
+
+        Args:
+            para: w:p element
+            start: Start offset in the paragraph text
+            end: End offset (equal to start for a pure insertion)
+            new_text: Replacement text ("" for a pure deletion)
+            change_ids: Iterator yielding w:id values for new w:del/w:ins
+
+        Returns:
+            list: Created w:del elements followed by the w:ins (if any)
+        """
+        segments = ParagraphText(para).segments
+        # Split at end first: it never moves content before it, so the
+        # segments still describe the start boundary correctly
+        self._split_run_at(segments, end)
+        if start != end:
+            self._split_run_at(segments, start)
+        segments = ParagraphText(para).segments
+
+        deleted_runs = []
+        before = after = None
+        for seg_start, seg_end, run, _ in segments:
+            if seg_start >= start and seg_end <= end:
+                if not deleted_runs or deleted_runs[-1] is not run:
+                    deleted_runs.append(run)
+            elif seg_end <= start:
+                before = run
+            elif after is None:
+                after = run
+
+        # Consecutive sibling runs share one w:del
+        groups = []
+        for run in deleted_runs:
+            if groups and _adjacent_siblings(groups[-1][-1], run):
+                groups[-1].append(run)
+            else:
+                groups.append([run])
+
+        created = []
+        for group in groups:
+            del_wrapper = self.dom.createElement("w:del")
+            del_wrapper.setAttribute("w:id", str(next(change_ids)))
+            group[0].parentNode.insertBefore(del_wrapper, group[0])
+            for run in group:
+                self._mark_run_deleted(run)
+                del_wrapper.appendChild(run)
+            created.append(del_wrapper)
+
+        if new_text:
+            ins_wrapper = self.dom.createElement("w:ins")
+            ins_wrapper.setAttribute("w:id", str(next(change_ids)))
+            template = deleted_runs[0] if deleted_runs else before or after
+            ins_wrapper.appendChild(self._text_run(new_text, template))
+            if created:
+                anchor = created[-1]
+                anchor.parentNode.insertBefore(ins_wrapper, anchor.nextSibling)
+            elif after is not None:
+                after.parentNode.insertBefore(ins_wrapper, after)
+            elif before is not None:
+                before.parentNode.insertBefore(ins_wrapper, before.nextSibling)
+            else:
+                para.appendChild(ins_wrapper)
+            created.append(ins_wrapper)
+
+        self._inject_attributes_to_nodes(created)
+        return created
+
+
+@dataclass
+class TextMatch:
+    """A match of DocxXMLEditor.find_text / TextIndex.find.
+
+    Attributes:
+        para: The w:p element containing the match
+        start: Start offset in the paragraph's visible text
+        end: End offset in the paragraph's visible text
+        text: The matched text
+        spans: (run, child, start, end) for each piece of the match, where
+            child is the w:t (or w:tab/w:br/w:cr) holding it and start/end are
+            offsets within that child's text
+    """
+
+    para: Any
+    start: int
+    end: int
+    text: str
+    spans: List[Tuple[Any, Any, int, int]]
+
+    @property
+    def runs(self):
+        """The distinct w:r elements the match touches, in order."""
+        runs = []
+        for run, _, _, _ in self.spans:
+            if not runs or runs[-1] is not run:
+                runs.append(run)
+        return runs
+
+
+class ParagraphText:
+    """Visible text of one paragraph, concatenated across runs.
+
+    Text comes from w:t (plus w:tab, w:br and w:cr as "\t", "\n", "\n") in
+    runs directly in the paragraph or inside hyperlinks, insertions, smart tags
+    and content controls. Deleted text, field instructions and text boxes are
+    excluded. Each character offset maps back to the element holding it.
+
+    Attributes:
+        para: The w:p element
+        text: The concatenated text
+        segments: (start, end, run, child) for every text-bearing run child,
+            covering text[start:end]
+    """
+
+    def __init__(self, para):
+        self.para = para
+        parts = []
+        self.segments = []
+        offset = 0
+        for run in _visible_runs(para):
+            for child in run.childNodes:
+                if child.nodeType != child.ELEMENT_NODE:
+                    continue
+                if child.tagName == "w:t":
+                    value = _node_text(child)
+                else:
+                    value = _RUN_TEXT_CHARACTERS.get(child.tagName, "")
+                if value:
+                    parts.append(value)
+                    self.segments.append((offset, offset + len(value), run, child))
+                    offset += len(value)
+        self.text = "".join(parts)
+        self._starts = [segment[0] for segment in self.segments]
+
+    def locate(self, offset: int):
+        """Map a character offset to (run, child, offset within child).
+
+        Raises:
+            IndexError: If offset is outside the text
+        """
+        if not 0 <= offset < len(self.text):
+            raise IndexError(f"Offset {offset} outside paragraph text of length {len(self.text)}")
+        start, _, run, child = self.segments[bisect.bisect_right(self._starts, offset) - 1]
+        return run, child, offset - start
+
+    def spans(self, start: int, end: int):
+        """(run, child, start, end) pieces covering text[start:end]."""
+        spans = []
+        first = max(bisect.bisect_right(self._starts, start) - 1, 0)
+        for seg_start, seg_end, run, child in self.segments[first:]:
+            if seg_start >= end:
+                break
+            if seg_end > start:
+                spans.append(
+                    (run, child, max(start, seg_start) - seg_start, min(end, seg_end) - seg_start)
+                )
+        return spans
+
+    def runs(self, start: int, end: int):
+        """The distinct w:r elements holding text[start:end], in order."""
+        return TextMatch(self.para, start, end, "", self.spans(start, end)).runs
+
+    def match(self, start: int, end: int) -> TextMatch:
+        """TextMatch for text[start:end]."""
+        return TextMatch(self.para, start, end, self.text[start:end], self.spans(start, end))
+
+    def find(self, pattern: str, regex: bool = False) -> List[TextMatch]:
+        """All non-overlapping matches of a substring or regular expression."""
+        if regex:
+            return [
+                self.match(m.start(), m.end())
+                for m in re.finditer(pattern, self.text)
+                if m.end() > m.start()
+            ]
+        pattern = html.unescape(pattern)
+        if not pattern:
+            raise ValueError("Search text must not be empty")
+        matches = []
+        position = self.text.find(pattern)
+        while position != -1:
+            matches.append(self.match(position, position + len(pattern)))
+            position = self.text.find(pattern, position + len(pattern))
+        return matches
+
+
+class TextIndex:
+    """Text search over every paragraph of a part, across run boundaries.
+
+    ParagraphText for each paragraph is built lazily and cached, so repeated
+    searches cost one pass over the text. Build a new index after editing.
+
+    Example:
+        index = doc["word/document.xml"].text_index()
+        for match in index.find(r"\$\d+(,\d{3})*", regex=True):
+            print(match.text, [run.getAttribute("w:rsidR") for run in match.runs])
+    """
+
+    def __init__(self, editor):
+        self.editor = editor
+        self.paragraphs = editor.dom.getElementsByTagName("w:p")
+        self._texts = {}
+        self._by_para_id = None
+        self._by_line = None
+
+    def paragraph(self, para) -> ParagraphText:
+        """Cached ParagraphText of a w:p element."""
+        if para not in self._texts:
+            self._texts[para] = ParagraphText(para)
+        return self._texts[para]
+
+    def find(self, pattern: str, regex: bool = False) -> List[TextMatch]:
+        """All matches of a substring or regular expression, in document order.
+
+        Matches never cross paragraph boundaries.
+        """
+        if regex:
+            pattern = re.compile(pattern)
+        matches = []
+        for para in self.paragraphs:
+            matches.extend(self.paragraph(para).find(pattern, regex=regex))
+        return matches
+
+    def resolve(self, locator, old_text):
+        """Find the w:p element a paragraph locator refers to.
+
+        Args:
+            locator: w:p element, w14:paraId string, line number, dict of
+                get_node() filters, or None to search for old_text
+            old_text: Text the paragraph must contain (used when locator is None)
+
+        Raises:
+            ValueError: If no paragraph or more than one paragraph matches
+        """
+        if locator is None:
+            matches = [p for p in self.paragraphs if old_text in self.paragraph(p).text]
+            if len(matches) != 1:
+                raise ValueError(
+                    f"'{old_text}' found in {len(matches)} paragraphs; "
+                    f"pass a paragraph locator to disambiguate"
+                )
+            return matches[0]
+        if isinstance(locator, dict):
+            return self.editor.get_node(**{"tag": "w:p", **locator})
+        if isinstance(locator, str):
+            if self._by_para_id is None:
+                self._by_para_id = {
+                    p.getAttribute("w14:paraId"): p
+                    for p in self.paragraphs
+                    if p.hasAttribute("w14:paraId")
+                }
+            if locator not in self._by_para_id:
+                raise ValueError(f"No paragraph with w14:paraId '{locator}'")
+            return self._by_para_id[locator]
+        if isinstance(locator, int):
+            if self._by_line is None:
+                self._by_line = {}
+                for p in self.paragraphs:
+                    line = getattr(p, "parse_position", (None,))[0]
+                    self._by_line.setdefault(line, []).append(p)
+            matches = self._by_line.get(locator, [])
+            if len(matches) != 1:
+                raise ValueError(f"{len(matches)} paragraphs open at line {locator}")
+            return matches[0]
+        if getattr(locator, "nodeName", None) == "w:p":
+            return locator
+        raise ValueError(f"Unsupported paragraph locator: {locator!r}")
+
+
+# Run children that contribute characters to a paragraph's visible text (besides w:t)
+_RUN_TEXT_CHARACTERS = {"w:tab": "\t", "w:br": "\n", "w:cr": "\n"}
+
+# Containers whose runs are not part of a paragraph's visible text
+_DELETED_CONTAINERS = ("w:del", "w:moveFrom")
+
+# Tracked-change containers that character-range edits will not edit inside
+_TRACKED_CONTAINERS = ("w:ins", "w:del", "w:moveFrom", "w:moveTo")
+
+# Tracked changes resolved by DocxXMLEditor.resolve_tracked_changes
+_INSERTION_TAGS = ("w:ins", "w:moveTo")
+_DELETION_TAGS = ("w:del", "w:moveFrom")
+_REVISION_TAGS = _INSERTION_TAGS + _DELETION_TAGS
+_MOVE_RANGE_STARTS = ("w:moveFromRangeStart", "w:moveToRangeStart")
+_MOVE_RANGE_ENDS = ("w:moveFromRangeEnd", "w:moveToRangeEnd")
+_DELETED_TEXT_TAGS = {"w:delText": "w:t", "w:delInstrText": "w:instrText"}
+
+# Parts besides document.xml that can hold tracked changes
+_REVISION_PART_PATTERNS = (
+    "header*.xml",
+    "footer*.xml",
+    "footnotes.xml",
+    "endnotes.xml",
+    "comments.xml",
+)
+
+
+def _visible_runs(elem):
+    """Yield the runs whose text is visible in a paragraph, in document order.
+
+    Descends into hyperlinks, insertions, smart tags and content controls but
+    skips deleted content. Nested paragraphs (text boxes) sit inside runs, so
+    their text is never included.
+    """
+    for child in elem.childNodes:
+        if child.nodeType != child.ELEMENT_NODE:
+            continue
+        if child.tagName == "w:r":
+            yield child
+        elif child.tagName not in _DELETED_CONTAINERS + ("w:pPr",):
+            yield from _visible_runs(child)
+
+
+def _node_text(elem) -> str:
+    """Concatenated text node data directly under an element."""
+    return "".join(
+        node.data for node in elem.childNodes if node.nodeType == node.TEXT_NODE
+    )
+
+
+def _set_node_text(elem, text: str) -> None:
+    """Replace an element's children with a single text node."""
+    while elem.firstChild:
+        elem.removeChild(elem.firstChild)
+    elem.appendChild(elem.ownerDocument.createTextNode(text))
+
+
+def _first_child_element(elem, tag):
+    """First direct child element of elem with the given tag, or None."""
+    for child in elem.childNodes:
+        if child.nodeType == child.ELEMENT_NODE and child.tagName == tag:
+            return child
+    return None
+
+
+def _adjacent_siblings(first, second) -> bool:
+    """Check whether second follows first with only whitespace text between them."""
+    node = first.nextSibling
+    while node is not None and node is not second:
+        if node.nodeType != node.TEXT_NODE or node.data.strip():
+            return False
+        node = node.nextSibling
+    return node is second
+
+
+def _unchanged_affixes(old: str, new: str):
+    """Lengths of the word-aligned prefix and suffix shared by old and new.
+
+    Keeps tracked changes minimal: only the words that differ are marked.
+    """
+
+    def at_boundary(text, pos):
+        return (
+            pos in (0, len(text)) or text[pos - 1].isspace() or text[pos].isspace()
+        )
+
+    limit = min(len(old), len(new))
+    prefix = 0
+    while prefix < limit and old[prefix] == new[prefix]:
+        prefix += 1
+    while prefix and not (at_boundary(old, prefix) and at_boundary(new, prefix)):
+        prefix -= 1
+
+    limit -= prefix
+    suffix = 0
+    while suffix < limit and old[-1 - suffix] == new[-1 - suffix]:
+        suffix += 1
+    while suffix and not (
+        at_boundary(old, len(old) - suffix) and at_boundary(new, len(new) - suffix)
+    ):
+        suffix -= 1
+    return prefix, suffix
+
+
+def _remove_marker(elem):
+    """Remove a tracked-change marker and any property elements it leaves empty."""
+    parent = elem.parentNode
+    parent.removeChild(elem)
+    while parent.nodeName in ("w:rPr", "w:pPr", "w:trPr") and not any(
+        child.nodeType == child.ELEMENT_NODE for child in parent.childNodes
+    ):
+        grandparent = parent.parentNode
+        grandparent.removeChild(parent)
+        parent = grandparent
+
+
+def _parse_change_date(value):
+    """Parse a datetime or ISO 8601 string (as in w:date) into an aware UTC datetime.
+
+    Naive values are taken as UTC. Returns None for empty or invalid strings.
+    """
+    if isinstance(value, datetime):
+        date = value
+    else:
+        try:
+            date = datetime.fromisoformat(str(value).strip().replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return date
+
+
+def _change_filter(author=None, since=None, until=None, ids=None):
+    """Build a predicate selecting tracked-change elements by author, date and ID."""
+    authors = {author} if isinstance(author, str) else set(author) if author else None
+    id_set = {str(change_id) for change_id in ids} if ids is not None else None
+    since_date = _parse_change_date(since) if since is not None else None
+    until_date = _parse_change_date(until) if until is not None else None
+    if (since is not None and since_date is None) or (
+        until is not None and until_date is None
+    ):
+        raise ValueError(f"Invalid date filter: since={since!r}, until={until!r}")
+
+    def matches(elem):
+        if authors is not None and elem.getAttribute("w:author") not in authors:
+            return False
+        if id_set is not None and elem.getAttribute("w:id") not in id_set:
+            return False
+        if since_date or until_date:
+            date = _parse_change_date(elem.getAttribute("w:date"))
+            if date is None:
+                return False
+            if since_date and date < since_date:
+                return False
+            if until_date and date > until_date:
+                return False
+        return True
+
+    return matches
+
 
 def _generate_hex_id() -> str:
     """Generate random 8-character hex ID for para/durable IDs.
@@ -604,6 +1417,19 @@ def _generate_hex_id() -> str:
     return f"{random.randint(1, 0x7FFFFFFE):08X}"
 
 
+def _copy_atomic(source, target):
+    """Copy a file via a temporary file next to target and a rename."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        shutil.copy2(source, temp_path)
+        os.replace(temp_path, target)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
 def _generate_rsid() -> str:
     """Generate random 8-character hex RSID."""
     return "".join(random.choices("0123456789ABCDEF", k=8))
@@ -619,6 +1445,7 @@ class Document:
         track_revisions=False,
         author="Claude",
         initials="C",
+        original_docx=None,
     ):
         """
         Initialize with path to unpacked Word document directory.
@@ -630,6 +1457,8 @@ class Document:
             track_revisions: If True, enables track revisions in settings.xml (default: False)
             author: Default author name for comments (default: "Claude")
             initials: Default author initials for comments (default: "C")
+            original_docx: Optional path to the .docx that unpacked_dir was unpacked from,
+                used as the validation baseline instead of re-packing unpacked_dir
         """
         self.original_path = Path(unpacked_dir)
 
@@ -641,9 +1470,15 @@ class Document:
         self.unpacked_path = Path(self.temp_dir) / "unpacked"
         shutil.copytree(self.original_path, self.unpacked_path)
 
+        # File signatures last copied to each save destination (the source already matches)
+        self._synced = {self.original_path.resolve(): self._file_signatures()}
+
         # Pack original directory into temporary .docx for validation baseline (outside unpacked dir)
-        self.original_docx = Path(self.temp_dir) / "original.docx"
-        pack_document(self.original_path, self.original_docx, validate=False)
+        if original_docx:
+            self.original_docx = Path(original_docx)
+        else:
+            self.original_docx = Path(self.temp_dir) / "original.docx"
+            pack_document(self.original_path, self.original_docx, validate=False)
 
         self.word_path = self.unpacked_path / "word"
 
@@ -727,40 +1562,56 @@ class Document:
             end_node = cm.get_document_node(tag="w:ins", id="2")
             cm.add_comment(start=start_node, end=end_node, text="Explanation")
         """
-        comment_id = self.next_comment_id
-        para_id = _generate_hex_id()
-        durable_id = _generate_hex_id()
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-
-        # Add comment ranges to document.xml immediately
-        self._document.insert_before(start, self._comment_range_start_xml(comment_id))
+        return self.add_comments([(start, end, text)])[0]
 
-        # If end node is a paragraph, append comment markup inside it
-        # Otherwise insert after it (for run-level anchors)
-        if end.tagName == "w:p":
-            self._document.append_to(end, self._comment_range_end_xml(comment_id))
-        else:
-            self._document.insert_after(end, self._comment_range_end_xml(comment_id))
-
-        # Add to comments.xml immediately
-        self._add_to_comments_xml(
-            comment_id, para_id, text, self.author, self.initials, timestamp
-        )
-
-        # Add to commentsExtended.xml immediately
-        self._add_to_comments_extended_xml(para_id, parent_para_id=None)
+    def add_comments(self, comments) -> list:
+        """
+        Add many comments in one pass.
 
-        # Add to commentsIds.xml immediately
-        self._add_to_comments_ids_xml(para_id, durable_id)
+        Comment ranges are inserted into document.xml directly, and the entries
+        for all comments are appended to each comment part (comments.xml,
+        commentsExtended.xml, commentsIds.xml, commentsExtensible.xml) with a
+        single fragment per part, so the cost grows linearly with the batch.
 
-        # Add to commentsExtensible.xml immediately
-        self._add_to_comments_extensible_xml(durable_id)
+        Args:
+            comments: Iterable of (start, end, text) triples, or dicts with
+                "start", "end" and "text" keys (same meaning as add_comment)
 
-        # Update existing_comments so replies work
-        self.existing_comments[comment_id] = {"para_id": para_id}
+        Returns:
+            List of created comment IDs, in input order
 
-        self.next_comment_id += 1
-        return comment_id
+        Example:
+            ids = doc.add_comments([
+                (para, para, "Check the defined term"),
+                {"start": nodes[0], "end": nodes[-1], "text": "Per policy"},
+            ])
+        """
+        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        entries = []
+        for comment in comments:
+            if isinstance(comment, dict):
+                start, end, text = comment["start"], comment["end"], comment["text"]
+            else:
+                start, end, text = comment
+
+            comment_id = self.next_comment_id
+            self.next_comment_id += 1
+            self._insert_comment_range(comment_id, start, end)
+            entry = {
+                "comment_id": comment_id,
+                "para_id": _generate_hex_id(),
+                "durable_id": _generate_hex_id(),
+                "parent_para_id": None,
+                "text": text,
+            }
+            entries.append(entry)
+
+            # Update existing_comments so replies work
+            self.existing_comments[comment_id] = {"para_id": entry["para_id"]}
+
+        if entries:
+            self._add_comment_entries(entries, timestamp)
+        return [entry["comment_id"] for entry in entries]
 
     def reply_to_comment(
         self,
@@ -808,28 +1659,110 @@ class Document:
             parent_ref_run, self._comment_ref_run_xml(comment_id)
         )
 
-        # Add to comments.xml immediately
-        self._add_to_comments_xml(
-            comment_id, para_id, text, self.author, self.initials, timestamp
+        # Add to all comment parts immediately (with parent)
+        self._add_comment_entries(
+            [
+                {
+                    "comment_id": comment_id,
+                    "para_id": para_id,
+                    "durable_id": durable_id,
+                    "parent_para_id": parent_info["para_id"],
+                    "text": text,
+                }
+            ],
+            timestamp,
         )
 
-        # Add to commentsExtended.xml immediately (with parent)
-        self._add_to_comments_extended_xml(
-            para_id, parent_para_id=parent_info["para_id"]
-        )
-
-        # Add to commentsIds.xml immediately
-        self._add_to_comments_ids_xml(para_id, durable_id)
-
-        # Add to commentsExtensible.xml immediately
-        self._add_to_comments_extensible_xml(durable_id)
-
         # Update existing_comments so replies work
         self.existing_comments[comment_id] = {"para_id": para_id}
 
         self.next_comment_id += 1
         return comment_id
 
+    def apply_edits(self, edits, xml_path="word/document.xml", validate=False):
+        """
+        Apply a list of text edits as tracked changes in one pass.
+
+        See DocxXMLEditor.apply_edits for the edit format. The paragraph index
+        is built once for the whole batch, so thousands of edits cost about as
+        much as one document traversal each for lookup and markup.
+
+        Args:
+            edits: Iterable of (paragraph, old_text, new_text) triples
+            xml_path: Part to edit (default: "word/document.xml")
+            validate: If True, validate once after all edits are applied
+                (save() validates by default anyway)
+
+        Returns:
+            list: For each edit, the list of created w:del/w:ins elements
+
+        Example:
+            nodes = doc.apply_edits([
+                (None, "within 30 days", "within 45 days"),
+                ({"line_number": 120}, "Seller", "Vendor"),
+            ])
+            doc.add_comment(start=nodes[0][0], end=nodes[0][-1], text="Per policy")
+        """
+        results = self[xml_path].apply_edits(edits)
+        if validate:
+            for editor in self._editors.values():
+                editor.save()
+            self.validate()
+        return results
+
+    def accept_changes(self, author=None, since=None, until=None, ids=None) -> dict:
+        """
+        Accept all tracked changes matching a filter across the document.
+
+        Covers document.xml, headers, footers, footnotes, endnotes and comments,
+        resolving w:ins, w:del, w:moveFrom and w:moveTo (including paragraph
+        marks and table rows) in one pass per part. Filters combine with AND;
+        with no filters every tracked change is accepted.
+
+        Accepting is not itself a tracked change, so run it before adding your
+        own tracked changes (the redlining check compares text with the original).
+
+        Args:
+            author: Author name or collection of names (w:author)
+            since: Only changes dated at or after this (datetime or ISO string)
+            until: Only changes dated at or before this (datetime or ISO string)
+            ids: Collection of change IDs (w:id)
+
+        Returns:
+            dict: Number of changes accepted per part (parts with none omitted)
+
+        Example:
+            doc.accept_changes(author="Jane Smith")
+            doc.accept_changes(since="2024-01-01", until="2024-03-31T23:59:59Z")
+        """
+        return self._resolve_changes(True, author, since, until, ids)
+
+    def reject_changes(self, author=None, since=None, until=None, ids=None) -> dict:
+        """
+        Reject all tracked changes matching a filter across the document.
+
+        Same parts, filters and caveats as accept_changes().
+
+        Example:
+            doc.reject_changes(author={"Reviewer A", "Reviewer B"})
+            doc.reject_changes(ids=[12, 13, 27])
+        """
+        return self._resolve_changes(False, author, since, until, ids)
+
+    def _resolve_changes(self, accept, author, since, until, ids):
+        """Accept or reject matching tracked changes in every part that can hold them."""
+        matches = _change_filter(author, since, until, ids)
+        parts = ["word/document.xml"]
+        for pattern in _REVISION_PART_PATTERNS:
+            parts.extend(f"word/{path.name}" for path in sorted(self.word_path.glob(pattern)))
+
+        counts = {}
+        for part in parts:
+            count = self[part].resolve_tracked_changes(accept, matches)
+            if count:
+                counts[part] = count
+        return counts
+
     def __del__(self):
         """Clean up temporary directory on deletion."""
         if hasattr(self, "temp_dir") and Path(self.temp_dir).exists():
@@ -861,6 +1794,9 @@ class Document:
         Save all modified XML files to disk and copy to destination directory.
 
         This persists all changes made via add_comment() and reply_to_comment().
+        Only dirty editors are serialized, and only files that changed since the
+        last save to the same destination are copied; each file is written to a
+        temporary name and renamed into place. A new destination receives every file.
 
         Args:
             destination: Optional path to save to. If None, saves back to original directory.
@@ -872,16 +1808,35 @@ class Document:
             self._ensure_comment_content_types()
 
         # Save all modified XML files in temp directory
-        for editor in self._editors.values():
-            editor.save()
+        written = {
+            xml_path for xml_path, editor in self._editors.items() if editor.save()
+        }
 
         # Validate by default
         if validate:
             self.validate()
 
-        # Copy contents from temp directory to destination (or original directory)
+        # Copy changed files from temp directory to destination (or original directory)
         target_path = Path(destination) if destination else self.original_path
-        shutil.copytree(self.unpacked_path, target_path, dirs_exist_ok=True)
+        target_key = target_path.resolve()
+        signatures = self._file_signatures()
+        synced = self._synced.get(target_key, {}) if target_path.exists() else {}
+        for rel_path, signature in signatures.items():
+            if rel_path in written or synced.get(rel_path) != signature:
+                _copy_atomic(self.unpacked_path / rel_path, target_path / rel_path)
+        self._synced[target_key] = signatures
+
+    def _file_signatures(self):
+        """Map each file in the unpacked tree (POSIX relative path) to its (size, mtime)."""
+        signatures = {}
+        for path in self.unpacked_path.rglob("*"):
+            if path.is_file():
+                stat = path.stat()
+                signatures[path.relative_to(self.unpacked_path).as_posix()] = (
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                )
+        return signatures
 
     # ==================== Private: Initialization ====================
 
@@ -1065,31 +2020,47 @@ class Document:
 
     # ==================== Private: XML File Creation ====================
 
-    def _add_to_comments_xml(
-        self, comment_id, para_id, text, author, initials, timestamp
-    ):
-        """Add a single comment to comments.xml."""
+    def _add_comment_entries(self, entries, timestamp):
+        """Append comment entries to every comment part, one fragment per part.
+
+        Args:
+            entries: List of dicts with comment_id, para_id, durable_id,
+                parent_para_id (None for top-level comments) and text
+            timestamp: UTC timestamp for the comments
+        """
+        self._add_to_comments_xml(entries, timestamp)
+        self._add_to_comments_extended_xml(entries)
+        self._add_to_comments_ids_xml(entries)
+        self._add_to_comments_extensible_xml(entries)
+
+    def _add_to_comments_xml(self, entries, timestamp):
+        """Add comments to comments.xml."""
         if not self.comments_path.exists():
             shutil.copy(TEMPLATE_DIR / "comments.xml", self.comments_path)
 
         editor = self["word/comments.xml"]
         root = editor.get_node(tag="w:comments")
 
-        escaped_text = (
-            text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-        )
-        # Note: w:rsidR, w:rsidRDefault, w:rsidP on w:p, w:rsidR on w:r,
-        # and w:author, w:date, w:initials on w:comment are automatically added by DocxXMLEditor
-        comment_xml = f'''<w:comment w:id="{comment_id}">
-  <w:p w14:paraId="{para_id}" w14:textId="77777777">
+        fragments = []
+        for entry in entries:
+            escaped_text = (
+                entry["text"]
+                .replace("&", "&amp;")
+                .replace("<", "&lt;")
+                .replace(">", "&gt;")
+            )
+            # Note: w:rsidR, w:rsidRDefault, w:rsidP on w:p, w:rsidR on w:r,
+            # and w:author, w:initials on w:comment are automatically added by DocxXMLEditor
+            fragments.append(f'''<w:comment w:id="{entry["comment_id"]}" w:date="{timestamp}">
+  <w:p w14:paraId="{entry["para_id"]}" w14:textId="77777777">
     <w:r><w:rPr><w:rStyle w:val="CommentReference"/></w:rPr><w:annotationRef/></w:r>
     <w:r><w:rPr><w:color w:val="000000"/><w:sz w:val="20"/><w:szCs w:val="20"/></w:rPr><w:t>{escaped_text}</w:t></w:r>
   </w:p>
-</w:comment>'''
-        editor.append_to(root, comment_xml)
+</w:comment>''')
+        editor.append_to(root, "".join(fragments))
 
-    def _add_to_comments_extended_xml(self, para_id, parent_para_id):
-        """Add a single comment to commentsExtended.xml."""
+    def _add_to_comments_extended_xml(self, entries):
+        """Add comments to commentsExtended.xml."""
         if not self.comments_extended_path.exists():
             shutil.copy(
                 TEMPLATE_DIR / "commentsExtended.xml", self.comments_extended_path
@@ -1098,25 +2069,38 @@ class Document:
         editor = self["word/commentsExtended.xml"]
         root = editor.get_node(tag="w15:commentsEx")
 
-        if parent_para_id:
-            xml = f'<w15:commentEx w15:paraId="{para_id}" w15:paraIdParent="{parent_para_id}" w15:done="0"/>'
-        else:
-            xml = f'<w15:commentEx w15:paraId="{para_id}" w15:done="0"/>'
-        editor.append_to(root, xml)
+        fragments = []
+        for entry in entries:
+            if entry["parent_para_id"]:
+                fragments.append(
+                    f'<w15:commentEx w15:paraId="{entry["para_id"]}" '
+                    f'w15:paraIdParent="{entry["parent_para_id"]}" w15:done="0"/>'
+                )
+            else:
+                fragments.append(
+                    f'<w15:commentEx w15:paraId="{entry["para_id"]}" w15:done="0"/>'
+                )
+        editor.append_to(root, "".join(fragments))
 
-    def _add_to_comments_ids_xml(self, para_id, durable_id):
-        """Add a single comment to commentsIds.xml."""
+    def _add_to_comments_ids_xml(self, entries):
+        """Add comments to commentsIds.xml."""
         if not self.comments_ids_path.exists():
             shutil.copy(TEMPLATE_DIR / "commentsIds.xml", self.comments_ids_path)
 
         editor = self["word/commentsIds.xml"]
         root = editor.get_node(tag="w16cid:commentsIds")
 
-        xml = f'<w16cid:commentId w16cid:paraId="{para_id}" w16cid:durableId="{durable_id}"/>'
-        editor.append_to(root, xml)
+        editor.append_to(
+            root,
+            "".join(
+                f'<w16cid:commentId w16cid:paraId="{entry["para_id"]}" '
+                f'w16cid:durableId="{entry["durable_id"]}"/>'
+                for entry in entries
+            ),
+        )
 
-    def _add_to_comments_extensible_xml(self, durable_id):
-        """Add a single comment to commentsExtensible.xml."""
+    def _add_to_comments_extensible_xml(self, entries):
+        """Add comments to commentsExtensible.xml."""
         if not self.comments_extensible_path.exists():
             shutil.copy(
                 TEMPLATE_DIR / "commentsExtensible.xml", self.comments_extensible_path
@@ -1125,8 +2109,52 @@ class Document:
         editor = self["word/commentsExtensible.xml"]
         root = editor.get_node(tag="w16cex:commentsExtensible")
 
-        xml = f'<w16cex:commentExtensible w16cex:durableId="{durable_id}"/>'
-        editor.append_to(root, xml)
+        editor.append_to(
+            root,
+            "".join(
+                f'<w16cex:commentExtensible w16cex:durableId="{entry["durable_id"]}"/>'
+                for entry in entries
+            ),
+        )
+
+    def _insert_comment_range(self, comment_id, start, end):
+        """Insert comment range markers and the reference run into document.xml.
+
+        Builds the elements directly instead of parsing XML fragments, since
+        this runs once per comment.
+
+        Args:
+            comment_id: The comment's w:id
+            start: Element the range starts before
+            end: Element the range ends after (or inside, for a w:p)
+        """
+        dom = self._document.dom
+        range_start = dom.createElement("w:commentRangeStart")
+        range_start.setAttribute("w:id", str(comment_id))
+        start.parentNode.insertBefore(range_start, start)
+
+        range_end = dom.createElement("w:commentRangeEnd")
+        range_end.setAttribute("w:id", str(comment_id))
+        ref_run = dom.createElement("w:r")
+        ref_run.setAttribute("w:rsidR", self.rsid)
+        rPr = dom.createElement("w:rPr")
+        style = dom.createElement("w:rStyle")
+        style.setAttribute("w:val", "CommentReference")
+        rPr.appendChild(style)
+        ref_run.appendChild(rPr)
+        reference = dom.createElement("w:commentReference")
+        reference.setAttribute("w:id", str(comment_id))
+        ref_run.appendChild(reference)
+
+        # If end node is a paragraph, append comment markup inside it
+        # Otherwise insert after it (for run-level anchors)
+        if end.tagName == "w:p":
+            end.appendChild(range_end)
+            end.appendChild(ref_run)
+        else:
+            parent = end.parentNode
+            parent.insertBefore(range_end, end.nextSibling)
+            parent.insertBefore(ref_run, range_end.nextSibling)
 
     # ==================== Private: XML Fragments ====================
 
@@ -1134,17 +2162,6 @@ class Document:
         """Generate XML for comment range start."""
         return f'<w:commentRangeStart w:id="{comment_id}"/>'
 
-    def _comment_range_end_xml(self, comment_id):
-        """Generate XML for comment range end with reference run.
-
-        Note: w:rsidR is automatically added by DocxXMLEditor.
-        """
-        return f'''<w:commentRangeEnd w:id="{comment_id}"/>
-<w:r>
-  <w:rPr><w:rStyle w:val="CommentReference"/></w:rPr>
-  <w:commentReference w:id="{comment_id}"/>
-</w:r>'''
-
     def _comment_ref_run_xml(self, comment_id):
         """Generate XML for comment reference run.
 
@@ -22,6 +22,9 @@ Example usage:
     # Combine filters
     elem = editor.get_node(tag="w:p", line_number=range(1, 50), contains="text")
 
+    # After edits, address nodes by their line in the saved file instead
+    elem = editor.get_node(tag="w:p", line_number=530, current_lines=True)
+
     # Replace, insert, or manipulate
     new_elem = editor.replace_node(elem, "<w:r><w:t>new text</w:t></w:r>")
     editor.insert_after(new_elem, "<w:r><w:t>more</w:t></w:r>")
@@ -30,12 +33,33 @@ Example usage:
     editor.save()
 """
 
+import contextlib
+import filecmp
+import gc
 import html
+import io
+import os
+import re
+import tempfile
+import xml.dom
 from pathlib import Path
 from typing import Optional, Union
 
 import defusedxml.minidom
 import defusedxml.sax
+from ooxml.scripts.pack import write_condensed
+
+
+# Prefix of an element or attribute name in an XML fragment ("w" in <w:r>, w:val=)
+_NAME_PREFIX_PATTERN = re.compile(r"[<\s]/?([A-Za-z_][\w.-]*):[A-Za-z_]")
+
+# Nodes whose data the serializer writes verbatim (newlines included)
+_DATA_NODE_TYPES = (
+    xml.dom.Node.TEXT_NODE,
+    xml.dom.Node.CDATA_SECTION_NODE,
+    xml.dom.Node.COMMENT_NODE,
+    xml.dom.Node.PROCESSING_INSTRUCTION_NODE,
+)
 
 
 class XMLEditor:
@@ -50,6 +74,11 @@ class XMLEditor:
         xml_path: Path to the XML file being edited
         encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
         dom: Parsed DOM tree with parse_position attributes on elements
+        dirty: True if the DOM may differ from the file on disk. Set whenever the
+            DOM or its nodes are handed out (dom, get_node) or modified through
+            the editor, and cleared by save(). Once nodes have been handed out,
+            save() keeps serializing the DOM (callers may still modify nodes
+            they hold) but leaves the file untouched if its content is unchanged
     """
 
     def __init__(self, xml_path):
@@ -71,7 +100,25 @@ class XMLEditor:
         self.encoding = "ascii" if 'encoding="ascii"' in header else "utf-8"
 
         parser = _create_line_tracking_parser()
-        self.dom = defusedxml.minidom.parse(str(self.xml_path), parser)
+        self._dom = defusedxml.minidom.parse(str(self.xml_path), parser)
+        self.dirty = False
+        self._handed_out = False
+
+        # (root attribute count, {prefix: declaration}) cache for fragment parsing
+        self._namespaces = None
+
+    @property
+    def dom(self):
+        """The parsed DOM. Accessing it marks the editor dirty, since callers may modify it."""
+        self.dirty = True
+        self._handed_out = True
+        return self._dom
+
+    @dom.setter
+    def dom(self, value):
+        self.dirty = True
+        self._handed_out = True
+        self._dom = value
 
     def get_node(
         self,
@@ -79,6 +126,7 @@ class XMLEditor:
         attrs: Optional[dict[str, str]] = None,
         line_number: Optional[Union[int, range]] = None,
         contains: Optional[str] = None,
+        current_lines: bool = False,
     ):
         """
         Get a DOM element by tag and identifier.
@@ -86,12 +134,18 @@ class XMLEditor:
         Finds an element by either its line number in the original file or by
         matching attribute values. Exactly one match must be found.
 
+        Line numbers refer to the file as it was parsed. After modifications,
+        pass current_lines=True to use line numbers from the file as save()
+        writes it (what a fresh Read of the saved file shows), without reloading.
+
         Args:
             tag: The XML tag name (e.g., "w:del", "w:ins", "w:r")
             attrs: Dictionary of attribute name-value pairs to match (e.g., {"w:id": "1"})
             line_number: Line number (int) or line range (range) in original XML file (1-indexed)
             contains: Text string that must appear in any text node within the element.
                       Supports both entity notation (&#8220;) and Unicode characters (\u201c).
+            current_lines: Match line_number against current (saved) line positions
+                      instead of original ones (default: False)
 
         Returns:
             defusedxml.minidom.Element: The matching DOM element
@@ -108,13 +162,17 @@ class XMLEditor:
             elem = editor.get_node(tag="w:p", contains="specific text")
             elem = editor.get_node(tag="w:t", contains="&#8220;Agreement")  # Entity notation
             elem = editor.get_node(tag="w:t", contains="\u201cAgreement")   # Unicode character
+            elem = editor.get_node(tag="w:p", line_number=530, current_lines=True)
         """
+        current = self._current_line_numbers() if current_lines else None
         matches = []
         for elem in self.dom.getElementsByTagName(tag):
             # Check line_number filter
             if line_number is not None:
-                parse_pos = getattr(elem, "parse_position", (None,))
-                elem_line = parse_pos[0]
+                if current is not None:
+                    elem_line = current.get(elem)
+                else:
+                    elem_line = getattr(elem, "parse_position", (None,))[0]
 
                 # Handle both single line number and range
                 if isinstance(line_number, range):
@@ -164,9 +222,17 @@ class XMLEditor:
 
             # Add helpful hint based on filters used
             if contains:
-                hint = "Text may be split across elements or use different wording."
+                hint = (
+                    "Text may be split across elements (find_text() on a Document "
+                    "editor searches across runs) or use different wording."
+                )
+            elif line_number and not current_lines:
+                hint = (
+                    "Line numbers may have changed if document was modified "
+                    "(use current_lines=True for line numbers in the saved file)."
+                )
             elif line_number:
-                hint = "Line numbers may have changed if document was modified."
+                hint = "Current line numbers reflect the document as save() would write it."
             elif attrs:
                 hint = "Verify attribute values are correct."
             else:
@@ -180,6 +246,53 @@ class XMLEditor:
             )
         return matches[0]
 
+    def get_line_number(self, elem, current: bool = True):
+        """
+        Get the line an element starts on.
+
+        Args:
+            elem: defusedxml.minidom.Element in this editor's DOM
+            current: If True (default), the line in the file as save() writes it;
+                if False, the line in the file as originally parsed
+
+        Returns:
+            int: Line number (1-indexed), or None for an element inserted after
+                parsing (current=False) or one no longer in the document (current=True)
+
+        Example:
+            new_nodes = editor.insert_after(elem, "<w:p>...</w:p>")
+            line = editor.get_line_number(new_nodes[0])
+        """
+        if not current:
+            return getattr(elem, "parse_position", (None,))[0]
+        return self._current_line_numbers().get(elem)
+
+    def _current_line_numbers(self):
+        """
+        Map each element to the line it starts on in the file as save() writes it.
+
+        Counts the newlines the serializer will emit before each start tag, which
+        come only from text, attribute, comment and processing-instruction data,
+        so no serialization or re-parse is needed and edits made directly on the
+        DOM are accounted for.
+
+        Returns:
+            dict: Element -> line number (1-indexed)
+        """
+        lines = {}
+        line = 2  # save() writes the XML declaration on its own line
+        stack = list(reversed(self._dom.childNodes))
+        while stack:
+            node = stack.pop()
+            if node.nodeType == node.ELEMENT_NODE:
+                lines[node] = line
+                for attr in node.attributes.values():
+                    line += attr.value.count("\n")
+                stack.extend(reversed(node.childNodes))
+            elif node.nodeType in _DATA_NODE_TYPES:
+                line += node.data.count("\n")
+        return lines
+
     def _get_element_text(self, elem):
         """
         Recursively extract all text content from an element.
@@ -209,7 +322,8 @@ class XMLEditor:
 
         Args:
             elem: defusedxml.minidom.Element to replace
-            new_content: String containing XML to replace the node with
+            new_content: String containing XML to replace the node with, or prebuilt nodes (a node, or a list of
+                strings, nodes and parse_fragments() results)
 
         Returns:
             List[defusedxml.minidom.Node]: All inserted nodes
@@ -222,6 +336,7 @@ class XMLEditor:
         for node in nodes:
             parent.insertBefore(node, elem)
         parent.removeChild(elem)
+        self.dirty = True
         return nodes
 
     def insert_after(self, elem, xml_content):
@@ -230,7 +345,8 @@ class XMLEditor:
 
         Args:
             elem: defusedxml.minidom.Element to insert after
-            xml_content: String containing XML to insert
+            xml_content: String containing XML to insert, or prebuilt nodes (a node, or a list of
+                strings, nodes and parse_fragments() results)
 
         Returns:
             List[defusedxml.minidom.Node]: All inserted nodes
@@ -246,6 +362,7 @@ class XMLEditor:
                 parent.insertBefore(node, next_sibling)
             else:
                 parent.appendChild(node)
+        self.dirty = True
         return nodes
 
     def insert_before(self, elem, xml_content):
@@ -254,7 +371,8 @@ class XMLEditor:
 
         Args:
             elem: defusedxml.minidom.Element to insert before
-            xml_content: String containing XML to insert
+            xml_content: String containing XML to insert, or prebuilt nodes (a node, or a list of
+                strings, nodes and parse_fragments() results)
 
         Returns:
             List[defusedxml.minidom.Node]: All inserted nodes
@@ -266,6 +384,7 @@ class XMLEditor:
         nodes = self._parse_fragment(xml_content)
         for node in nodes:
             parent.insertBefore(node, elem)
+        self.dirty = True
         return nodes
 
     def append_to(self, elem, xml_content):
@@ -274,7 +393,8 @@ class XMLEditor:
 
         Args:
             elem: defusedxml.minidom.Element to append to
-            xml_content: String containing XML to append
+            xml_content: String containing XML to append, or prebuilt nodes (a node, or a list of
+                strings, nodes and parse_fragments() results)
 
         Returns:
             List[defusedxml.minidom.Node]: All inserted nodes
@@ -285,12 +405,13 @@ class XMLEditor:
         nodes = self._parse_fragment(xml_content)
         for node in nodes:
             elem.appendChild(node)
+        self.dirty = True
         return nodes
 
     def get_next_rid(self):
         """Get the next available rId for relationships files."""
         max_id = 0
-        for rel_elem in self.dom.getElementsByTagName("Relationship"):
+        for rel_elem in self._dom.getElementsByTagName("Relationship"):
             rel_id = rel_elem.getAttribute("Id")
             if rel_id.startswith("rId"):
                 try:
@@ -299,22 +420,111 @@ class XMLEditor:
                     pass
         return f"rId{max_id + 1}"
 
-    def save(self):
+    def save(self, force=False, condensed=False):
         """
         Save the edited XML back to the file.
 
         Serializes the DOM tree and writes it back to the original file path,
-        preserving the original encoding (ascii or utf-8).
+        preserving the original encoding (ascii or utf-8). The DOM is streamed to
+        a temporary file in chunks, without building the whole document in
+        memory, and the file is renamed into place, so readers never see a
+        partial file. Editors that are not dirty are skipped, unless nodes were
+        handed out earlier: those may have been modified directly since the last
+        save, so the DOM is serialized and the file is replaced only if the
+        content differs.
+
+        Args:
+            force: Write even if the editor is not dirty (default: False)
+            condensed: Write the packed form directly: UTF-8, without comments or
+                whitespace-only text between elements (what pack_document
+                produces; pass the path in pack_document's `condensed` to have
+                it zipped as-is). Line numbers in the saved file then no longer
+                match (default: False)
+
+        Returns:
+            bool: True if the file was written
         """
-        content = self.dom.toxml(encoding=self.encoding)
-        self.xml_path.write_bytes(content)
+        if not (self.dirty or self._handed_out or force):
+            return False
+        encoding = "UTF-8" if condensed else self.encoding
+        keep_unchanged = not (self.dirty or force)
+        with _atomic_writer(self.xml_path, keep_unchanged) as result:
+            f = result["file"]
+            writer = io.TextIOWrapper(
+                f, encoding=encoding, errors="xmlcharrefreplace", newline="\n"
+            )
+            if condensed:
+                write_condensed(writer, self._dom)
+            else:
+                # Keep the root element on line 2, as in the unpacked file, so
+                # lines of unmodified content stay where they were
+                writer.write(f'<?xml version="1.0" encoding="{encoding}"?>\n')
+                for node in self._dom.childNodes:
+                    node.writexml(writer)
+            writer.flush()
+            writer.detach()
+        self.dirty = False
+        return result["replaced"]
+
+    def parse_fragments(self, fragments):
+        """
+        Parse many XML fragments with a single parser call.
+
+        Use this to build content for many inserts up front; each returned list
+        can be passed to insert_after(), insert_before(), append_to() or
+        replace_node() in place of an XML string.
+
+        Args:
+            fragments: Iterable of strings, each containing an XML fragment
+
+        Returns:
+            List[List[defusedxml.minidom.Node]]: Nodes of each fragment, imported
+                into this document but not yet inserted, in input order
+
+        Raises:
+            AssertionError: If a fragment contains no element nodes
+
+        Example:
+            groups = editor.parse_fragments(f"<w:r><w:t>{t}</w:t></w:r>" for t in texts)
+            for para, nodes in zip(paras, groups):
+                editor.append_to(para, nodes)
+        """
+        fragments = list(fragments)
+        if not fragments:
+            return []
+        body = "".join(f"<fragment>{fragment}</fragment>" for fragment in fragments)
+        wrapper = f"<root {self._namespace_prelude(body)}>{body}</root>"
+
+        # Creating many nodes at once would otherwise trigger full garbage
+        # collections, each traversing every node of the (large) document DOM
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            fragment_doc = defusedxml.minidom.parseString(wrapper)
+            groups = [
+                [self._dom.importNode(child, deep=True) for child in container.childNodes]
+                for container in fragment_doc.documentElement.childNodes  # type: ignore
+            ]
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+        for nodes in groups:
+            assert any(
+                n.nodeType == n.ELEMENT_NODE for n in nodes
+            ), "Fragment must contain at least one element"
+        return groups
 
     def _parse_fragment(self, xml_content):
         """
         Parse XML fragment and return list of imported nodes.
 
         Args:
-            xml_content: String containing XML fragment
+            xml_content: String containing XML fragment, a prebuilt node, or a
+                list mixing strings, nodes and node lists (e.g. from
+                parse_fragments()). Strings in a list are parsed together;
+                nodes from another document are imported, nodes of this
+                document are used as-is
 
         Returns:
             List of defusedxml.minidom.Node objects imported into this document
@@ -322,26 +532,90 @@ class XMLEditor:
         Raises:
             AssertionError: If fragment contains no element nodes
         """
-        # Extract namespace declarations from the root document element
-        root_elem = self.dom.documentElement
-        namespaces = []
-        if root_elem and root_elem.attributes:
-            for i in range(root_elem.attributes.length):
-                attr = root_elem.attributes.item(i)
-                if attr.name.startswith("xmlns"):  # type: ignore
-                    namespaces.append(f'{attr.name}="{attr.value}"')  # type: ignore
-
-        ns_decl = " ".join(namespaces)
-        wrapper = f"<root {ns_decl}>{xml_content}</root>"
-        fragment_doc = defusedxml.minidom.parseString(wrapper)
-        nodes = [
-            self.dom.importNode(child, deep=True)
-            for child in fragment_doc.documentElement.childNodes  # type: ignore
-        ]
-        elements = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
-        assert elements, "Fragment must contain at least one element"
+        if isinstance(xml_content, str):
+            return self.parse_fragments([xml_content])[0]
+
+        items = [xml_content] if isinstance(xml_content, xml.dom.Node) else list(xml_content)
+        parsed = iter(self.parse_fragments(item for item in items if isinstance(item, str)))
+        nodes = []
+        for item in items:
+            if isinstance(item, str):
+                nodes.extend(next(parsed))
+            elif isinstance(item, xml.dom.Node):
+                nodes.append(self._adopt_node(item))
+            else:
+                nodes.extend(self._adopt_node(node) for node in item)
+        assert any(
+            n.nodeType == n.ELEMENT_NODE for n in nodes
+        ), "Fragment must contain at least one element"
         return nodes
 
+    def _adopt_node(self, node):
+        """Return node if it belongs to this document, else a deep imported copy."""
+        if node.ownerDocument is self._dom:
+            return node
+        return self._dom.importNode(node, deep=True)
+
+    def _namespace_prelude(self, xml_content):
+        """
+        Namespace declarations needed to parse a fragment of this document.
+
+        The root element's declarations are collected once and reused until its
+        attributes change. Only the default namespace and the prefixes the
+        fragment uses in element or attribute names are declared, since every
+        declaration on the wrapper costs an attribute node per parse.
+
+        Args:
+            xml_content: String containing the XML fragment(s) to be parsed
+
+        Returns:
+            str: Attribute text for the wrapper element
+        """
+        root_elem = self._dom.documentElement
+        attributes = root_elem.attributes if root_elem else None
+        cache_key = attributes.length if attributes else 0
+        if self._namespaces is None or self._namespaces[0] != cache_key:
+            declarations = {}
+            for i in range(cache_key):
+                attr = attributes.item(i)  # type: ignore
+                if attr.name == "xmlns":
+                    declarations[""] = f'xmlns="{attr.value}"'
+                elif attr.name.startswith("xmlns:"):
+                    declarations[attr.name[6:]] = f'{attr.name}="{attr.value}"'
+            self._namespaces = (cache_key, declarations)
+
+        declarations = self._namespaces[1]
+        used = {""} | set(_NAME_PREFIX_PATTERN.findall(xml_content))
+        return " ".join(declarations[prefix] for prefix in used if prefix in declarations)
+
+
+@contextlib.contextmanager
+def _atomic_writer(path, keep_unchanged=False):
+    """
+    Open a binary temporary file next to path and rename it over path on success.
+
+    Yields a dict holding the open temporary file ("file"). Its "replaced" entry
+    is False if keep_unchanged is set and the new content equals path's, in
+    which case path is left untouched.
+    """
+    path = Path(path)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    result = {"file": None, "replaced": True}
+    try:
+        with os.fdopen(fd, "wb") as f:
+            result["file"] = f
+            yield result
+        if keep_unchanged and path.exists() and filecmp.cmp(temp_path, path, shallow=False):
+            os.unlink(temp_path)
+            result["replaced"] = False
+            return
+        if path.exists():
+            os.chmod(temp_path, path.stat().st_mode & 0o7777)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
 
 def _create_line_tracking_parser():
     """
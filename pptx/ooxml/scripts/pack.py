@@ -7,14 +7,18 @@ Example usage:
 """
 
 import argparse
-import shutil
-import subprocess
+import io
 import sys
 import tempfile
 import defusedxml.minidom
 import zipfile
 from pathlib import Path
 
+try:
+    from .soffice import ConversionError, convert_document
+except ImportError:  # Run as a script rather than imported as ooxml.scripts.pack
+    from soffice import ConversionError, convert_document
+
 
 def main():
     parser = argparse.ArgumentParser(description="Pack a directory into an Office file")
@@ -42,13 +46,15 @@ def main():
         sys.exit(f"Error: {e}")
 
 
-def pack_document(input_dir, output_file, validate=False):
+def pack_document(input_dir, output_file, validate=False, condensed=()):
     """Pack a directory into an Office file (.docx/.pptx/.xlsx).
 
     Args:
         input_dir: Path to unpacked Office document directory
         output_file: Path to output Office file
         validate: If True, validates with soffice (default: False)
+        condensed: Paths of XML parts already in condensed form (e.g. written by
+            XMLEditor.save(condensed=True)); these are zipped as they are
 
     Returns:
         bool: True if successful, False if validation failed
@@ -61,34 +67,35 @@ def pack_document(input_dir, output_file, validate=False):
     if output_file.suffix.lower() not in {".docx", ".pptx", ".xlsx"}:
         raise ValueError(f"{output_file} must be a .docx, .pptx, or .xlsx file")
 
-    # Work in temporary directory to avoid modifying original
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_content_dir = Path(temp_dir) / "content"
-        shutil.copytree(input_dir, temp_content_dir)
-
-        # Process XML files to remove pretty-printing whitespace
-        for pattern in ["*.xml", "*.rels"]:
-            for xml_file in temp_content_dir.rglob(pattern):
-                condense_xml(xml_file)
-
-        # Create final Office file as zip archive
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
-            for f in temp_content_dir.rglob("*"):
-                if f.is_file():
-                    zf.write(f, f.relative_to(temp_content_dir))
-
-        # Validate if requested
-        if validate:
-            if not validate_document(output_file):
-                output_file.unlink()  # Delete the corrupt file
-                return False
+    # Create final Office file as zip archive, removing pretty-printing whitespace
+    # from XML parts in memory so the input directory is left untouched
+    condensed = {Path(path).resolve() for path in condensed}
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
+        for f in input_dir.rglob("*"):
+            if not f.is_file():
+                continue
+            arcname = f.relative_to(input_dir).as_posix()
+            if f.name.endswith((".xml", ".rels")) and f.resolve() not in condensed:
+                zf.writestr(arcname, condensed_xml(f))
+            else:
+                zf.write(f, arcname)
+
+    # Validate if requested
+    if validate:
+        if not validate_document(output_file):
+            output_file.unlink()  # Delete the corrupt file
+            return False
 
     return True
 
 
 def validate_document(doc_path):
-    """Validate document by converting to HTML with soffice."""
+    """Validate document by converting to HTML with soffice.
+
+    Uses a warm LibreOffice instance when a pool is running (see soffice.py).
+    The time allowed grows with the document's size.
+    """
     # Determine the correct filter based on file extension
     match doc_path.suffix.lower():
         case ".docx":
@@ -100,29 +107,15 @@ def validate_document(doc_path):
 
     with tempfile.TemporaryDirectory() as temp_dir:
         try:
-            result = subprocess.run(
-                [
-                    "soffice",
-                    "--headless",
-                    "--convert-to",
-                    filter_name,
-                    "--outdir",
-                    temp_dir,
-                    str(doc_path),
-                ],
-                capture_output=True,
-                timeout=10,
-                text=True,
-            )
-            if not (Path(temp_dir) / f"{doc_path.stem}.html").exists():
-                error_msg = result.stderr.strip() or "Document validation failed"
-                print(f"Validation error: {error_msg}", file=sys.stderr)
-                return False
+            convert_document(doc_path, temp_dir, filter_name)
             return True
+        except ConversionError as e:
+            print(f"Validation error: {e}", file=sys.stderr)
+            return False
         except FileNotFoundError:
             print("Warning: soffice not found. Skipping validation.", file=sys.stderr)
             return True
-        except subprocess.TimeoutExpired:
+        except TimeoutError:
             print("Validation error: Timeout during conversion", file=sys.stderr)
             return False
         except Exception as e:
@@ -132,27 +125,81 @@ def validate_document(doc_path):
 
 def condense_xml(xml_file):
     """Strip unnecessary whitespace and remove comments."""
+    content = condensed_xml(xml_file)
+
+    # Write back the condensed XML
+    with open(xml_file, "wb") as f:
+        f.write(content)
+
+
+def condensed_xml(xml_file):
+    """Return the condensed form of an XML file as bytes (see condense_xml)."""
     with open(xml_file, "r", encoding="utf-8") as f:
         dom = defusedxml.minidom.parse(f)
 
-    # Process each element to remove whitespace and comments
-    for element in dom.getElementsByTagName("*"):
-        # Skip w:t elements and their processing
-        if element.tagName.endswith(":t"):
-            continue
+    buffer = io.BytesIO()
+    writer = io.TextIOWrapper(
+        buffer, encoding="UTF-8", errors="xmlcharrefreplace", newline="\n"
+    )
+    write_condensed(writer, dom)
+    writer.flush()
+    return buffer.getvalue()
 
-        # Remove whitespace-only text nodes and comment nodes
-        for child in list(element.childNodes):
-            if (
-                child.nodeType == child.TEXT_NODE
-                and child.nodeValue
-                and child.nodeValue.strip() == ""
-            ) or child.nodeType == child.COMMENT_NODE:
-                element.removeChild(child)
 
-    # Write back the condensed XML
-    with open(xml_file, "wb") as f:
-        f.write(dom.toxml(encoding="UTF-8"))
+def write_condensed(writer, node):
+    """
+    Serialize a DOM document or node to a text stream in condensed form.
+
+    Whitespace-only text and comments are dropped from element content, except
+    inside text elements (tags ending in ":t") where whitespace is significant.
+    This is the single definition of the packed form, shared with
+    XMLEditor.save(condensed=True).
+    """
+    if node.nodeType == node.DOCUMENT_NODE:
+        writer.write('<?xml version="1.0" encoding="UTF-8"?>')
+        for child in node.childNodes:
+            write_condensed(writer, child)
+        return
+    if node.nodeType != node.ELEMENT_NODE:
+        node.writexml(writer)
+        return
+
+    writer.write("<" + node.tagName)
+    for name, value in node.attributes.items():
+        writer.write(f' {name}="{_escape_attribute(value)}"')
+
+    children = node.childNodes
+    if not node.tagName.endswith(":t"):
+        children = [
+            child
+            for child in children
+            if not (
+                child.nodeType == child.TEXT_NODE
+                and child.data
+                and not child.data.strip()
+            )
+            and child.nodeType != child.COMMENT_NODE
+        ]
+    if not children:
+        writer.write("/>")
+        return
+    writer.write(">")
+    for child in children:
+        write_condensed(writer, child)
+    writer.write(f"</{node.tagName}>")
+
+
+def _escape_attribute(value):
+    """Escape an attribute value for a double-quoted XML attribute."""
+    return (
+        value.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace('"', "&quot;")
+        .replace(">", "&gt;")
+        .replace("\n", "&#10;")
+        .replace("\r", "&#13;")
+        .replace("\t", "&#9;")
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+Convert Office documents with LibreOffice, reusing warm instances when available.
+
+A cold LibreOffice start costs several seconds per conversion. `start`
+launches a pool of headless listeners, each with its own user profile, that
+keep running between script invocations. convert_document() hands work to an
+idle listener over UNO, waits in line when every listener is busy, and
+restarts listeners that have crashed or hung. When no pool is running, or the
+`uno` module is not importable, it falls back to a one-shot
+`soffice --convert-to`.
+
+Usage:
+    python soffice.py start [--instances N]
+    python soffice.py status
+    python soffice.py stop
+    python soffice.py convert <file> <output_dir> <format>
+
+The format uses soffice's --convert-to syntax (e.g. pdf, html:HTML). The pool
+state lives in $SOFFICE_POOL_DIR (default: <temp dir>/soffice-pool).
+"""
+
+import argparse
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # No file locks (Windows): always convert one-shot
+    fcntl = None
+
+try:
+    import uno
+    from com.sun.star.beans import PropertyValue
+except ImportError:  # LibreOffice's Python bridge is optional
+    uno = None
+
+POOL_DIR_ENV = "SOFFICE_POOL_DIR"
+DEFAULT_INSTANCES = 2
+STARTUP_TIMEOUT = 60  # Seconds to wait for a listener to accept connections
+BASE_TIMEOUT = 30  # Seconds allowed for any conversion
+TIMEOUT_PER_MB = 10  # Extra seconds allowed per MB of input
+
+# Export filters for --convert-to formats given without an explicit filter
+DEFAULT_FILTERS = {
+    ("pdf", ".pptx"): "impress_pdf_Export",
+    ("pdf", ".docx"): "writer_pdf_Export",
+    ("pdf", ".xlsx"): "calc_pdf_Export",
+}
+
+
+class ConversionError(RuntimeError):
+    """Raised when LibreOffice cannot convert a document."""
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Manage a pool of warm LibreOffice instances and convert documents."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    start_parser = subparsers.add_parser("start", help="Start the listener pool")
+    start_parser.add_argument(
+        "--instances",
+        type=int,
+        default=DEFAULT_INSTANCES,
+        help=f"Number of LibreOffice listeners (default: {DEFAULT_INSTANCES})",
+    )
+    subparsers.add_parser("status", help="Show the listener pool")
+    subparsers.add_parser("stop", help="Stop the listener pool")
+    convert_parser = subparsers.add_parser("convert", help="Convert one document")
+    convert_parser.add_argument("input_file", help="Document to convert")
+    convert_parser.add_argument("output_dir", help="Directory for the converted file")
+    convert_parser.add_argument("format", help="Output format, e.g. pdf or html:HTML")
+    args = parser.parse_args()
+
+    try:
+        if args.command == "start":
+            if uno is None:
+                print(
+                    "Warning: the uno module is not importable; conversions "
+                    "will not use the pool",
+                    file=sys.stderr,
+                )
+            start_pool(args.instances)
+            print(f"Started {args.instances} LibreOffice listener(s) in {pool_dir()}")
+        elif args.command == "stop":
+            count = stop_pool()
+            print(f"Stopped {count} LibreOffice listener(s)")
+        elif args.command == "status":
+            instances = pool_instances()
+            if not instances:
+                print("No LibreOffice pool is running")
+            for instance in instances:
+                state = instance.read_state() or {}
+                status = "running" if instance.is_alive() else "down"
+                print(
+                    f"  instance-{instance.index}: {status} "
+                    f"(pid {state.get('pid')}, port {state.get('port')})"
+                )
+        else:
+            output = convert_document(args.input_file, args.output_dir, args.format)
+            print(f"Converted to: {output}")
+    except (ConversionError, TimeoutError, ValueError, FileNotFoundError) as e:
+        sys.exit(f"Error: {e}")
+
+
+def pool_dir():
+    """Return the directory holding the pool's state, locks and profiles."""
+    return Path(
+        os.environ.get(POOL_DIR_ENV) or Path(tempfile.gettempdir()) / "soffice-pool"
+    )
+
+
+def conversion_timeout(doc_path):
+    """Return the time allowed to convert a document, scaled by its size."""
+    size_mb = Path(doc_path).stat().st_size / (1024 * 1024)
+    return BASE_TIMEOUT + TIMEOUT_PER_MB * size_mb
+
+
+def _free_port():
+    """Ask the OS for a free local TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _properties(**values):
+    """Build a tuple of UNO PropertyValues from keyword arguments."""
+    return tuple(PropertyValue(Name=name, Value=value) for name, value in values.items())
+
+
+class Instance:
+    """One headless LibreOffice listener in the pool."""
+
+    def __init__(self, directory, index):
+        self.index = index
+        self.state_file = directory / f"instance-{index}.json"
+        self.lock_file = directory / f"instance-{index}.lock"
+        self.profile = directory / f"profile-{index}"
+
+    def read_state(self):
+        """Return {"pid": ..., "port": ...} for the listener, or None."""
+        try:
+            return json.loads(self.state_file.read_text())
+        except (OSError, ValueError):
+            return None
+
+    def is_alive(self):
+        """Check that the listener process exists and accepts connections."""
+        state = self.read_state()
+        if not state:
+            return False
+        try:
+            os.kill(state["pid"], 0)
+            with socket.create_connection(("127.0.0.1", state["port"]), timeout=1):
+                return True
+        except OSError:
+            return False
+
+    @contextmanager
+    def locked(self, blocking=True):
+        """Hold this instance exclusively; yields False if busy and not blocking."""
+        with open(self.lock_file, "a") as handle:
+            try:
+                flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+                fcntl.flock(handle, flags)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def start(self):
+        """Launch the listener and wait until it accepts connections."""
+        port = _free_port()
+        process = subprocess.Popen(
+            [
+                "soffice",
+                "--headless",
+                "--invisible",
+                "--nologo",
+                "--norestore",
+                "--nodefault",
+                f"-env:UserInstallation={self.profile.as_uri()}",
+                f"--accept=socket,host=127.0.0.1,port={port};urp;StarOffice.ComponentContext",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,  # Own process group, so kill() reaches soffice.bin
+        )
+        self.state_file.write_text(json.dumps({"pid": process.pid, "port": port}))
+
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                break
+            try:
+                with socket.create_connection(("127.0.0.1", port), timeout=1):
+                    return
+            except OSError:
+                time.sleep(0.25)
+
+        self.stop()
+        raise ConversionError(f"LibreOffice listener {self.index} failed to start")
+
+    def kill(self):
+        """Kill the listener's process group, keeping its slot in the pool."""
+        state = self.read_state()
+        if state:
+            try:
+                os.killpg(state["pid"], signal.SIGKILL)
+            except OSError:
+                pass
+
+    def stop(self):
+        """Kill the listener and remove it from the pool."""
+        self.kill()
+        self.state_file.unlink(missing_ok=True)
+
+    def convert(self, doc_path, out_path, filter_name):
+        """Convert a document over UNO using this listener."""
+        port = self.read_state()["port"]
+        local = uno.getComponentContext()
+        resolver = local.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local
+        )
+        context = resolver.resolve(
+            f"uno:socket,host=127.0.0.1,port={port};urp;StarOffice.ComponentContext"
+        )
+        desktop = context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", context
+        )
+
+        document = desktop.loadComponentFromURL(
+            uno.systemPathToFileUrl(str(doc_path)),
+            "_blank",
+            0,
+            _properties(Hidden=True, ReadOnly=True),
+        )
+        if document is None:
+            raise ConversionError(f"LibreOffice could not load {doc_path.name}")
+        try:
+            document.storeToURL(
+                uno.systemPathToFileUrl(str(out_path)),
+                _properties(FilterName=filter_name, Overwrite=True),
+            )
+        finally:
+            document.close(True)
+
+
+def pool_instances():
+    """Return the instances registered in the pool directory."""
+    directory = pool_dir()
+    indices = sorted(
+        int(path.stem.split("-")[1]) for path in directory.glob("instance-*.json")
+    )
+    return [Instance(directory, index) for index in indices]
+
+
+def start_pool(instances=DEFAULT_INSTANCES):
+    """Start listeners 0..instances-1, leaving any that are already running."""
+    if fcntl is None:
+        raise ConversionError("The LibreOffice pool requires POSIX file locks")
+    directory = pool_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    for index in range(instances):
+        instance = Instance(directory, index)
+        with instance.locked():
+            if not instance.is_alive():
+                instance.start()
+
+
+def stop_pool():
+    """Stop every listener in the pool and return how many there were."""
+    instances = pool_instances()
+    for instance in instances:
+        instance.stop()
+    return len(instances)
+
+
+@contextmanager
+def _acquire(instances):
+    """Lock an idle instance, or wait in line for a busy one."""
+    for instance in instances:
+        with instance.locked(blocking=False) as acquired:
+            if acquired:
+                yield instance
+                return
+
+    # Spread waiting processes across the pool
+    instance = instances[os.getpid() % len(instances)]
+    with instance.locked():
+        yield instance
+
+
+def _convert_in_pool(instances, doc_path, out_path, filter_name, timeout):
+    """Convert with a pooled listener; return False if the pool is unusable.
+
+    A listener that dies during a conversion is restarted and the conversion
+    retried once. A listener that runs past the timeout is killed (and
+    restarted by the next caller) and TimeoutError is raised.
+    """
+    for _ in range(2):
+        with _acquire(instances) as instance:
+            if not instance.is_alive():
+                try:
+                    instance.start()
+                except (ConversionError, OSError):
+                    continue
+
+            timed_out = threading.Event()
+
+            def expire():
+                timed_out.set()
+                instance.kill()
+
+            watchdog = threading.Timer(timeout, expire)
+            watchdog.start()
+            try:
+                instance.convert(doc_path, out_path, filter_name)
+                return True
+            except Exception as e:
+                if timed_out.is_set():
+                    raise TimeoutError(f"Conversion timed out after {timeout:.0f}s")
+                if instance.is_alive():
+                    # The listener is fine, so the document is the problem
+                    raise ConversionError(str(e) or "Document conversion failed")
+            finally:
+                watchdog.cancel()
+    return False
+
+
+def _convert_one_shot(doc_path, output_dir, convert_to, out_path, timeout):
+    """Convert with a fresh `soffice --headless --convert-to` process."""
+    try:
+        result = subprocess.run(
+            [
+                "soffice",
+                "--headless",
+                "--convert-to",
+                convert_to,
+                "--outdir",
+                str(output_dir),
+                str(doc_path),
+            ],
+            capture_output=True,
+            timeout=timeout,
+            text=True,
+        )
+    except subprocess.TimeoutExpired:
+        raise TimeoutError(f"Conversion timed out after {timeout:.0f}s")
+    if not out_path.exists():
+        raise ConversionError(result.stderr.strip() or "Document conversion failed")
+
+
+def convert_document(doc_path, output_dir, convert_to, timeout=None):
+    """Convert a document with LibreOffice.
+
+    Args:
+        doc_path: Document to convert
+        output_dir: Directory for the converted file
+        convert_to: Output format in --convert-to syntax (e.g. "pdf", "html:HTML")
+        timeout: Seconds allowed (default: scaled by the document's size)
+
+    Returns:
+        Path of the converted file (output_dir/<stem>.<extension>)
+
+    Raises:
+        ConversionError: If LibreOffice cannot convert the document
+        TimeoutError: If the conversion takes longer than the timeout
+        FileNotFoundError: If soffice is not installed
+    """
+    doc_path = Path(doc_path).resolve()
+    output_dir = Path(output_dir).resolve()
+    extension, _, filter_name = convert_to.partition(":")
+    filter_name = filter_name or DEFAULT_FILTERS.get((extension, doc_path.suffix.lower()))
+    out_path = output_dir / f"{doc_path.stem}.{extension}"
+    if timeout is None:
+        timeout = conversion_timeout(doc_path)
+
+    if uno is not None and fcntl is not None and filter_name:
+        instances = pool_instances()
+        if instances and _convert_in_pool(
+            instances, doc_path, out_path, filter_name, timeout
+        ):
+            return out_path
+
+    _convert_one_shot(doc_path, output_dir, convert_to, out_path, timeout)
+    return out_path
+
+
+if __name__ == "__main__":
+    main()
@@ -2,12 +2,117 @@
 Base validator with common validation logic for document files.
 """
 
+import io
+import os
 import re
-from pathlib import Path
+import zipfile
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
 
 import lxml.etree
 
 
+@lru_cache(maxsize=None)
+def _load_schema(schema_path):
+    """Parse an XSD schema once per process and reuse it for every validation.
+
+    Compiling the OOXML schemas dominates validation time for small documents,
+    so long-running processes (e.g. batch workers) keep them in memory.
+    """
+    with open(schema_path, "rb") as xsd_file:
+        parser = lxml.etree.XMLParser()
+        xsd_doc = lxml.etree.parse(xsd_file, parser=parser, base_url=str(schema_path))
+    return lxml.etree.XMLSchema(xsd_doc)
+
+
+class DocumentPackage:
+    """Read-only view of an Office document's files, unpacked or still zipped.
+
+    For a .docx/.pptx/.xlsx file, the XML and .rels members are read into memory
+    once and nothing is extracted; other members are known by name only. Files
+    are addressed by Path objects under root (for a zip, the file itself acts as
+    the root directory) so validators and their reports work the same either way.
+    """
+
+    XML_SUFFIXES = (".xml", ".rels")
+
+    def __init__(self, path):
+        self.root = Path(path).resolve()
+        self.is_zip = self.root.is_file()
+        self._members = {}
+        if self.is_zip:
+            with zipfile.ZipFile(self.root) as zf:
+                for info in zf.infolist():
+                    if info.is_dir():
+                        continue
+                    self._members[info.filename] = (
+                        zf.read(info) if info.filename.endswith(self.XML_SUFFIXES) else None
+                    )
+
+    def files(self):
+        """All files in the package."""
+        if self.is_zip:
+            return [self.root / name for name in self._members]
+        return [f for f in self.root.rglob("*") if f.is_file()]
+
+    def xml_files(self):
+        """All .xml files followed by all .rels files."""
+        if self.is_zip:
+            return [
+                self.root / name
+                for suffix in self.XML_SUFFIXES
+                for name in self._members
+                if name.endswith(suffix)
+            ]
+        return [f for suffix in self.XML_SUFFIXES for f in self.root.rglob(f"*{suffix}")]
+
+    def glob(self, pattern):
+        """Files matching a root-relative glob pattern (e.g. "ppt/slides/*.xml")."""
+        if self.is_zip:
+            depth = len(PurePosixPath(pattern).parts)
+            return [
+                self.root / name
+                for name in self._members
+                if len(PurePosixPath(name).parts) == depth
+                and PurePosixPath(name).match(pattern)
+            ]
+        return list(self.root.glob(pattern))
+
+    def is_file(self, path):
+        """Check whether a path names a file in the package."""
+        if self.is_zip:
+            return self._member_name(path) in self._members
+        return Path(path).is_file()
+
+    def resolve(self, path):
+        """Normalize a path in the package (resolving ".." segments)."""
+        if self.is_zip:
+            return Path(os.path.normpath(path))
+        return Path(path).resolve()
+
+    def read_bytes(self, path):
+        """Content of an XML or .rels file in the package."""
+        if self.is_zip:
+            content = self._members.get(self._member_name(path))
+            if content is None:
+                raise FileNotFoundError(f"Not an XML part of {self.root.name}: {path}")
+            return content
+        return Path(path).read_bytes()
+
+    def parse(self, path):
+        """Parse an XML or .rels file in the package with lxml."""
+        if self.is_zip:
+            return lxml.etree.parse(io.BytesIO(self.read_bytes(path)))
+        return lxml.etree.parse(str(path))
+
+    def _member_name(self, path):
+        """Zip member name for a path under root (None if outside the package)."""
+        try:
+            return Path(path).relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+
+
 class BaseSchemaValidator:
     """Base validator with common validation logic for document files."""
 
@@ -103,19 +208,27 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
-    def __init__(self, unpacked_dir, original_file, verbose=False):
-        self.unpacked_dir = Path(unpacked_dir).resolve()
-        self.original_file = Path(original_file)
+    def __init__(self, unpacked_dir, original_file=None, verbose=False, quick=False):
+        """
+        Args:
+            unpacked_dir: Unpacked document directory, or the .docx/.pptx/.xlsx
+                file itself (validated in memory without extracting)
+            original_file: Original Office file; XSD errors it already had are
+                not reported. If None, every XSD error is reported
+            verbose: Print passing checks too
+            quick: Skip XSD schema validation and run only the structural checks
+        """
+        self.package = DocumentPackage(unpacked_dir)
+        self.unpacked_dir = self.package.root
+        self.original_file = Path(original_file) if original_file else None
         self.verbose = verbose
+        self.quick = quick
 
         # Set schemas directory
         self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
 
         # Get all XML and .rels files
-        patterns = ["*.xml", "*.rels"]
-        self.xml_files = [
-            f for pattern in patterns for f in self.unpacked_dir.rglob(pattern)
-        ]
+        self.xml_files = self.package.xml_files()
 
         if not self.xml_files:
             print(f"Warning: No XML files found in {self.unpacked_dir}")
@@ -131,7 +244,7 @@ class BaseSchemaValidator:
         for xml_file in self.xml_files:
             try:
                 # Try to parse the XML file
-                lxml.etree.parse(str(xml_file))
+                self.package.parse(xml_file)
             except lxml.etree.XMLSyntaxError as e:
                 errors.append(
                     f"  {xml_file.relative_to(self.unpacked_dir)}: "
@@ -159,7 +272,7 @@ class BaseSchemaValidator:
 
         for xml_file in self.xml_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self.package.parse(xml_file).getroot()
                 declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
 
                 for attr_val in [
@@ -190,7 +303,7 @@ class BaseSchemaValidator:
 
         for xml_file in self.xml_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self.package.parse(xml_file).getroot()
                 file_ids = {}  # Track IDs that must be unique within this file
 
                 # Remove all mc:AlternateContent elements from the tree
@@ -281,7 +394,8 @@ class BaseSchemaValidator:
         errors = []
 
         # Find all .rels files
-        rels_files = list(self.unpacked_dir.rglob("*.rels"))
+        package_files = self.package.files()
+        rels_files = [f for f in package_files if f.name.endswith(".rels")]
 
         if not rels_files:
             if self.verbose:
@@ -290,13 +404,12 @@ class BaseSchemaValidator:
 
         # Get all files in the unpacked directory (excluding reference files)
         all_files = []
-        for file_path in self.unpacked_dir.rglob("*"):
+        for file_path in package_files:
             if (
-                file_path.is_file()
-                and file_path.name != "[Content_Types].xml"
+                file_path.name != "[Content_Types].xml"
                 and not file_path.name.endswith(".rels")
             ):  # This file is not referenced by .rels
-                all_files.append(file_path.resolve())
+                all_files.append(self.package.resolve(file_path))
 
         # Track all files that are referenced by any .rels file
         all_referenced_files = set()
@@ -310,7 +423,7 @@ class BaseSchemaValidator:
         for rels_file in rels_files:
             try:
                 # Parse relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self.package.parse(rels_file).getroot()
 
                 # Get the directory where this .rels file is located
                 rels_dir = rels_file.parent
@@ -339,8 +452,8 @@ class BaseSchemaValidator:
 
                         # Normalize the path and check if it exists
                         try:
-                            target_path = target_path.resolve()
-                            if target_path.exists() and target_path.is_file():
+                            target_path = self.package.resolve(target_path)
+                            if self.package.is_file(target_path):
                                 referenced_files.add(target_path)
                                 all_referenced_files.add(target_path)
                             else:
@@ -390,7 +503,6 @@ class BaseSchemaValidator:
         Validate that all r:id attributes in XML files reference existing IDs
         in their corresponding .rels files, and optionally validate relationship types.
         """
-        import lxml.etree
 
         errors = []
 
@@ -406,12 +518,12 @@ class BaseSchemaValidator:
             rels_file = rels_dir / f"{xml_file.name}.rels"
 
             # Skip if there's no corresponding .rels file (that's okay)
-            if not rels_file.exists():
+            if not self.package.is_file(rels_file):
                 continue
 
             try:
                 # Parse the .rels file to get valid relationship IDs and their types
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self.package.parse(rels_file).getroot()
                 rid_to_type = {}
 
                 for rel in rels_root.findall(
@@ -434,7 +546,7 @@ class BaseSchemaValidator:
                         rid_to_type[rid] = type_name
 
                 # Parse the XML file to find all r:id references
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
+                xml_root = self.package.parse(xml_file).getroot()
 
                 # Find all elements with r:id attributes
                 for elem in xml_root.iter():
@@ -525,13 +637,13 @@ class BaseSchemaValidator:
 
         # Find [Content_Types].xml file
         content_types_file = self.unpacked_dir / "[Content_Types].xml"
-        if not content_types_file.exists():
+        if not self.package.is_file(content_types_file):
             print("FAILED - [Content_Types].xml file not found")
             return False
 
         try:
             # Parse and get all declared parts and extensions
-            root = lxml.etree.parse(str(content_types_file)).getroot()
+            root = self.package.parse(content_types_file).getroot()
             declared_parts = set()
             declared_extensions = set()
 
@@ -575,9 +687,8 @@ class BaseSchemaValidator:
                 "emf": "image/x-emf",
             }
 
-            # Get all files in the unpacked directory
-            all_files = list(self.unpacked_dir.rglob("*"))
-            all_files = [f for f in all_files if f.is_file()]
+            # Get all files in the document
+            all_files = self.package.files()
 
             # Check all XML files for Override declarations
             for xml_file in self.xml_files:
@@ -593,7 +704,7 @@ class BaseSchemaValidator:
                     continue
 
                 try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
+                    root_tag = self.package.parse(xml_file).getroot().tag
                     root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
 
                     if root_name in declarable_roots and path_str not in declared_parts:
@@ -648,9 +759,9 @@ class BaseSchemaValidator:
         Returns:
             tuple: (is_valid, new_errors_set) where is_valid is True/False/None (skipped)
         """
-        # Resolve both paths to handle symlinks
-        xml_file = Path(xml_file).resolve()
-        unpacked_dir = self.unpacked_dir.resolve()
+        # Resolve the path to handle symlinks
+        xml_file = self.package.resolve(xml_file)
+        unpacked_dir = self.unpacked_dir
 
         # Validate current file
         is_valid, current_errors = self._validate_single_file_xsd(
@@ -823,24 +934,23 @@ class BaseSchemaValidator:
 
         return xml_doc
 
-    def _validate_single_file_xsd(self, xml_file, base_path):
-        """Validate a single XML file against XSD schema. Returns (is_valid, errors_set)."""
+    def _validate_single_file_xsd(self, xml_file, base_path, content=None):
+        """Validate a single XML file against XSD schema. Returns (is_valid, errors_set).
+
+        The file is read from the package unless its content (bytes) is given.
+        """
         schema_path = self._get_schema_path(xml_file)
         if not schema_path:
             return None, None  # Skip file
 
         try:
-            # Load schema
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
-                )
-                schema = lxml.etree.XMLSchema(xsd_doc)
+            # Load schema (cached per process)
+            schema = _load_schema(str(schema_path))
 
             # Load and preprocess XML
-            with open(xml_file, "r") as f:
-                xml_doc = lxml.etree.parse(f)
+            if content is None:
+                content = self.package.read_bytes(xml_file)
+            xml_doc = lxml.etree.parse(io.BytesIO(content))
 
             xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
             xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
@@ -875,33 +985,27 @@ class BaseSchemaValidator:
         Returns:
             set: Set of error messages from the original file
         """
-        import tempfile
-        import zipfile
-
-        # Resolve both paths to handle symlinks (e.g., /var vs /private/var on macOS)
-        xml_file = Path(xml_file).resolve()
-        unpacked_dir = self.unpacked_dir.resolve()
-        relative_path = xml_file.relative_to(unpacked_dir)
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        if self.original_file is None:
+            return set()
 
-            # Extract original file
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
+        # Resolve the path to handle symlinks (e.g., /var vs /private/var on macOS)
+        xml_file = self.package.resolve(xml_file)
+        relative_path = xml_file.relative_to(self.unpacked_dir)
 
-            # Find corresponding file in original
-            original_xml_file = temp_path / relative_path
-
-            if not original_xml_file.exists():
+        # Read only the corresponding member of the original, in memory
+        with zipfile.ZipFile(self.original_file, "r") as zip_ref:
+            try:
+                content = zip_ref.read(relative_path.as_posix())
+            except KeyError:
                 # File didn't exist in original, so no original errors
                 return set()
 
-            # Validate the specific file in original
-            is_valid, errors = self._validate_single_file_xsd(
-                original_xml_file, temp_path
-            )
-            return errors if errors else set()
+        # Validate the specific file in original
+        original_root = self.original_file.resolve()
+        is_valid, errors = self._validate_single_file_xsd(
+            original_root / relative_path, original_root, content=content
+        )
+        return errors if errors else set()
 
     def _remove_template_tags_from_text_nodes(self, xml_doc):
         """Remove template tags from XML text nodes and collect warnings.
@@ -2,6 +2,7 @@
 Validator for tracked changes in Word documents.
 """
 
+import io
 import subprocess
 import tempfile
 import zipfile
@@ -12,6 +13,7 @@ class RedliningValidator:
     """Validator for tracked changes in Word documents."""
 
     def __init__(self, unpacked_dir, original_docx, verbose=False):
+        # unpacked_dir may also be the modified .docx itself (read without extracting)
         self.unpacked_dir = Path(unpacked_dir)
         self.original_docx = Path(original_docx)
         self.verbose = verbose
@@ -22,10 +24,18 @@ class RedliningValidator:
     def validate(self):
         """Main validation method that returns True if valid, False otherwise."""
         # Verify unpacked directory exists and has correct structure
-        modified_file = self.unpacked_dir / "word" / "document.xml"
-        if not modified_file.exists():
-            print(f"FAILED - Modified document.xml not found at {modified_file}")
-            return False
+        if self.unpacked_dir.is_file():
+            try:
+                with zipfile.ZipFile(self.unpacked_dir, "r") as zip_ref:
+                    modified_file = io.BytesIO(zip_ref.read("word/document.xml"))
+            except (KeyError, zipfile.BadZipFile):
+                print(f"FAILED - Modified document.xml not found in {self.unpacked_dir}")
+                return False
+        else:
+            modified_file = self.unpacked_dir / "word" / "document.xml"
+            if not modified_file.exists():
+                print(f"FAILED - Modified document.xml not found at {modified_file}")
+                return False
 
         # First, check if there are any tracked changes by Claude to validate
         try:
@@ -60,56 +70,52 @@ class RedliningValidator:
             # If we can't parse the XML, continue with full validation
             pass
 
-        # Create temporary directory for unpacking original docx
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Unpack original docx
-            try:
-                with zipfile.ZipFile(self.original_docx, "r") as zip_ref:
-                    zip_ref.extractall(temp_path)
-            except Exception as e:
-                print(f"FAILED - Error unpacking original docx: {e}")
-                return False
+        # Read document.xml from the original docx (no extraction needed)
+        try:
+            with zipfile.ZipFile(self.original_docx, "r") as zip_ref:
+                original_file = io.BytesIO(zip_ref.read("word/document.xml"))
+        except KeyError:
+            print(
+                f"FAILED - Original document.xml not found in {self.original_docx}"
+            )
+            return False
+        except Exception as e:
+            print(f"FAILED - Error reading original docx: {e}")
+            return False
 
-            original_file = temp_path / "word" / "document.xml"
-            if not original_file.exists():
-                print(
-                    f"FAILED - Original document.xml not found in {self.original_docx}"
-                )
-                return False
+        # Parse both XML files using xml.etree.ElementTree for redlining validation
+        try:
+            import xml.etree.ElementTree as ET
 
-            # Parse both XML files using xml.etree.ElementTree for redlining validation
-            try:
-                import xml.etree.ElementTree as ET
-
-                modified_tree = ET.parse(modified_file)
-                modified_root = modified_tree.getroot()
-                original_tree = ET.parse(original_file)
-                original_root = original_tree.getroot()
-            except ET.ParseError as e:
-                print(f"FAILED - Error parsing XML files: {e}")
-                return False
+            if isinstance(modified_file, io.BytesIO):
+                modified_file.seek(0)  # Already read by the tracked-changes check
+            modified_tree = ET.parse(modified_file)
+            modified_root = modified_tree.getroot()
+            original_tree = ET.parse(original_file)
+            original_root = original_tree.getroot()
+        except ET.ParseError as e:
+            print(f"FAILED - Error parsing XML files: {e}")
+            return False
 
-            # Remove Claude's tracked changes from both documents
-            self._remove_claude_tracked_changes(original_root)
-            self._remove_claude_tracked_changes(modified_root)
+        # Remove Claude's tracked changes from both documents
+        self._remove_claude_tracked_changes(original_root)
+        self._remove_claude_tracked_changes(modified_root)
 
-            # Extract and compare text content
-            modified_text = self._extract_text_content(modified_root)
-            original_text = self._extract_text_content(original_root)
+        # Extract and compare text content
+        modified_text = self._extract_text_content(modified_root)
+        original_text = self._extract_text_content(original_root)
 
-            if modified_text != original_text:
-                # Show detailed character-level differences for each paragraph
-                error_message = self._generate_detailed_diff(
-                    original_text, modified_text
-                )
-                print(error_message)
-                return False
+        if modified_text != original_text:
+            # Show detailed character-level differences for each paragraph
+            error_message = self._generate_detailed_diff(
+                original_text, modified_text
+            )
+            print(error_message)
+            return False
 
-            if self.verbose:
-                print("PASSED - All changes by Claude are properly tracked")
-            return True
+        if self.verbose:
+            print("PASSED - All changes by Claude are properly tracked")
+        return True
 
     def _generate_detailed_diff(self, original_text, modified_text):
         """Generate detailed word-level differences using git word diff."""
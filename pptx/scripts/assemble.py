@@ -0,0 +1,503 @@
+#!/usr/bin/env python3
+"""
+Assemble one PowerPoint deck from slides of several source presentations.
+
+Usage:
+    python assemble.py manifest.json output.pptx [--base base.pptx]
+
+The manifest is a JSON list of slides in output order, each either an object
+{"source": "deck.pptx", "slide": 3} or a pair ["deck.pptx", 3]. Slide indices
+are 0-based and relative source paths are resolved against the manifest's
+directory. The same slide may appear several times.
+
+The output keeps the slide size, theme and presentation settings of the base
+deck (by default the first source in the manifest). Each source is opened
+once and released before the next one is read, and every copied slide is
+written to the output package as soon as it is imported, together with the
+parts it owns (notes, charts, media). Memory therefore stays bounded by the
+base deck plus the largest source; only masters, layouts and the
+presentation part are kept until the end. Slide masters, layouts and media
+that are identical across sources (same content hash, including the parts
+they reference) are stored once in the output, and masters and layouts of
+the base deck that no output slide uses are left out.
+"""
+
+import argparse
+import gc
+import hashlib
+import json
+import sys
+import zipfile
+from copy import deepcopy
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from pptx import Presentation
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.oxml import serialize_part_xml
+from pptx.opc.package import XmlPart
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from pptx.opc.serialized import _ContentTypesItem
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import qn
+from pptx.oxml.xmlchemy import OxmlElement
+from rearrange import (
+    R_ATTRS_XPATH,
+    SKIPPED_RELTYPES,
+    PartnameAllocator,
+    remap_rIds,
+)
+
+ManifestEntry = Tuple[Path, int]
+
+# Content-type prefixes of binary parts that are deduplicated by hash
+MEDIA_CONTENT_TYPES = ("image/", "audio/", "video/")
+# Slide master and layout IDs share one number space starting here
+MIN_MASTER_OR_LAYOUT_ID = 2147483648
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Assemble one PowerPoint deck from slides of several source presentations.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python assemble.py manifest.json output.pptx
+    Builds output.pptx from the slides listed in manifest.json, e.g.
+    [{"source": "sales.pptx", "slide": 0}, {"source": "product.pptx", "slide": 4}]
+
+  python assemble.py manifest.json output.pptx --base brand.pptx
+    Uses brand.pptx for slide size and presentation settings
+
+Note: Slide indices are 0-based (first slide is 0, second is 1, etc.)
+        """,
+    )
+    parser.add_argument("manifest", help="JSON list of (source pptx, slide index) entries")
+    parser.add_argument("output", help="Path for output PPTX file")
+    parser.add_argument(
+        "--base",
+        help="Deck providing slide size and presentation settings "
+        "(default: first source in the manifest)",
+    )
+
+    args = parser.parse_args()
+
+    manifest_path = Path(args.manifest)
+    if not manifest_path.exists():
+        print(f"Error: Manifest file not found: {args.manifest}")
+        sys.exit(1)
+
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        manifest = load_manifest(manifest_path)
+        base_path = Path(args.base) if args.base else None
+        assemble_presentation(manifest, output_path, base_path)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error assembling presentation: {e}")
+        sys.exit(1)
+
+
+def load_manifest(manifest_path: Path) -> List[ManifestEntry]:
+    """Load and check a manifest, resolving source paths against its directory.
+
+    Raises:
+        ValueError: If the manifest is malformed or a source file is missing
+    """
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in manifest: {e}")
+
+    if not isinstance(data, list) or not data:
+        raise ValueError("Manifest must be a non-empty JSON list of slides")
+
+    entries = []
+    for i, item in enumerate(data):
+        if isinstance(item, dict):
+            source, index = item.get("source"), item.get("slide")
+        elif isinstance(item, list) and len(item) == 2:
+            source, index = item
+        else:
+            source, index = None, None
+        if not isinstance(source, str) or not isinstance(index, int):
+            raise ValueError(
+                f"Manifest entry {i} must be {{\"source\": <path>, \"slide\": <index>}} "
+                f"or [<path>, <index>], got {item!r}"
+            )
+
+        source_path = manifest_path.parent / source
+        if not source_path.exists():
+            raise ValueError(f"Manifest entry {i}: source file not found: {source}")
+        entries.append((source_path, index))
+
+    return entries
+
+
+class DeckAssembler:
+    """Copy slides from other packages into one destination presentation.
+
+    Slides, and the parts they own (notes, charts, diagrams, embeddings), are
+    always copied. Masters, layouts and media are looked up by content key
+    first and only copied when the destination has no identical part.
+
+    Copied parts other than masters and layouts are complete once their slide
+    is imported; flush() writes them to the output zip and releases their
+    content. save() prunes unused masters and layouts and writes the rest.
+    """
+
+    def __init__(self, base_path: Path):
+        self.prs = Presentation(str(base_path))
+        self.package = self.prs.part.package
+        self.allocator = PartnameAllocator(self.package)
+        self.base_sld_ids = list(self.prs.slides._sldIdLst)
+
+        self._masters = {}  # content key -> destination master part
+        self._layouts = {}  # content key -> destination layout part
+        self._media = {}  # sha256 of blob -> destination media part
+        self._source_parts = {}  # source partname -> destination part (current source)
+        self._keys = {}  # source partname -> content key (current source)
+        self._unflushed = []  # copied parts not yet written to the output
+        self._written = set()  # partnames already written to the output
+        self._used_layouts = set()  # destination layout parts used by imported slides
+
+        # Index the base's own masters, layouts and media so later sources
+        # built from the same template reuse them
+        used_ids = [
+            int(sld_master_id.get("id"))
+            for sld_master_id in self.prs.part._element.xpath(
+                "p:sldMasterIdLst/p:sldMasterId"
+            )
+        ]
+        for master in self.prs.slide_masters:
+            self._masters.setdefault(self._content_key(master.part), master.part)
+            used_ids.extend(
+                int(sld_layout_id.get("id"))
+                for sld_layout_id in master.part._element.xpath(
+                    "p:sldLayoutIdLst/p:sldLayoutId"
+                )
+            )
+            for layout in master.slide_layouts:
+                self._layouts.setdefault(self._content_key(layout.part), layout.part)
+        for part in self.package.iter_parts():
+            if part.content_type.startswith(MEDIA_CONTENT_TYPES):
+                self._media.setdefault(hashlib.sha256(part.blob).hexdigest(), part)
+        self._keys = {}
+
+        self._next_id = max(used_ids + [MIN_MASTER_OR_LAYOUT_ID - 1]) + 1
+
+    def start_source(self) -> None:
+        """Forget per-source lookups before importing from another package."""
+        self._source_parts = {}
+        self._keys = {}
+
+    def import_slide(self, slide):
+        """Append a copy of `slide` (from any package) and return its sldId element."""
+        xml_blobs = []
+        clone, rId_map = self._copy_part(slide.part, {}, xml_blobs)
+
+        # Diagram data refers to its drawing part through the slide's rId
+        for part, element in xml_blobs:
+            if part.content_type == CT.DML_DIAGRAM_DATA:
+                remap_rIds(element, rId_map, "descendant-or-self::*/@relId")
+            part.blob = serialize_part_xml(element)
+
+        self._used_layouts.add(clone.part_related_by(RT.SLIDE_LAYOUT))
+        sld_id_lst = self.prs.slides._sldIdLst
+        return sld_id_lst.add_sldId(self.prs.part.relate_to(clone, RT.SLIDE))
+
+    def flush(self, zip_file: zipfile.ZipFile) -> None:
+        """Write copied slides and the parts they own to `zip_file` and release them.
+
+        The parts stay in the package (with their relationships) so the
+        content types and references to them are still written by save().
+        """
+        for part in self._unflushed:
+            zip_file.writestr(part.partname.membername, part.blob)
+            if part._rels:
+                zip_file.writestr(part.partname.rels_uri.membername, part.rels.xml)
+            self._written.add(part.partname)
+            if isinstance(part, XmlPart):
+                part._element = None
+            else:
+                part._blob = None
+        self._unflushed = []
+
+    def save(self, zip_file: zipfile.ZipFile) -> None:
+        """Prune unused masters and layouts and write the remaining package parts."""
+        self.flush(zip_file)
+        self._prune_masters_and_layouts()
+
+        parts = list(self.package.iter_parts())
+        zip_file.writestr(
+            CONTENT_TYPES_URI.membername,
+            serialize_part_xml(_ContentTypesItem.xml_for(parts)),
+        )
+        zip_file.writestr(PACKAGE_URI.rels_uri.membername, self.package._rels.xml)
+        for part in parts:
+            if part.partname in self._written:
+                continue
+            zip_file.writestr(part.partname.membername, part.blob)
+            if part._rels:
+                zip_file.writestr(part.partname.rels_uri.membername, part.rels.xml)
+
+    def _prune_masters_and_layouts(self) -> None:
+        """Remove layouts no imported slide uses, and masters left without layouts."""
+        prs_part = self.prs.part
+        for sld_master_id in prs_part._element.xpath("p:sldMasterIdLst/p:sldMasterId"):
+            master = prs_part.related_part(sld_master_id.rId)
+            kept = 0
+            for sld_layout_id in master._element.xpath("p:sldLayoutIdLst/p:sldLayoutId"):
+                rId = sld_layout_id.get(qn("r:id"))
+                if master.related_part(rId) in self._used_layouts:
+                    kept += 1
+                    continue
+                sld_layout_id.getparent().remove(sld_layout_id)
+                master.drop_rel(rId)
+            if not kept:
+                sld_master_id.getparent().remove(sld_master_id)
+                prs_part.drop_rel(sld_master_id.rId)
+
+    def _take_id(self) -> str:
+        """Return the next free slide master / slide layout ID."""
+        next_id = self._next_id
+        self._next_id += 1
+        return str(next_id)
+
+    def _content_key(self, part) -> str:
+        """Hash a part together with everything it references.
+
+        Slide masters are hashed without their layout list, so a master
+        matches whichever subset of its layouts was imported. Layouts include
+        their master's key, so identical layouts on different masters stay
+        distinct.
+        """
+        partname = str(part.partname)
+        if partname in self._keys:
+            return self._keys[partname]
+
+        digest = hashlib.sha256(part.content_type.encode())
+        if part.content_type == CT.PML_SLIDE_MASTER:
+            element = deepcopy(part._element)
+            for sld_layout_id_lst in element.findall(qn("p:sldLayoutIdLst")):
+                element.remove(sld_layout_id_lst)
+            digest.update(serialize_part_xml(element))
+        else:
+            digest.update(part.blob)
+
+        for rId, rel in sorted(part.rels.items()):
+            if rel.reltype == RT.SLIDE_LAYOUT:
+                continue
+            digest.update(f"\0{rId}\0{rel.reltype}\0".encode())
+            if rel.is_external:
+                digest.update(rel.target_ref.encode())
+            else:
+                digest.update(self._content_key(rel.target_part).encode())
+
+        self._keys[partname] = digest.hexdigest()
+        return self._keys[partname]
+
+    def _import_part(self, part, clones, xml_blobs):
+        """Return the destination part for a part referenced by a copied part."""
+        partname = str(part.partname)
+        if partname in clones:
+            return clones[partname]
+        if partname in self._source_parts:
+            return self._source_parts[partname]
+
+        content_type = part.content_type
+        if content_type == CT.PML_SLIDE_MASTER:
+            target = self._import_master(part, xml_blobs)
+        elif content_type == CT.PML_SLIDE_LAYOUT:
+            target = self._import_layout(part, xml_blobs)
+        elif content_type == CT.PML_NOTES_MASTER:
+            # Notes slides use the destination's single notes master
+            target = self.prs.part.notes_master_part
+        elif content_type.startswith(MEDIA_CONTENT_TYPES):
+            digest = hashlib.sha256(part.blob).hexdigest()
+            target = self._media.get(digest)
+            if target is None:
+                target, _ = self._copy_part(part, {}, xml_blobs)
+                self._media[digest] = target
+        else:
+            target, _ = self._copy_part(part, clones, xml_blobs)
+            return target
+
+        self._source_parts[partname] = target
+        return target
+
+    def _import_master(self, part, xml_blobs):
+        """Return an identical destination master, copying `part` if there is none."""
+        key = self._content_key(part)
+        master = self._masters.get(key)
+        if master is None:
+            # Layouts are imported one by one as slides need them
+            master, _ = self._copy_part(
+                part, {}, xml_blobs, skip_reltypes={RT.SLIDE_LAYOUT}
+            )
+            for sld_layout_id in master._element.xpath("p:sldLayoutIdLst/p:sldLayoutId"):
+                sld_layout_id.getparent().remove(sld_layout_id)
+
+            sld_master_id = OxmlElement("p:sldMasterId")
+            sld_master_id.set("id", self._take_id())
+            sld_master_id.set(qn("r:id"), self.prs.part.relate_to(master, RT.SLIDE_MASTER))
+            self.prs.part._element.get_or_add_sldMasterIdLst().append(sld_master_id)
+            self._masters[key] = master
+        return master
+
+    def _import_layout(self, part, xml_blobs):
+        """Return an identical destination layout, copying `part` if there is none."""
+        key = self._content_key(part)
+        layout = self._layouts.get(key)
+        if layout is None:
+            layout, _ = self._copy_part(part, {}, xml_blobs)
+
+            master = layout.part_related_by(RT.SLIDE_MASTER)
+            sld_layout_id_lst = master._element.get_or_add_sldLayoutIdLst()
+            sld_layout_id = OxmlElement("p:sldLayoutId")
+            sld_layout_id.set("id", self._take_id())
+            sld_layout_id.set(qn("r:id"), master.relate_to(layout, RT.SLIDE_LAYOUT))
+            sld_layout_id_lst.append(sld_layout_id)
+            self._layouts[key] = layout
+        return layout
+
+    def _copy_part(self, part, clones, xml_blobs, skip_reltypes=frozenset()):
+        """Copy `part` into the destination, importing everything it references.
+
+        `clones` maps source partnames to the copies made for the current
+        slide so a part reachable by several paths (or the slide itself, from
+        its notes) is copied once. Links to other slides cannot be resolved
+        across decks and are dropped.
+
+        Returns a tuple of (copied part, {old rId: new rId}).
+        """
+        partname = self.allocator.next_partname(part.partname)
+        if isinstance(part, XmlPart):
+            element = deepcopy(part._element)
+            clone = type(part)(
+                partname=partname,
+                content_type=part.content_type,
+                package=self.package,
+                element=element,
+            )
+        else:
+            element = None
+            if part.content_type.endswith("xml"):
+                element = parse_xml(part.blob)
+            clone = type(part)(
+                partname=partname,
+                content_type=part.content_type,
+                package=self.package,
+                blob=part.blob,
+            )
+            if element is not None:
+                xml_blobs.append((clone, element))
+        clones[str(part.partname)] = clone
+        if part.content_type not in (CT.PML_SLIDE_MASTER, CT.PML_SLIDE_LAYOUT):
+            self._unflushed.append(clone)
+
+        rId_map = {}
+        dropped = set()
+        for rId, rel in list(part.rels.items()):
+            if rel.reltype in SKIPPED_RELTYPES or rel.reltype in skip_reltypes:
+                continue
+            if rel.is_external:
+                rId_map[rId] = clone.rels.get_or_add_ext_rel(rel.reltype, rel.target_ref)
+                continue
+            if rel.reltype == RT.SLIDE and str(rel.target_part.partname) not in clones:
+                dropped.add(rId)
+                continue
+
+            target = self._import_part(rel.target_part, clones, xml_blobs)
+            rId_map[rId] = clone.relate_to(target, rel.reltype)
+
+        if element is not None:
+            remap_rIds(element, rId_map)
+            if dropped:
+                for attr in element.xpath(R_ATTRS_XPATH):
+                    if str(attr) in dropped:
+                        del attr.getparent().attrib[attr.attrname]
+        return clone, rId_map
+
+
+def assemble_presentation(manifest: List[ManifestEntry], output_path: Path, base_path=None):
+    """
+    Create a presentation from slides of several source decks.
+
+    Args:
+        manifest: List of (source path, slide index) pairs in output order
+        output_path: Path for output PPTX file
+        base_path: Deck providing slide size and presentation settings
+            (default: first source in the manifest)
+    """
+    base_path = Path(base_path or manifest[0][0])
+    assembler = DeckAssembler(base_path)
+
+    # Group positions by source so each deck is opened once
+    positions: Dict[Path, List[Tuple[int, int]]] = {}
+    for position, (source_path, slide_index) in enumerate(manifest):
+        positions.setdefault(Path(source_path), []).append((position, slide_index))
+
+    final_order = [None] * len(manifest)
+    print(f"Assembling {len(manifest)} slides from {len(positions)} source(s)...")
+    try:
+        with zipfile.ZipFile(output_path, "w", compression=zipfile.ZIP_DEFLATED) as zip_file:
+            _import_sources(assembler, positions, base_path, final_order, zip_file)
+
+            # Drop the base deck's own slides; any that were used have been copied
+            sld_id_lst = assembler.prs.slides._sldIdLst
+            for sld_id in assembler.base_sld_ids:
+                assembler.prs.part.drop_rel(sld_id.rId)
+            for sld_id in list(sld_id_lst):
+                sld_id_lst.remove(sld_id)
+            sld_id_lst.extend(final_order)
+
+            assembler.save(zip_file)
+    except BaseException:
+        Path(output_path).unlink(missing_ok=True)
+        raise
+
+    print(f"\nSaved assembled presentation to: {output_path}")
+    print(f"Final presentation has {len(assembler.prs.slides)} slides")
+
+
+def _import_sources(assembler, positions, base_path, final_order, zip_file):
+    """Import each source's slides in turn, writing them to `zip_file` as they are copied."""
+    base_slide_width = assembler.prs.slide_width
+    base_slide_height = assembler.prs.slide_height
+    for source_path, entries in positions.items():
+        assembler.start_source()
+        if source_path.resolve() == base_path.resolve():
+            prs = assembler.prs
+            slides = [sld_id.rId for sld_id in assembler.base_sld_ids]
+            slides = [prs.part.related_part(rId).slide for rId in slides]
+        else:
+            prs = Presentation(str(source_path))
+            slides = list(prs.slides)
+            if (prs.slide_width, prs.slide_height) != (base_slide_width, base_slide_height):
+                print(f"  Warning: {source_path} has a different slide size than the base deck")
+
+        for position, slide_index in entries:
+            if slide_index < 0 or slide_index >= len(slides):
+                raise ValueError(
+                    f"Slide index {slide_index} out of range for {source_path} "
+                    f"(0-{len(slides) - 1})"
+                )
+            final_order[position] = assembler.import_slide(slides[slide_index])
+            assembler.flush(zip_file)
+        print(f"  {source_path}: {len(entries)} slide(s)")
+
+        # Release the source before opening the next one
+        del prs, slides
+        assembler.start_source()
+        gc.collect()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,534 @@
+#!/usr/bin/env python3
+"""
+Benchmark the pptx scripts on generated decks.
+
+Generates a synthetic presentation with python-pptx and times each stage of
+the toolchain on it:
+
+    load       Presentation() of the deck
+    inventory  extract_text_inventory (full measurement)
+    wrap       ShapeData measurement only (text parsing, wrapping, overflow)
+    overlap    detect_overlaps on already-measured shapes
+    replace    replace_shape_text + check_replaced_shapes for every shape
+    save       Presentation.save()
+    rearrange  rearrange_presentation with reordering and duplicates
+    render     thumbnail conversion and grid creation (needs soffice and pdftoppm)
+
+Each stage runs in a fresh process, so its peak RSS is not inflated by
+earlier stages. Setup (loading the deck, building inputs) is not timed, and
+its memory is reported separately as the baseline RSS: on Linux the peak
+counter is reset before the stage runs, elsewhere the stage peak may include
+setup. Subprocesses a stage starts (inventory workers, soffice, pdftoppm)
+are reported as the peak RSS of the largest child. Results are written as
+JSON for tracking over time.
+
+Usage:
+    python benchmark.py results.json [--slides N] [--shapes N] [--paragraphs N]
+                        [--group-depth N] [--media N] [--repeat N] [--profile]
+                        [--stages load,inventory,...] [--deck existing.pptx]
+"""
+
+import argparse
+import cProfile
+import io
+import json
+import multiprocessing
+import os
+import platform
+import pstats
+import resource
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from PIL import Image
+from pptx import Presentation
+from pptx.util import Inches, Pt
+
+STAGES = [
+    "load",
+    "inventory",
+    "wrap",
+    "overlap",
+    "replace",
+    "save",
+    "rearrange",
+    "render",
+]
+PROFILE_TOP_N = 25  # Functions kept per stage profile, by cumulative time
+LOREM = (
+    "Lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod "
+    "tempor incididunt ut labore et dolore magna aliqua ut enim ad minim veniam"
+).split()
+
+StageResult = Dict[str, Any]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the pptx scripts on generated decks.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python benchmark.py results.json
+    Benchmarks every stage on a 50-slide generated deck
+
+  python benchmark.py results.json --slides 300 --shapes 12 --group-depth 3 --repeat 3
+    Larger deck with nested groups; each stage timed 3 times
+
+  python benchmark.py results.json --stages inventory,replace --profile
+    Only the given stages, with a per-function profile of each
+
+  python benchmark.py results.json --deck customer.pptx
+    Benchmarks an existing deck instead of generating one
+        """,
+    )
+    parser.add_argument("output", help="Output JSON file for results")
+    parser.add_argument("--slides", type=int, default=50, help="Slides (default: 50)")
+    parser.add_argument(
+        "--shapes", type=int, default=6, help="Text boxes per slide (default: 6)"
+    )
+    parser.add_argument(
+        "--paragraphs", type=int, default=3, help="Paragraphs per text box (default: 3)"
+    )
+    parser.add_argument(
+        "--group-depth",
+        type=int,
+        default=1,
+        help="Nesting depth of the group shape on each slide (default: 1, 0 = no groups)",
+    )
+    parser.add_argument(
+        "--media", type=int, default=1, help="Distinct images per slide (default: 1)"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=1, help="Timed runs per stage (default: 1)"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=f"Include the top {PROFILE_TOP_N} functions by cumulative time per stage",
+    )
+    parser.add_argument(
+        "--stages",
+        default=",".join(STAGES),
+        help="Comma-separated stages to run (default: all)",
+    )
+    parser.add_argument("--deck", help="Benchmark this deck instead of generating one")
+
+    args = parser.parse_args()
+
+    stages = [stage.strip() for stage in args.stages.split(",") if stage.strip()]
+    unknown = [stage for stage in stages if stage not in STAGES]
+    if unknown:
+        print(f"Error: Unknown stage(s): {', '.join(unknown)}")
+        print(f"Available stages: {', '.join(STAGES)}")
+        sys.exit(1)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        work_dir = Path(temp_dir)
+        if args.deck:
+            deck_path = Path(args.deck)
+            if not deck_path.exists():
+                print(f"Error: Deck not found: {args.deck}")
+                sys.exit(1)
+            params: Dict[str, Any] = {"deck": str(deck_path)}
+        else:
+            deck_path = work_dir / "generated.pptx"
+            params = {
+                "slides": args.slides,
+                "shapes": args.shapes,
+                "paragraphs": args.paragraphs,
+                "group_depth": args.group_depth,
+                "media": args.media,
+            }
+            print(f"Generating deck: {params}")
+            generate_deck(deck_path, **params)
+        params["deck_bytes"] = deck_path.stat().st_size
+
+        results = run_benchmark(deck_path, work_dir, stages, args.repeat, args.profile)
+
+    report = {
+        "params": params,
+        "environment": environment_info(),
+        "repeat": args.repeat,
+        "stages": results,
+    }
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    print(f"\n{'stage':<10} {'wall (s)':>10} {'peak RSS (MB)':>14}")
+    for stage, result in results.items():
+        if "skipped" in result:
+            print(f"{stage:<10} {'skipped':>10}   ({result['skipped']})")
+        else:
+            print(f"{stage:<10} {result['wall_s']:>10.3f} {result['peak_rss_mb']:>14.1f}")
+    print(f"\nResults saved to: {args.output}")
+
+
+def _image_bytes(seed: int) -> bytes:
+    """A small PNG whose content depends on seed, so images do not dedupe."""
+    img = Image.new("RGB", (64, 48), ((seed * 37) % 256, (seed * 91) % 256, seed % 256))
+    buffer = io.BytesIO()
+    img.save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def _words(count: int, offset: int) -> str:
+    return " ".join(LOREM[(offset + i) % len(LOREM)] for i in range(count))
+
+
+def generate_deck(
+    output_path: Path,
+    slides: int = 50,
+    shapes: int = 6,
+    paragraphs: int = 3,
+    group_depth: int = 1,
+    media: int = 1,
+) -> None:
+    """Generate a synthetic deck for benchmarking.
+
+    Every slide gets a title, `shapes` text boxes with `paragraphs`
+    paragraphs of varying length (some long enough to wrap or overflow),
+    one text box nested `group_depth` groups deep, and `media` distinct
+    images.
+    """
+    prs = Presentation()
+    layout = prs.slide_layouts[5]  # Title Only
+    cols = 3
+    for slide_idx in range(slides):
+        slide = prs.slides.add_slide(layout)
+        slide.shapes.title.text = f"Benchmark slide {slide_idx}"
+
+        for shape_idx in range(shapes):
+            row, col = divmod(shape_idx, cols)
+            textbox = slide.shapes.add_textbox(
+                Inches(0.5 + col * 3.1), Inches(1.6 + row * 1.3), Inches(3), Inches(1.2)
+            )
+            text_frame = textbox.text_frame
+            text_frame.word_wrap = True
+            for para_idx in range(paragraphs):
+                paragraph = (
+                    text_frame.paragraphs[0] if para_idx == 0 else text_frame.add_paragraph()
+                )
+                paragraph.text = _words(
+                    4 + (slide_idx + shape_idx + para_idx) % 24, shape_idx + para_idx
+                )
+                paragraph.font.size = Pt(12 + (para_idx % 3) * 2)
+
+        if group_depth > 0:
+            group = slide.shapes.add_group_shape()
+            for _ in range(group_depth - 1):
+                group = group.shapes.add_group_shape()
+            textbox = group.shapes.add_textbox(
+                Inches(6.5), Inches(6.2), Inches(3), Inches(0.8)
+            )
+            textbox.text_frame.text = _words(6, slide_idx)
+
+        for media_idx in range(media):
+            image = io.BytesIO(_image_bytes(slide_idx * max(media, 1) + media_idx))
+            slide.shapes.add_picture(
+                image, Inches(0.2 + media_idx * 0.4), Inches(0.2), Inches(0.35)
+            )
+
+    prs.save(str(output_path))
+
+
+# Each stage setup takes (deck_path, work_dir) and returns the callable to time
+
+
+def _setup_load(deck_path: Path, work_dir: Path) -> Callable[[], Any]:
+    return lambda: Presentation(str(deck_path))
+
+
+def _setup_inventory(deck_path: Path, work_dir: Path) -> Callable[[], Any]:
+    from inventory import extract_text_inventory
+
+    return lambda: extract_text_inventory(deck_path)
+
+
+def _collect_positioned_shapes(prs) -> List[List[Any]]:
+    from inventory import collect_shapes_with_absolute_positions
+
+    slides = []
+    for slide in prs.slides:
+        positioned = []
+        for shape in slide.shapes:
+            positioned.extend(collect_shapes_with_absolute_positions(shape))
+        slides.append((slide, positioned))
+    return slides
+
+
+def _setup_wrap(deck_path: Path, work_dir: Path) -> Callable[[], Any]:
+    from inventory import ShapeData
+
+    slides = _collect_positioned_shapes(Presentation(str(deck_path)))
+
+    def run():
+        for slide, positioned in slides:
+            for swp in positioned:
+                ShapeData(swp.shape, swp.absolute_left, swp.absolute_top, slide)
+
+    return run
+
+
+def _setup_overlap(deck_path: Path, work_dir: Path) -> Callable[[], Any]:
+    from inventory import ShapeData, detect_overlaps, sort_shapes_by_position
+
+    measured = []
+    for slide, positioned in _collect_positioned_shapes(Presentation(str(deck_path))):
+        shape_data = sort_shapes_by_position(
+            [
+                ShapeData(swp.shape, swp.absolute_left, swp.absolute_top, slide)
+                for swp in positioned
+            ]
+        )
+        for idx, data in enumerate(shape_data):
+            data.shape_id = f"shape-{idx}"
+        measured.append(shape_data)
+
+    def run():
+        for shape_data in measured:
+            if len(shape_data) > 1:
+                detect_overlaps(shape_data)
+
+    return run
+
+
+def _setup_replace(deck_path: Path, work_dir: Path) -> Callable[[], Any]:
+    from inventory import extract_text_inventory
+    from replace import check_replaced_shapes, detect_frame_overflow, replace_shape_text
+
+    prs = Presentation(str(deck_path))
+    shape_table: Dict[str, Any] = {}
+    inventory = extract_text_inventory(deck_path, prs, shape_table=shape_table)
+    original_overflow = detect_frame_overflow(inventory)
+    replacements = {
+        slide_key: {
+            shape_key: {
+                "paragraphs": [
+                    {"text": f"Replaced {slide_key} {shape_key} {_words(8, i)}"}
+                    for i in range(2)
+                ]
+            }
+            for shape_key in shapes
+        }
+        for slide_key, shapes in inventory.items()
+    }
+
+    def run():
+        _, replaced_shapes = replace_shape_text(prs, inventory, shape_table, replacements)
+        check_replaced_shapes(original_overflow, replaced_shapes)
+
+    return run
+
+
+def _setup_save(deck_path: Path, work_dir: Path) -> Callable[[], Any]:
+    prs = Presentation(str(deck_path))
+    return lambda: prs.save(str(work_dir / "saved.pptx"))
+
+
+def _setup_rearrange(deck_path: Path, work_dir: Path) -> Callable[[], Any]:
+    from rearrange import rearrange_presentation
+
+    total = len(Presentation(str(deck_path)).slides)
+    # Reverse the deck, duplicate every fifth slide and drop every seventh
+    sequence = []
+    for idx in reversed(range(total)):
+        if idx % 7 == 6:
+            continue
+        sequence.extend([idx, idx] if idx % 5 == 0 else [idx])
+
+    return lambda: rearrange_presentation(
+        deck_path, work_dir / "rearranged.pptx", sequence
+    )
+
+
+def _setup_render(deck_path: Path, work_dir: Path) -> Callable[[], Any]:
+    from thumbnail import (
+        CONVERSION_DPI,
+        DEFAULT_COLS,
+        THUMBNAIL_WIDTH,
+        convert_to_images,
+        create_grids,
+    )
+
+    def run():
+        render_dir = Path(tempfile.mkdtemp(dir=work_dir))
+        images = convert_to_images(deck_path, render_dir, CONVERSION_DPI)
+        create_grids(images, DEFAULT_COLS, THUMBNAIL_WIDTH, render_dir / "grid.jpg")
+
+    return run
+
+
+STAGE_SETUPS = {
+    "load": _setup_load,
+    "inventory": _setup_inventory,
+    "wrap": _setup_wrap,
+    "overlap": _setup_overlap,
+    "replace": _setup_replace,
+    "save": _setup_save,
+    "rearrange": _setup_rearrange,
+    "render": _setup_render,
+}
+
+
+def _rusage_peak_rss_mb(who: int = resource.RUSAGE_SELF) -> float:
+    """Peak resident set size of this process, or of its largest finished child, in MB."""
+    maxrss = resource.getrusage(who).ru_maxrss
+    # Linux reports KB, macOS reports bytes
+    return maxrss / (1024 * 1024) if sys.platform == "darwin" else maxrss / 1024
+
+
+def _proc_status_mb(field: str) -> float:
+    """A memory field of /proc/self/status (e.g. VmRSS) in MB; raises OSError off Linux."""
+    with open("/proc/self/status", encoding="ascii") as f:
+        for line in f:
+            if line.startswith(f"{field}:"):
+                return int(line.split()[1]) / 1024
+    raise OSError(f"{field} not in /proc/self/status")
+
+
+def _reset_peak_rss() -> float:
+    """Reset this process's peak RSS counter where supported; return the current RSS in MB."""
+    try:
+        with open("/proc/self/clear_refs", "w", encoding="ascii") as f:
+            f.write("5")  # Resets VmHWM to the current RSS
+        return _proc_status_mb("VmRSS")
+    except OSError:
+        return _rusage_peak_rss_mb()
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of this process since _reset_peak_rss() in MB."""
+    try:
+        return _proc_status_mb("VmHWM")
+    except OSError:
+        return _rusage_peak_rss_mb()
+
+
+def _profile_rows(profiler: cProfile.Profile) -> List[Dict[str, Any]]:
+    """Top functions of a profile by cumulative time."""
+    stats = pstats.Stats(profiler)
+    rows = []
+    for (filename, line, name), (_, calls, total, cumulative, _) in stats.stats.items():  # type: ignore
+        rows.append(
+            {
+                "function": f"{Path(filename).name}:{line}({name})",
+                "calls": calls,
+                "total_s": round(total, 6),
+                "cumulative_s": round(cumulative, 6),
+            }
+        )
+    rows.sort(key=lambda row: row["cumulative_s"], reverse=True)
+    return rows[:PROFILE_TOP_N]
+
+
+def _run_stage(stage: str, deck_path: str, work_dir: str, profile: bool) -> StageResult:
+    """Set up and time one stage (runs in a fresh worker process)."""
+    # Benchmarks must measure real work, not cache hits
+    os.environ.pop("PPTX_INVENTORY_CACHE", None)
+    os.environ.pop("PPTX_THUMBNAIL_CACHE", None)
+
+    stage_dir = Path(tempfile.mkdtemp(dir=work_dir, prefix=f"{stage}-"))
+    with redirect_stdout(io.StringIO()):
+        run = STAGE_SETUPS[stage](Path(deck_path), stage_dir)
+        profiler = cProfile.Profile() if profile else None
+        baseline_rss = _reset_peak_rss()
+        children_rss = _rusage_peak_rss_mb(resource.RUSAGE_CHILDREN)
+        start = time.perf_counter()
+        if profiler:
+            profiler.runcall(run)
+        else:
+            run()
+        wall = time.perf_counter() - start
+
+    peak_children_rss = _rusage_peak_rss_mb(resource.RUSAGE_CHILDREN)
+    result: StageResult = {
+        "wall_s": round(wall, 6),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "baseline_rss_mb": round(baseline_rss, 1),
+        # Only children started by the stage raise the high-water mark
+        "children_peak_rss_mb": round(
+            peak_children_rss if peak_children_rss > children_rss else 0.0, 1
+        ),
+    }
+    if profiler:
+        result["profile"] = _profile_rows(profiler)
+    shutil.rmtree(stage_dir, ignore_errors=True)
+    return result
+
+
+def run_benchmark(
+    deck_path: Path, work_dir: Path, stages: List[str], repeat: int = 1, profile: bool = False
+) -> Dict[str, StageResult]:
+    """Time each stage on a deck.
+
+    Every run of every stage happens in a fresh spawned process. The result
+    for each stage holds the median wall time, all run times, the highest
+    peak, baseline (after setup) and largest-child RSS across runs and (with
+    profile) the profile of the first run.
+    """
+    results: Dict[str, StageResult] = {}
+    context = multiprocessing.get_context("spawn")
+    for stage in stages:
+        if stage == "render" and not (shutil.which("soffice") and shutil.which("pdftoppm")):
+            results[stage] = {"skipped": "soffice or pdftoppm not found"}
+            continue
+
+        print(f"Running {stage}...")
+        runs = []
+        for run_idx in range(max(1, repeat)):
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                runs.append(
+                    executor.submit(
+                        _run_stage,
+                        stage,
+                        str(deck_path),
+                        str(work_dir),
+                        profile and run_idx == 0,
+                    ).result()
+                )
+
+        wall_times = [run["wall_s"] for run in runs]
+        results[stage] = {
+            "wall_s": round(statistics.median(wall_times), 6),
+            "runs_s": wall_times,
+            "peak_rss_mb": max(run["peak_rss_mb"] for run in runs),
+            "baseline_rss_mb": max(run["baseline_rss_mb"] for run in runs),
+            "children_peak_rss_mb": max(run["children_peak_rss_mb"] for run in runs),
+        }
+        if profile:
+            results[stage]["profile"] = runs[0]["profile"]
+    return results
+
+
+def environment_info() -> Dict[str, Any]:
+    """Versions and machine details that affect timings."""
+    packages = {}
+    for package in ("python-pptx", "Pillow", "lxml"):
+        try:
+            packages[package] = version(package)
+        except PackageNotFoundError:
+            packages[package] = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "packages": packages,
+        "soffice": shutil.which("soffice") is not None,
+        "pdftoppm": shutil.which("pdftoppm") is not None,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+if __name__ == "__main__":
+    main()
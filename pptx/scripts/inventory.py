@@ -12,28 +12,41 @@ This module provides functionality to:
 
 Classes:
     ParagraphData: Represents a text paragraph with formatting
-    ShapeData: Represents a shape with position and text content
+    ShapeData: Measures a live shape's position, text content and issues
+    ShapeRecord: Immutable, picklable result for one shape (no live shape)
+    InventoryCache: Opt-in on-disk cache of per-slide inventories
 
 Main Functions:
     extract_text_inventory: Extract all text from a presentation
+    extract_slide_inventory: Extract all text from a single slide
+    extract_shape_geometry: Extract only text shape bounding boxes (no measuring)
     save_inventory: Save extracted data to JSON
 
 Usage:
-    python inventory.py input.pptx output.json
+    python inventory.py input.pptx output.json [--workers N] [--cache-dir DIR]
+    python inventory.py input.pptx output.json --geometry-only
 """
 
 import argparse
+import hashlib
 import json
+import os
 import platform
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 
 from PIL import Image, ImageDraw, ImageFont
 from pptx import Presentation
 from pptx.enum.text import PP_ALIGN
 from pptx.shapes.base import BaseShape
+from pptx.shapes.shapetree import SlideShapeFactory
 
 # Type aliases for cleaner signatures
 JsonValue = Union[str, int, float, bool, None]
@@ -42,9 +55,20 @@ ShapeDict = Dict[
     str, Union[str, float, bool, List[ParagraphDict], List[str], Dict[str, Any], None]
 ]
 InventoryData = Dict[
-    str, Dict[str, "ShapeData"]
-]  # Dict of slide_id -> {shape_id -> ShapeData}
+    str, Dict[str, "ShapeRecord"]
+]  # Dict of slide_id -> {shape_id -> ShapeRecord}
+ShapeTable = Dict[
+    str, Dict[str, BaseShape]
+]  # Dict of slide_id -> {shape_id -> live python-pptx shape}
 InventoryDict = Dict[str, Dict[str, ShapeDict]]  # JSON-serializable inventory
+GeometryData = Dict[
+    str, Dict[str, Dict[str, float]]
+]  # Dict of slide_id -> {shape_id -> {left, top, width, height}} in inches
+
+# Bump when ShapeRecord fields or measurement rules change to invalidate caches
+INVENTORY_CACHE_VERSION = 1
+# Environment variable that enables the inventory cache for all callers
+INVENTORY_CACHE_ENV = "PPTX_INVENTORY_CACHE"
 
 
 def main():
@@ -60,6 +84,16 @@ Examples:
   python inventory.py presentation.pptx inventory.json --issues-only
     Extracts only text shapes that have overflow or overlap issues
 
+  python inventory.py large-deck.pptx inventory.json --workers 0
+    Extracts slides in parallel using one worker process per CPU core
+
+  python inventory.py template.pptx inventory.json --cache-dir .inventory-cache
+    Reuses cached results for slides that have not changed since the last run
+
+  python inventory.py template.pptx boxes.json --geometry-only
+    Writes only the position and size of each text shape, skipping fonts,
+    text wrapping and overflow checks
+
 The output JSON includes:
   - All text content organized by slide and shape
   - Correct absolute positions for shapes in groups
@@ -76,6 +110,21 @@ The output JSON includes:
         action="store_true",
         help="Include only text shapes that have overflow or overlap issues",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes for slide extraction (default: 1, 0 = one per CPU core)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help=f"Directory for the per-slide inventory cache (default: ${INVENTORY_CACHE_ENV} if set)",
+    )
+    parser.add_argument(
+        "--geometry-only",
+        action="store_true",
+        help="Output only text shape positions and sizes (fast; no overflow or formatting)",
+    )
 
     args = parser.parse_args()
 
@@ -88,13 +137,43 @@ The output JSON includes:
         print("Error: Input must be a PowerPoint file (.pptx)")
         sys.exit(1)
 
+    if args.geometry_only and args.issues_only:
+        print("Error: --issues-only needs full extraction, not --geometry-only")
+        sys.exit(1)
+
     try:
+        if args.geometry_only:
+            print(f"Extracting text shape geometry from: {args.input}")
+            geometry = extract_shape_geometry(input_path)
+            output_path = Path(args.output)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_path, "w", encoding="utf-8") as f:
+                json.dump(geometry, f, indent=2)
+            print(f"Output saved to: {args.output}")
+            print(
+                f"Found text in {len(geometry)} slides with "
+                f"{sum(len(shapes) for shapes in geometry.values())} text elements"
+            )
+            return
+
         print(f"Extracting text inventory from: {args.input}")
         if args.issues_only:
             print(
                 "Filtering to include only text shapes with issues (overflow/overlap)"
             )
-        inventory = extract_text_inventory(input_path, issues_only=args.issues_only)
+        cache = (
+            InventoryCache(Path(args.cache_dir))
+            if args.cache_dir
+            else InventoryCache.from_env()
+        )
+        inventory = extract_text_inventory(
+            input_path,
+            issues_only=args.issues_only,
+            workers=args.workers,
+            cache=cache,
+        )
+        if cache:
+            print(f"Inventory cache: {cache.hits} hit(s), {cache.misses} miss(es)")
 
         output_path = Path(args.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -133,10 +212,47 @@ class ShapeWithPosition:
     absolute_left: int  # in EMUs
     absolute_top: int  # in EMUs
 
+    @property
+    def left(self) -> float:
+        """Absolute left position in inches, rounded like ShapeData.left."""
+        return round(self.absolute_left / 914400.0, 2)
+
+    @property
+    def top(self) -> float:
+        """Absolute top position in inches, rounded like ShapeData.top."""
+        return round(self.absolute_top / 914400.0, 2)
+
+    @property
+    def width(self) -> float:
+        """Width in inches, rounded like ShapeData.width."""
+        return round((self.shape.width or 0) / 914400.0, 2)
+
+    @property
+    def height(self) -> float:
+        """Height in inches, rounded like ShapeData.height."""
+        return round((self.shape.height or 0) / 914400.0, 2)
+
 
 class ParagraphData:
     """Data structure for paragraph properties extracted from a PowerPoint paragraph."""
 
+    __slots__ = (
+        "text",
+        "bullet",
+        "level",
+        "alignment",
+        "space_before",
+        "space_after",
+        "font_name",
+        "font_size",
+        "bold",
+        "italic",
+        "underline",
+        "color",
+        "theme_color",
+        "line_spacing",
+    )
+
     def __init__(self, paragraph: Any):
         """Initialize from a PowerPoint paragraph object.
 
@@ -262,6 +378,16 @@ class ParagraphData:
 
         return result
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ParagraphData":
+        """Rebuild from a dictionary produced by to_dict()."""
+        para = cls.__new__(cls)
+        for name in cls.__slots__:
+            setattr(para, name, data.get(name))
+        para.text = data.get("text", "")
+        para.bullet = bool(data.get("bullet", False))
+        return para
+
 
 class ShapeData:
     """Data structure for shape properties extracted from a PowerPoint shape."""
@@ -277,17 +403,41 @@ class ShapeData:
         return int(inches * dpi)
 
     @staticmethod
+    def get_font_dirs() -> Tuple[List[str], List[str]]:
+        """Get the font directories and file extensions searched on this platform.
+
+        Returns:
+            Tuple of (font_dirs, extensions)
+        """
+        if platform.system() == "Darwin":  # macOS
+            font_dirs = [
+                "/System/Library/Fonts/",
+                "/Library/Fonts/",
+                "~/Library/Fonts/",
+            ]
+            extensions = [".ttf", ".otf", ".ttc", ".dfont"]
+        else:  # Linux
+            font_dirs = [
+                "/usr/share/fonts/truetype/",
+                "/usr/local/share/fonts/",
+                "~/.fonts/",
+            ]
+            extensions = [".ttf", ".otf"]
+        return font_dirs, extensions
+
+    @staticmethod
+    @lru_cache(maxsize=None)
     def get_font_path(font_name: str) -> Optional[str]:
         """Get the font file path for a given font name.
 
+        Lookups are memoized for the life of the process.
+
         Args:
             font_name: Name of the font (e.g., 'Arial', 'Calibri')
 
         Returns:
             Path to the font file, or None if not found
         """
-        system = platform.system()
-
         # Common font file variations to try
         font_variations = [
             font_name,
@@ -297,24 +447,9 @@ class ShapeData:
         ]
 
         # Define font directories and extensions by platform
-        if system == "Darwin":  # macOS
-            font_dirs = [
-                "/System/Library/Fonts/",
-                "/Library/Fonts/",
-                "~/Library/Fonts/",
-            ]
-            extensions = [".ttf", ".otf", ".ttc", ".dfont"]
-        else:  # Linux
-            font_dirs = [
-                "/usr/share/fonts/truetype/",
-                "/usr/local/share/fonts/",
-                "~/.fonts/",
-            ]
-            extensions = [".ttf", ".otf"]
+        font_dirs, extensions = ShapeData.get_font_dirs()
 
         # Try to find the font file
-        from pathlib import Path
-
         for font_dir in font_dirs:
             font_dir_path = Path(font_dir).expanduser()
             if not font_dir_path.exists():
@@ -461,21 +596,27 @@ class ShapeData:
             str, float
         ] = {}  # Dict of shape_id -> overlap area in sq inches
         self.warnings: List[str] = []
+
+        # Paragraphs with text are parsed once and shared by overflow
+        # estimation and the final ShapeRecord.
+        # Each entry is (index in text frame, raw text, ParagraphData).
+        self._text_paragraphs: List[Tuple[int, str, ParagraphData]] = []
+        if hasattr(shape, "text_frame") and shape.text_frame:  # type: ignore
+            for para_idx, paragraph in enumerate(shape.text_frame.paragraphs):  # type: ignore
+                text = paragraph.text
+                if text.strip():
+                    self._text_paragraphs.append(
+                        (para_idx, text, ParagraphData(paragraph))
+                    )
+
         self._estimate_frame_overflow()
         self._calculate_slide_overflow()
         self._detect_bullet_issues()
 
     @property
     def paragraphs(self) -> List[ParagraphData]:
-        """Calculate paragraphs from the shape's text frame."""
-        if not self.shape or not hasattr(self.shape, "text_frame"):
-            return []
-
-        paragraphs = []
-        for paragraph in self.shape.text_frame.paragraphs:  # type: ignore
-            if paragraph.text.strip():
-                paragraphs.append(ParagraphData(paragraph))
-        return paragraphs
+        """Paragraphs with text from the shape's text frame."""
+        return [para_data for _, _, para_data in self._text_paragraphs]
 
     def _get_default_font_size(self) -> int:
         """Get default font size from theme text styles or use conservative default."""
@@ -565,7 +706,7 @@ class ShapeData:
             return
 
         text_frame = self.shape.text_frame  # type: ignore
-        if not text_frame or not text_frame.paragraphs:
+        if not text_frame or not self._text_paragraphs:
             return
 
         # Get usable dimensions after accounting for margins
@@ -583,12 +724,7 @@ class ShapeData:
         # Calculate total height of all paragraphs
         total_height_px = 0
 
-        for para_idx, paragraph in enumerate(text_frame.paragraphs):
-            if not paragraph.text.strip():
-                continue
-
-            para_data = ParagraphData(paragraph)
-
+        for para_idx, text, para_data in self._text_paragraphs:
             # Load font for this paragraph
             font_name = para_data.font_name or "Arial"
             font_size = int(para_data.font_size or default_font_size)
@@ -605,7 +741,7 @@ class ShapeData:
 
             # Wrap all lines in this paragraph
             all_wrapped_lines = []
-            for line in paragraph.text.split("\n"):
+            for line in text.split("\n"):
                 wrapped = self._wrap_text_line(line, usable_width_px, draw, font)
                 all_wrapped_lines.extend(wrapped)
 
@@ -659,18 +795,11 @@ class ShapeData:
 
     def _detect_bullet_issues(self) -> None:
         """Detect bullet point formatting issues in paragraphs."""
-        if not self.shape or not hasattr(self.shape, "text_frame"):
-            return
-
-        text_frame = self.shape.text_frame  # type: ignore
-        if not text_frame or not text_frame.paragraphs:
-            return
-
         # Common bullet symbols that indicate manual bullets
         bullet_symbols = ["•", "●", "○"]
 
-        for paragraph in text_frame.paragraphs:
-            text = paragraph.text.strip()
+        for _, _, para_data in self._text_paragraphs:
+            text = para_data.text
             # Check for manual bullet symbols
             if text and any(text.startswith(symbol + " ") for symbol in bullet_symbols):
                 self.warnings.append(
@@ -678,6 +807,147 @@ class ShapeData:
                 )
                 break
 
+    def to_record(self) -> "ShapeRecord":
+        """Freeze the measured data into a ShapeRecord without the live shape."""
+        return ShapeRecord(
+            shape_id=self.shape_id,
+            left=self.left,
+            top=self.top,
+            width=self.width,
+            height=self.height,
+            placeholder_type=self.placeholder_type,
+            default_font_size=self.default_font_size,
+            frame_overflow_bottom=self.frame_overflow_bottom,
+            slide_overflow_right=self.slide_overflow_right,
+            slide_overflow_bottom=self.slide_overflow_bottom,
+            overlapping_shapes=dict(self.overlapping_shapes),
+            warnings=tuple(self.warnings),
+            paragraphs=tuple(self.paragraphs),
+        )
+
+
+class ShapeRecord:
+    """Immutable record of a text shape, detached from the live python-pptx shape.
+
+    Records are compact (__slots__) and picklable, so inventories can be
+    sent across processes and cached. Paragraphs are computed once when the
+    record is built. Callers that need to mutate shapes should pass a
+    ShapeTable to extract_text_inventory to receive the live shapes.
+    """
+
+    __slots__ = (
+        "shape_id",
+        "left",
+        "top",
+        "width",
+        "height",
+        "placeholder_type",
+        "default_font_size",
+        "frame_overflow_bottom",
+        "slide_overflow_right",
+        "slide_overflow_bottom",
+        "overlapping_shapes",
+        "warnings",
+        "paragraphs",
+    )
+
+    shape_id: str
+    left: float
+    top: float
+    width: float
+    height: float
+    placeholder_type: Optional[str]
+    default_font_size: Optional[float]
+    frame_overflow_bottom: Optional[float]
+    slide_overflow_right: Optional[float]
+    slide_overflow_bottom: Optional[float]
+    overlapping_shapes: Mapping[str, float]  # shape_id -> overlap area in sq inches (read-only)
+    warnings: Tuple[str, ...]
+    paragraphs: Tuple[ParagraphData, ...]
+
+    def __init__(
+        self,
+        shape_id: str,
+        left: float,
+        top: float,
+        width: float,
+        height: float,
+        placeholder_type: Optional[str] = None,
+        default_font_size: Optional[float] = None,
+        frame_overflow_bottom: Optional[float] = None,
+        slide_overflow_right: Optional[float] = None,
+        slide_overflow_bottom: Optional[float] = None,
+        overlapping_shapes: Optional[Mapping[str, float]] = None,
+        warnings: Tuple[str, ...] = (),
+        paragraphs: Tuple[ParagraphData, ...] = (),
+    ):
+        values = (
+            shape_id,
+            left,
+            top,
+            width,
+            height,
+            placeholder_type,
+            default_font_size,
+            frame_overflow_bottom,
+            slide_overflow_right,
+            slide_overflow_bottom,
+            MappingProxyType(dict(overlapping_shapes or {})),
+            tuple(warnings),
+            tuple(paragraphs),
+        )
+        for name, value in zip(self.__slots__, values):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"ShapeRecord is immutable (cannot set '{name}')")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"ShapeRecord is immutable (cannot delete '{name}')")
+
+    def __reduce__(self):
+        """Pickle through the constructor, since attributes cannot be set.
+
+        The read-only overlap mapping is passed as a plain dict (mappingproxy
+        cannot be pickled); the constructor wraps it again.
+        """
+        values = [getattr(self, name) for name in self.__slots__]
+        values[self.__slots__.index("overlapping_shapes")] = dict(
+            self.overlapping_shapes
+        )
+        return (ShapeRecord, tuple(values))
+
+    @classmethod
+    def from_dict(cls, shape_id: str, data: Dict[str, Any]) -> "ShapeRecord":
+        """Rebuild from a dictionary produced by to_dict()."""
+        overflow = data.get("overflow", {})
+        slide_overflow = overflow.get("slide", {})
+        return cls(
+            shape_id=shape_id,
+            left=data["left"],
+            top=data["top"],
+            width=data["width"],
+            height=data["height"],
+            placeholder_type=data.get("placeholder_type"),
+            default_font_size=data.get("default_font_size"),
+            frame_overflow_bottom=overflow.get("frame", {}).get("overflow_bottom"),
+            slide_overflow_right=slide_overflow.get("overflow_right"),
+            slide_overflow_bottom=slide_overflow.get("overflow_bottom"),
+            overlapping_shapes=MappingProxyType(
+                dict(data.get("overlap", {}).get("overlapping_shapes", {}))
+            ),
+            warnings=tuple(data.get("warnings", ())),
+            paragraphs=tuple(
+                ParagraphData.from_dict(para) for para in data.get("paragraphs", ())
+            ),
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"ShapeRecord({self.shape_id!r}, left={self.left}, top={self.top}, "
+            f"width={self.width}, height={self.height})"
+        )
+
     @property
     def has_any_issues(self) -> bool:
         """Check if shape has any issues (overflow, overlap, or warnings)."""
@@ -727,11 +997,11 @@ class ShapeData:
 
         # Add overlap field if there are overlapping shapes
         if self.overlapping_shapes:
-            result["overlap"] = {"overlapping_shapes": self.overlapping_shapes}
+            result["overlap"] = {"overlapping_shapes": dict(self.overlapping_shapes)}
 
         # Add warnings field if there are warnings
         if self.warnings:
-            result["warnings"] = self.warnings
+            result["warnings"] = list(self.warnings)
 
         # Add paragraphs after placeholder_type
         result["paragraphs"] = [para.to_dict() for para in self.paragraphs]
@@ -816,10 +1086,12 @@ def collect_shapes_with_absolute_positions(
     return []
 
 
-def sort_shapes_by_position(shapes: List[ShapeData]) -> List[ShapeData]:
+def sort_shapes_by_position(shapes: List[Any]) -> List[Any]:
     """Sort shapes by visual position (top-to-bottom, left-to-right).
 
-    Shapes within 0.5 inches vertically are considered on the same row.
+    Accepts ShapeData or ShapeWithPosition objects (anything with top and
+    left in inches). Shapes within 0.5 inches vertically are considered
+    on the same row.
     """
     if not shapes:
         return shapes
@@ -911,65 +1183,365 @@ def detect_overlaps(shapes: List[ShapeData]) -> None:
                 shape2.overlapping_shapes[shape1.shape_id] = overlap_area
 
 
-def extract_text_inventory(
-    pptx_path: Path, prs: Optional[Any] = None, issues_only: bool = False
-) -> InventoryData:
-    """Extract text content from all slides in a PowerPoint presentation.
+@lru_cache(maxsize=None)
+def font_index_version() -> str:
+    """Fingerprint the font directories searched by ShapeData.get_font_path.
+
+    A directory's modification time changes when fonts are added to or
+    removed from it, which can change text measurement and therefore the
+    overflow results stored in the inventory cache.
+    """
+    font_dirs, _ = ShapeData.get_font_dirs()
+    digest = hashlib.sha256()
+    for font_dir in font_dirs:
+        font_dir_path = Path(font_dir).expanduser()
+        try:
+            mtime = font_dir_path.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        digest.update(f"{font_dir_path}:{mtime};".encode())
+    return digest.hexdigest()[:16]
+
+
+class InventoryCache:
+    """Opt-in on-disk cache of per-slide inventories.
+
+    Entries are keyed by a hash of the slide part, its layout and master,
+    the slide size and the font index version, so editing a slide (or
+    anything it inherits from) produces a new key and only that slide is
+    re-measured. Each entry stores the unfiltered slide inventory as JSON
+    in the same shape that to_dict() produces.
+    """
+
+    def __init__(self, cache_dir: Path):
+        """Initialize the cache, creating cache_dir if needed.
+
+        Args:
+            cache_dir: Directory holding one JSON file per cached slide
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls) -> Optional["InventoryCache"]:
+        """Create a cache from the PPTX_INVENTORY_CACHE environment variable, if set."""
+        cache_dir = os.environ.get(INVENTORY_CACHE_ENV)
+        return cls(Path(cache_dir)) if cache_dir else None
+
+    def slide_keys(self, prs: Any) -> List[str]:
+        """Compute the cache key of every slide in a presentation."""
+        # Layouts and masters are shared by many slides; hash each once
+        part_digests: Dict[str, bytes] = {}
+
+        def part_digest(part: Any) -> bytes:
+            if part.partname not in part_digests:
+                part_digests[part.partname] = hashlib.sha256(part.blob).digest()
+            return part_digests[part.partname]
+
+        prefix = (
+            f"{INVENTORY_CACHE_VERSION}:{font_index_version()}:"
+            f"{prs.slide_width}x{prs.slide_height}"
+        ).encode()
+
+        keys = []
+        for slide in prs.slides:
+            layout = slide.slide_layout
+            digest = hashlib.sha256(prefix)
+            digest.update(hashlib.sha256(slide.part.blob).digest())
+            digest.update(part_digest(layout.part))
+            digest.update(part_digest(layout.slide_master.part))
+            keys.append(digest.hexdigest())
+        return keys
+
+    def get(self, key: str) -> Optional[Dict[str, ShapeRecord]]:
+        """Load a cached slide inventory, or None on a miss."""
+        try:
+            with open(self.cache_dir / f"{key}.json", "r", encoding="utf-8") as f:
+                data = json.load(f)
+            slide_inventory = {
+                shape_id: ShapeRecord.from_dict(shape_id, shape_dict)
+                for shape_id, shape_dict in data.items()
+            }
+        except (OSError, ValueError, KeyError, AttributeError, TypeError):
+            # Missing or unreadable entries are recomputed
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return slide_inventory
+
+    def put(self, key: str, slide_inventory: Dict[str, ShapeRecord]) -> None:
+        """Store a slide inventory, writing atomically so readers never see partial files."""
+        data = {
+            shape_id: record.to_dict() for shape_id, record in slide_inventory.items()
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_dir / f"{key}.json")
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+def measure_detached_shape(shape: BaseShape, slide: Any) -> ShapeData:
+    """Measure a live shape's text on a detached copy of its XML.
+
+    Reading font colors through python-pptx adds empty <a:solidFill/>
+    elements, so measuring the live shape would modify the presentation.
+    The copy keeps the shape's parent, so placeholder inheritance from the
+    layout and master still applies.
+
+    Positions are the shape's own (group offsets are not applied), which
+    does not affect frame overflow or paragraph warnings.
+    """
+    detached = SlideShapeFactory(deepcopy(shape.element), shape._parent)  # type: ignore
+    return ShapeData(detached, slide=slide)
+
+
+def collect_slide_shapes(slide: Any) -> Dict[str, BaseShape]:
+    """Locate a slide's text shapes by inventory ID without measuring them.
+
+    Uses the same collection and visual sort as extract_slide_inventory, so
+    the IDs match an inventory extracted from the same slide.
+
+    Returns a dictionary: {shape-N: live shape}
+    """
+    shapes_with_positions = []
+    for shape in slide.shapes:  # type: ignore
+        shapes_with_positions.extend(collect_shapes_with_absolute_positions(shape))
+
+    sorted_shapes = sort_shapes_by_position(shapes_with_positions)
+    return {f"shape-{idx}": swp.shape for idx, swp in enumerate(sorted_shapes)}
+
+
+def extract_slide_geometry(slide: Any) -> Dict[str, Dict[str, float]]:
+    """Extract the bounding boxes of a slide's text shapes without measuring text.
+
+    Uses the same shape collection and visual sort as extract_slide_inventory,
+    so shape IDs and positions match a full inventory of the slide. Fonts,
+    text wrapping, overflow and overlap detection are skipped, and the slide
+    XML is not modified.
+
+    Returns a dictionary: {shape-N: {left, top, width, height}} in inches.
+    """
+    shapes_with_positions = []
+    for shape in slide.shapes:  # type: ignore
+        shapes_with_positions.extend(collect_shapes_with_absolute_positions(shape))
+
+    sorted_shapes = sort_shapes_by_position(shapes_with_positions)
+    return {
+        f"shape-{idx}": {
+            "left": swp.left,
+            "top": swp.top,
+            "width": swp.width,
+            "height": swp.height,
+        }
+        for idx, swp in enumerate(sorted_shapes)
+    }
+
+
+def extract_shape_geometry(pptx_path: Path, prs: Optional[Any] = None) -> GeometryData:
+    """Extract text shape bounding boxes from all slides, without measuring text.
+
+    This is the lightweight counterpart of extract_text_inventory for callers
+    that only need where text shapes are (e.g. to outline them).
 
     Args:
         pptx_path: Path to the PowerPoint file
         prs: Optional Presentation object to use. If not provided, will load from pptx_path.
-        issues_only: If True, only include shapes that have overflow or overlap issues
 
-    Returns a nested dictionary: {slide-N: {shape-N: ShapeData}}
-    Shapes are sorted by visual position (top-to-bottom, left-to-right).
-    The ShapeData objects contain the full shape information and can be
-    converted to dictionaries for JSON serialization using to_dict().
+    Returns a nested dictionary: {slide-N: {shape-N: {left, top, width, height}}}
+    Slides without text shapes are omitted.
     """
     if prs is None:
         prs = Presentation(str(pptx_path))
-    inventory: InventoryData = {}
 
+    geometry: GeometryData = {}
     for slide_idx, slide in enumerate(prs.slides):
-        # Collect all valid shapes from this slide with absolute positions
-        shapes_with_positions = []
-        for shape in slide.shapes:  # type: ignore
-            shapes_with_positions.extend(collect_shapes_with_absolute_positions(shape))
+        slide_geometry = extract_slide_geometry(slide)
+        if slide_geometry:
+            geometry[f"slide-{slide_idx}"] = slide_geometry
+    return geometry
 
-        if not shapes_with_positions:
+
+def extract_slide_inventory(
+    slide: Any,
+    issues_only: bool = False,
+    shapes: Optional[Dict[str, BaseShape]] = None,
+) -> Dict[str, ShapeRecord]:
+    """Extract text content from a single slide.
+
+    Args:
+        slide: The PowerPoint slide object
+        issues_only: If True, only include shapes that have overflow or overlap issues
+        shapes: Optional dict to fill with {shape-N: live shape} for callers
+            that need to mutate the extracted shapes
+
+    Returns a dictionary: {shape-N: ShapeRecord}, empty if the slide has no text.
+    Shapes are sorted by visual position (top-to-bottom, left-to-right).
+    """
+    # Collect all valid shapes from this slide with absolute positions
+    shapes_with_positions = []
+    for shape in slide.shapes:  # type: ignore
+        shapes_with_positions.extend(collect_shapes_with_absolute_positions(shape))
+
+    if not shapes_with_positions:
+        return {}
+
+    # Convert to ShapeData with absolute positions and slide reference
+    shape_data_list = [
+        ShapeData(
+            swp.shape,
+            swp.absolute_left,
+            swp.absolute_top,
+            slide,
+        )
+        for swp in shapes_with_positions
+    ]
+
+    # Sort by visual position and assign stable IDs in one step
+    sorted_shapes = sort_shapes_by_position(shape_data_list)
+    for idx, shape_data in enumerate(sorted_shapes):
+        shape_data.shape_id = f"shape-{idx}"
+
+    # Detect overlaps using the stable shape IDs
+    if len(sorted_shapes) > 1:
+        detect_overlaps(sorted_shapes)
+
+    # Freeze into records, then filter for issues only if requested
+    # (after overlap detection)
+    slide_inventory = {}
+    for shape_data in sorted_shapes:
+        record = shape_data.to_record()
+        if issues_only and not record.has_any_issues:
             continue
+        slide_inventory[record.shape_id] = record
+        if shapes is not None:
+            shapes[record.shape_id] = shape_data.shape
 
-        # Convert to ShapeData with absolute positions and slide reference
-        shape_data_list = [
-            ShapeData(
-                swp.shape,
-                swp.absolute_left,
-                swp.absolute_top,
-                slide,
-            )
-            for swp in shapes_with_positions
-        ]
+    return slide_inventory
 
-        # Sort by visual position and assign stable IDs in one step
-        sorted_shapes = sort_shapes_by_position(shape_data_list)
-        for idx, shape_data in enumerate(sorted_shapes):
-            shape_data.shape_id = f"shape-{idx}"
 
-        # Detect overlaps using the stable shape IDs
-        if len(sorted_shapes) > 1:
-            detect_overlaps(sorted_shapes)
+# Presentation loaded once per worker process by _init_inventory_worker
+_worker_prs: Optional[Any] = None
 
-        # Filter for issues only if requested (after overlap detection)
-        if issues_only:
-            sorted_shapes = [sd for sd in sorted_shapes if sd.has_any_issues]
 
-        if not sorted_shapes:
+def _init_inventory_worker(pptx_path: str) -> None:
+    """Load the presentation once in each worker process."""
+    global _worker_prs
+    _worker_prs = Presentation(pptx_path)
+
+
+def _extract_slide_in_worker(slide_idx: int) -> Dict[str, ShapeRecord]:
+    """Extract one slide (unfiltered) using the worker's presentation."""
+    assert _worker_prs is not None, "Inventory worker was not initialized"
+    return extract_slide_inventory(_worker_prs.slides[slide_idx])
+
+
+def extract_text_inventory(
+    pptx_path: Path,
+    prs: Optional[Any] = None,
+    issues_only: bool = False,
+    workers: int = 1,
+    shape_table: Optional[ShapeTable] = None,
+    cache: Optional[InventoryCache] = None,
+) -> InventoryData:
+    """Extract text content from all slides in a PowerPoint presentation.
+
+    Args:
+        pptx_path: Path to the PowerPoint file
+        prs: Optional Presentation object to use. If not provided, will load from pptx_path.
+        issues_only: If True, only include shapes that have overflow or overlap issues
+        workers: Number of worker processes to fan slides out to (0 = one per
+            CPU core). Ignored when prs or shape_table is provided, since
+            workers load the presentation from pptx_path and cannot share
+            the caller's shapes.
+        shape_table: Optional dict to fill with {slide-N: {shape-N: live shape}}
+            for callers that need to mutate the extracted shapes
+        cache: Optional InventoryCache serving unchanged slides. Defaults to
+            the cache named by $PPTX_INVENTORY_CACHE, if set.
+
+    Returns a nested dictionary: {slide-N: {shape-N: ShapeRecord}}
+    Shapes are sorted by visual position (top-to-bottom, left-to-right).
+    The ShapeRecord objects hold no reference to the live shapes and can be
+    converted to dictionaries for JSON serialization using to_dict().
+    """
+    use_workers = prs is None and shape_table is None and workers != 1
+    if prs is None:
+        prs = Presentation(str(pptx_path))
+    if cache is None:
+        cache = InventoryCache.from_env()
+
+    slides = list(prs.slides)
+    slide_inventories: List[Optional[Dict[str, ShapeRecord]]] = [None] * len(slides)
+
+    # Serve unchanged slides from the cache. Hash before extracting, since
+    # reading font colors adds empty fill elements to the slide XML.
+    cache_keys: List[str] = []
+    if cache:
+        cache_keys = cache.slide_keys(prs)
+        for slide_idx, key in enumerate(cache_keys):
+            slide_inventories[slide_idx] = cache.get(key)
+    pending = [idx for idx, inv in enumerate(slide_inventories) if inv is None]
+
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(pending))
+
+    # Extract unfiltered so cached entries serve any issues_only setting
+    live_shapes: Dict[int, Dict[str, BaseShape]] = {}
+    if use_workers and workers > 1:
+        # Each worker loads the presentation once; map preserves slide order
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_inventory_worker,
+            initargs=(str(pptx_path),),
+        ) as executor:
+            results = executor.map(
+                _extract_slide_in_worker,
+                pending,
+                chunksize=max(1, len(pending) // (workers * 4)),
+            )
+            for slide_idx, slide_inventory in zip(pending, results):
+                slide_inventories[slide_idx] = slide_inventory
+    else:
+        for slide_idx in pending:
+            live_shapes[slide_idx] = {}
+            slide_inventories[slide_idx] = extract_slide_inventory(
+                slides[slide_idx], shapes=live_shapes[slide_idx]
+            )
+
+    if cache:
+        for slide_idx in pending:
+            cache.put(cache_keys[slide_idx], slide_inventories[slide_idx] or {})
+
+    inventory: InventoryData = {}
+    for slide_idx, slide_inventory in enumerate(slide_inventories):
+        assert slide_inventory is not None
+        if issues_only:
+            slide_inventory = {
+                shape_id: record
+                for shape_id, record in slide_inventory.items()
+                if record.has_any_issues
+            }
+        if not slide_inventory:
             continue
 
-        # Create slide inventory using the stable shape IDs
-        inventory[f"slide-{slide_idx}"] = {
-            shape_data.shape_id: shape_data for shape_data in sorted_shapes
-        }
+        slide_key = f"slide-{slide_idx}"
+        inventory[slide_key] = slide_inventory
+
+        if shape_table is not None:
+            # Cache hits were never measured; locate their shapes by position
+            shapes = live_shapes.get(slide_idx) or collect_slide_shapes(
+                slides[slide_idx]
+            )
+            shape_table[slide_key] = {
+                shape_id: shapes[shape_id] for shape_id in slide_inventory
+            }
 
     return inventory
 
@@ -978,7 +1550,7 @@ def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> Invento
     """Extract text inventory and return as JSON-serializable dictionaries.
 
     This is a convenience wrapper around extract_text_inventory that returns
-    dictionaries instead of ShapeData objects, useful for testing and direct
+    dictionaries instead of ShapeRecord objects, useful for testing and direct
     JSON serialization.
 
     Args:
@@ -990,7 +1562,7 @@ def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> Invento
     """
     inventory = extract_text_inventory(pptx_path, issues_only=issues_only)
 
-    # Convert ShapeData objects to dictionaries
+    # Convert ShapeRecord objects to dictionaries
     dict_inventory: InventoryDict = {}
     for slide_key, shapes in inventory.items():
         dict_inventory[slide_key] = {
@@ -1003,9 +1575,9 @@ def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> Invento
 def save_inventory(inventory: InventoryData, output_path: Path) -> None:
     """Save inventory to JSON file with proper formatting.
 
-    Converts ShapeData objects to dictionaries for JSON serialization.
+    Converts ShapeRecord objects to dictionaries for JSON serialization.
     """
-    # Convert ShapeData objects to dictionaries
+    # Convert ShapeRecord objects to dictionaries
     json_inventory: InventoryDict = {}
     for slide_key, shapes in inventory.items():
         json_inventory[slide_key] = {
@@ -10,13 +10,46 @@ Slides can be repeated (e.g., 34 appears twice).
 """
 
 import argparse
+import re
 import shutil
 import sys
+from collections import Counter, deque
 from copy import deepcopy
 from pathlib import Path
 
-import six
 from pptx import Presentation
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.oxml import serialize_part_xml
+from pptx.opc.package import XmlPart
+from pptx.opc.packuri import PackURI
+from pptx.oxml import parse_xml
+
+# Relationship types whose target parts belong to a single slide. These are
+# copied along with the slide; all other targets (images, media, layouts,
+# linked slides) are shared by reference.
+OWNED_RELTYPES = {
+    RT.NOTES_SLIDE,
+    RT.CHART,
+    RT.CHART_USER_SHAPES,
+    RT.DIAGRAM_DATA,
+    RT.DIAGRAM_LAYOUT,
+    RT.DIAGRAM_QUICK_STYLE,
+    RT.DIAGRAM_COLORS,
+    "http://schemas.microsoft.com/office/2007/relationships/diagramDrawing",
+    "http://schemas.microsoft.com/office/2011/relationships/chartStyle",
+    "http://schemas.microsoft.com/office/2011/relationships/chartColorStyle",
+    RT.PACKAGE,
+    RT.OLE_OBJECT,
+    RT.TAGS,
+}
+# Relationship types that are not carried over to copies
+SKIPPED_RELTYPES = {RT.COMMENTS}
+# Every attribute in the relationships namespace (r:embed, r:link, r:id, r:dm, ...)
+R_ATTRS_XPATH = (
+    "descendant-or-self::*/@*[namespace-uri()="
+    "'http://schemas.openxmlformats.org/officeDocument/2006/relationships']"
+)
 
 
 def main():
@@ -72,84 +105,143 @@ Note: Slide indices are 0-based (first slide is 0, second is 1, etc.)
         sys.exit(1)
 
 
-def duplicate_slide(pres, index):
-    """Duplicate a slide in the presentation."""
-    source = pres.slides[index]
-
-    # Use source's layout to preserve formatting
-    new_slide = pres.slides.add_slide(source.slide_layout)
-
-    # Collect all image and media relationships from the source slide
-    image_rels = {}
-    for rel_id, rel in six.iteritems(source.part.rels):
-        if "image" in rel.reltype or "media" in rel.reltype:
-            image_rels[rel_id] = rel
-
-    # CRITICAL: Clear placeholder shapes to avoid duplicates
-    for shape in new_slide.shapes:
-        sp = shape.element
-        sp.getparent().remove(sp)
-
-    # Copy all shapes from source
-    for shape in source.shapes:
-        el = shape.element
-        new_el = deepcopy(el)
-        new_slide.shapes._spTree.insert_element_before(new_el, "p:extLst")
-
-        # Handle picture shapes - need to update the blip reference
-        # Look for all blip elements (they can be in pic or other contexts)
-        # Using the element's own xpath method without namespaces argument
-        blips = new_el.xpath(".//a:blip[@r:embed]")
-        for blip in blips:
-            old_rId = blip.get(
-                "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed"
-            )
-            if old_rId in image_rels:
-                # Create a new relationship in the destination slide for this image
-                old_rel = image_rels[old_rId]
-                # get_or_add returns the rId directly, or adds and returns new rId
-                new_rId = new_slide.part.rels.get_or_add(
-                    old_rel.reltype, old_rel._target
-                )
-                # Update the blip's embed reference to use the new relationship ID
-                blip.set(
-                    "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed",
-                    new_rId,
+class PartnameAllocator:
+    """Hand out unused partnames without rescanning the package each time."""
+
+    def __init__(self, package):
+        self._used = {str(part.partname) for part in package.iter_parts()}
+        self._next = {}  # template -> next number to try
+
+    def next_partname(self, partname):
+        """Return an unused partname shaped like `partname` (e.g. chart3.xml -> chart7.xml)."""
+        tmpl = re.sub(r"\d*(?=\.[^./]+$)", "%d", str(partname).replace("%", "%%"), 1)
+        n = self._next.get(tmpl, 1)
+        while tmpl % n in self._used:
+            n += 1
+        self._used.add(tmpl % n)
+        self._next[tmpl] = n + 1
+        return PackURI(tmpl % n)
+
+
+def remap_rIds(element, rId_map, attr_xpath=R_ATTRS_XPATH):
+    """Rewrite relationship-ID attributes in one traversal of `element`."""
+    for attr in element.xpath(attr_xpath):
+        new_rId = rId_map.get(str(attr))
+        if new_rId is not None:
+            attr.getparent().set(attr.attrname, new_rId)
+
+
+def _clone_part(part, package, allocator, clones, xml_blobs):
+    """Copy `part` and the parts it owns, sharing everything else by reference.
+
+    `clones` maps source partnames to their copies so a part reachable by
+    several paths (or the source slide itself, from its notes) is mapped
+    once. Parts python-pptx loads as plain blobs but that contain XML get
+    their element recorded in `xml_blobs` and are serialized by the caller.
+
+    Returns a tuple of (cloned part, {old rId: new rId}).
+    """
+    partname = allocator.next_partname(part.partname)
+    if isinstance(part, XmlPart):
+        element = deepcopy(part._element)
+        clone = type(part)(
+            partname=partname,
+            content_type=part.content_type,
+            package=package,
+            element=element,
+        )
+    elif part.content_type.endswith("xml"):
+        element = parse_xml(part.blob)
+        clone = type(part)(
+            partname=partname,
+            content_type=part.content_type,
+            package=package,
+            blob=part.blob,
+        )
+        xml_blobs.append((clone, element))
+    else:
+        element = None
+        clone = type(part)(
+            partname=partname,
+            content_type=part.content_type,
+            package=package,
+            blob=part.blob,
+        )
+    clones[str(part.partname)] = clone
+
+    rId_map = {}
+    for rId, rel in list(part.rels.items()):
+        if rel.reltype in SKIPPED_RELTYPES:
+            continue
+        if rel.is_external:
+            rId_map[rId] = clone.rels.get_or_add_ext_rel(rel.reltype, rel.target_ref)
+            continue
+
+        target = clones.get(str(rel.target_part.partname))
+        if target is None:
+            if rel.reltype in OWNED_RELTYPES:
+                target, _ = _clone_part(
+                    rel.target_part, package, allocator, clones, xml_blobs
                 )
+            else:
+                target = rel.target_part
+        rId_map[rId] = clone.relate_to(target, rel.reltype)
+
+    if element is not None:
+        remap_rIds(element, rId_map)
+    return clone, rId_map
+
 
-    # Copy any additional image/media relationships that might be referenced elsewhere
-    for rel_id, rel in image_rels.items():
-        try:
-            new_slide.part.rels.get_or_add(rel.reltype, rel._target)
-        except Exception:
-            pass  # Relationship might already exist
+def clone_slide(pres, index, count=1):
+    """Append `count` copies of a slide to the end of the presentation.
 
-    return new_slide
+    Each copy gets the slide's full XML (shapes, background, transitions and
+    timing) copied once, with every r:embed / r:link / r:id attribute
+    remapped in a single traversal. Images, media and other shared parts are
+    referenced rather than copied; charts, diagrams, embedded packages, tags
+    and the notes slide are copied per slide so editing one copy cannot
+    change another. Comments are not copied.
 
+    Returns the list of new slides.
+    """
+    source_part = pres.slides[index].part
+    package = source_part.package
+    allocator = PartnameAllocator(package)
+    sld_id_lst = pres.slides._sldIdLst
+
+    new_slides = []
+    for _ in range(count):
+        xml_blobs = []
+        clones = {}
+        slide_part, rId_map = _clone_part(
+            source_part, package, allocator, clones, xml_blobs
+        )
 
-def delete_slide(pres, index):
-    """Delete a slide from the presentation."""
-    rId = pres.slides._sldIdLst[index].rId
-    pres.part.drop_rel(rId)
-    del pres.slides._sldIdLst[index]
+        # Diagram data refers to its drawing part through the slide's rId
+        for part, element in xml_blobs:
+            if part.content_type == CT.DML_DIAGRAM_DATA:
+                remap_rIds(element, rId_map, "descendant-or-self::*/@relId")
+            part.blob = serialize_part_xml(element)
 
+        sld_id_lst.add_sldId(pres.part.relate_to(slide_part, RT.SLIDE))
+        new_slides.append(slide_part.slide)
 
-def reorder_slides(pres, slide_index, target_index):
-    """Move a slide from one position to another."""
-    slides = pres.slides._sldIdLst
+    return new_slides
 
-    # Remove slide element from current position
-    slide_element = slides[slide_index]
-    slides.remove(slide_element)
 
-    # Insert at target position
-    slides.insert(target_index, slide_element)
+def duplicate_slide(pres, index):
+    """Duplicate a slide in the presentation."""
+    return clone_slide(pres, index)[0]
 
 
 def rearrange_presentation(template_path, output_path, slide_sequence):
     """
     Create a new presentation with slides from template in specified order.
 
+    The final slide order is planned in a single pass over the sequence:
+    repeated slides are duplicated once per extra occurrence, unreferenced
+    slides are dropped in bulk, and the slide ID list is rebuilt once.
+
     Args:
         template_path: Path to template PPTX file
         output_path: Path for output PPTX file
@@ -169,57 +261,47 @@ def rearrange_presentation(template_path, output_path, slide_sequence):
         if idx < 0 or idx >= total_slides:
             raise ValueError(f"Slide index {idx} out of range (0-{total_slides - 1})")
 
-    # Track original slides and their duplicates
-    slide_map = []  # List of actual slide indices for final presentation
-    duplicated = {}  # Track duplicates: original_idx -> [duplicate_indices]
+    sld_id_lst = prs.slides._sldIdLst
+    original_sld_ids = list(sld_id_lst)
+    occurrences = Counter(slide_sequence)
+
+    # Final sldId element for each position in the sequence
+    final_order = []
+    duplicated = {}  # Track duplicates: original_idx -> deque of duplicate sldIds
 
-    # Step 1: DUPLICATE repeated slides
+    # Step 1: DUPLICATE repeated slides and plan the final order
     print(f"Processing {len(slide_sequence)} slides from template...")
     for i, template_idx in enumerate(slide_sequence):
-        if template_idx in duplicated and duplicated[template_idx]:
-            # Already duplicated this slide, use the duplicate
-            slide_map.append(duplicated[template_idx].pop(0))
+        if template_idx in duplicated:
+            # Already duplicated this slide, use the next duplicate
+            final_order.append(duplicated[template_idx].popleft())
             print(f"  [{i}] Using duplicate of slide {template_idx}")
-        elif slide_sequence.count(template_idx) > 1 and template_idx not in duplicated:
+        elif occurrences[template_idx] > 1:
             # First occurrence of a repeated slide - create duplicates
-            slide_map.append(template_idx)
-            duplicates = []
-            count = slide_sequence.count(template_idx) - 1
+            final_order.append(original_sld_ids[template_idx])
+            count = occurrences[template_idx] - 1
             print(
                 f"  [{i}] Using original slide {template_idx}, creating {count} duplicate(s)"
             )
-            for _ in range(count):
-                duplicate_slide(prs, template_idx)
-                duplicates.append(len(prs.slides) - 1)
-            duplicated[template_idx] = duplicates
+            clone_slide(prs, template_idx, count)
+            duplicated[template_idx] = deque(sld_id_lst[-count:])
         else:
-            # Unique slide or first occurrence already handled, use original
-            slide_map.append(template_idx)
+            # Unique slide, use original
+            final_order.append(original_sld_ids[template_idx])
             print(f"  [{i}] Using original slide {template_idx}")
 
-    # Step 2: DELETE unwanted slides (work backwards)
-    slides_to_keep = set(slide_map)
-    print(f"\nDeleting {len(prs.slides) - len(slides_to_keep)} unused slides...")
-    for i in range(len(prs.slides) - 1, -1, -1):
-        if i not in slides_to_keep:
-            delete_slide(prs, i)
-            # Update slide_map indices after deletion
-            slide_map = [idx - 1 if idx > i else idx for idx in slide_map]
-
-    # Step 3: REORDER to final sequence
-    print(f"Reordering {len(slide_map)} slides to final sequence...")
-    for target_pos in range(len(slide_map)):
-        # Find which slide should be at target_pos
-        current_pos = slide_map[target_pos]
-        if current_pos != target_pos:
-            reorder_slides(prs, current_pos, target_pos)
-            # Update slide_map: the move shifts other slides
-            for i in range(len(slide_map)):
-                if slide_map[i] > current_pos and slide_map[i] <= target_pos:
-                    slide_map[i] -= 1
-                elif slide_map[i] < current_pos and slide_map[i] >= target_pos:
-                    slide_map[i] += 1
-            slide_map[target_pos] = target_pos
+    # Step 2: DELETE unwanted slides (only originals can be unreferenced)
+    kept_rIds = {sld_id.rId for sld_id in final_order}
+    unused = [sld_id for sld_id in original_sld_ids if sld_id.rId not in kept_rIds]
+    print(f"\nDeleting {len(unused)} unused slides...")
+    for sld_id in unused:
+        prs.part.drop_rel(sld_id.rId)
+
+    # Step 3: REORDER by rebuilding the slide ID list once
+    print(f"Reordering {len(final_order)} slides to final sequence...")
+    for sld_id in list(sld_id_lst):
+        sld_id_lst.remove(sld_id)
+    sld_id_lst.extend(final_order)
 
     # Save the presentation
     prs.save(output_path)
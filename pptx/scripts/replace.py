@@ -12,9 +12,14 @@ unless "paragraphs" is specified in the replacements for that shape.
 import json
 import sys
 from pathlib import Path
-from typing import Any, Dict, List
-
-from inventory import InventoryData, extract_text_inventory
+from typing import Any, Dict, List, Tuple
+
+from inventory import (
+    InventoryData,
+    ShapeTable,
+    extract_text_inventory,
+    measure_detached_shape,
+)
 from pptx import Presentation
 from pptx.dml.color import RGBColor
 from pptx.enum.dml import MSO_THEME_COLOR
@@ -211,39 +216,23 @@ def check_duplicate_keys(pairs):
     return result
 
 
-def apply_replacements(pptx_file: str, json_file: str, output_file: str):
-    """Apply text replacements from JSON to PowerPoint presentation."""
-
-    # Load presentation
-    prs = Presentation(pptx_file)
-
-    # Get inventory of all text shapes (returns ShapeData objects)
-    # Pass prs to use same Presentation instance
-    inventory = extract_text_inventory(Path(pptx_file), prs)
-
-    # Detect text overflow in original presentation
-    original_overflow = detect_frame_overflow(inventory)
-
-    # Load replacement data with duplicate key detection
+def load_replacements(json_file: str) -> Dict[str, Any]:
+    """Load replacement JSON, rejecting duplicate keys."""
     with open(json_file, "r") as f:
-        replacements = json.load(f, object_pairs_hook=check_duplicate_keys)
+        return json.load(f, object_pairs_hook=check_duplicate_keys)
 
-    # Validate replacements
-    errors = validate_replacements(inventory, replacements)
-    if errors:
-        print("ERROR: Invalid shapes in replacement JSON:")
-        for error in errors:
-            print(f"  - {error}")
-        print("\nPlease check the inventory and update your replacement JSON.")
-        print(
-            "You can regenerate the inventory with: python inventory.py <input.pptx> <output.json>"
-        )
-        raise ValueError(f"Found {len(errors)} validation error(s)")
 
-    # Track statistics
-    shapes_processed = 0
-    shapes_cleared = 0
-    shapes_replaced = 0
+def replace_shape_text(
+    prs, inventory: InventoryData, shape_table: ShapeTable, replacements: Dict
+) -> Tuple[Dict[str, int], List[Tuple[str, str, Any, Any]]]:
+    """Clear every inventoried shape and add the replacement paragraphs.
+
+    Returns a tuple of (stats, replaced_shapes) where stats counts shapes
+    processed, cleared and replaced, and replaced_shapes lists
+    (slide_key, shape_key, slide, shape) for each shape that received new text.
+    """
+    stats = {"processed": 0, "cleared": 0, "replaced": 0}
+    replaced_shapes = []
 
     # Process each slide from inventory
     for slide_key, shapes_dict in inventory.items():
@@ -255,29 +244,31 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
         if slide_index >= len(prs.slides):
             print(f"Warning: Slide {slide_index} not found")
             continue
+        slide = prs.slides[slide_index]
 
         # Process each shape from inventory
-        for shape_key, shape_data in shapes_dict.items():
-            shapes_processed += 1
+        for shape_key in shapes_dict:
+            stats["processed"] += 1
 
-            # Get the shape directly from ShapeData
-            shape = shape_data.shape
+            # Get the live shape from the side table
+            shape = shape_table.get(slide_key, {}).get(shape_key)
             if not shape:
                 print(f"Warning: {shape_key} has no shape reference")
                 continue
 
-            # ShapeData already validates text_frame in __init__
+            # Inventory only includes shapes with a text frame
             text_frame = shape.text_frame  # type: ignore
 
             text_frame.clear()  # type: ignore
-            shapes_cleared += 1
+            stats["cleared"] += 1
 
             # Check for replacement paragraphs
             replacement_shape_data = replacements.get(slide_key, {}).get(shape_key, {})
             if "paragraphs" not in replacement_shape_data:
                 continue
 
-            shapes_replaced += 1
+            stats["replaced"] += 1
+            replaced_shapes.append((slide_key, shape_key, slide, shape))
 
             # Add replacement paragraphs
             for i, para_data in enumerate(replacement_shape_data["paragraphs"]):
@@ -288,25 +279,30 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
 
                 apply_paragraph_properties(p, para_data)
 
-    # Check for issues after replacements
-    # Save to a temporary file and reload to avoid modifying the presentation during inventory
-    # (extract_text_inventory accesses font.color which adds empty <a:solidFill/> elements)
-    import tempfile
+    return stats, replaced_shapes
 
-    with tempfile.NamedTemporaryFile(suffix=".pptx", delete=False) as tmp:
-        tmp_path = Path(tmp.name)
-        prs.save(str(tmp_path))
 
-    try:
-        updated_inventory = extract_text_inventory(tmp_path)
-        updated_overflow = detect_frame_overflow(updated_inventory)
-    finally:
-        tmp_path.unlink()  # Clean up temp file
+def check_replaced_shapes(
+    original_overflow: Dict[str, Dict[str, float]],
+    replaced_shapes: List[Tuple[str, str, Any, Any]],
+) -> Tuple[List[str], List[str]]:
+    """Check replaced shapes for worsened overflow and formatting warnings.
 
-    # Check if any text overflow got worse
+    Only replaced shapes can gain overflow or warnings (cleared shapes have
+    no text), so just those are re-measured. Measurement uses detached
+    copies to avoid modifying the presentation (reading font.color adds
+    empty <a:solidFill/> elements).
+
+    Returns a tuple of (overflow_errors, warnings).
+    """
     overflow_errors = []
-    for slide_key, shape_overflows in updated_overflow.items():
-        for shape_key, new_overflow in shape_overflows.items():
+    warnings = []
+    for slide_key, shape_key, slide, shape in replaced_shapes:
+        shape_data = measure_detached_shape(shape, slide)
+
+        # Check if text overflow got worse
+        new_overflow = shape_data.frame_overflow_bottom
+        if new_overflow is not None:
             # Get original overflow (0 if there was no overflow before)
             original = original_overflow.get(slide_key, {}).get(shape_key, 0.0)
 
@@ -318,13 +314,52 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
                     f'(was {original:.2f}", now {new_overflow:.2f}")'
                 )
 
-    # Collect warnings from updated shapes
-    warnings = []
-    for slide_key, shapes_dict in updated_inventory.items():
-        for shape_key, shape_data in shapes_dict.items():
-            if shape_data.warnings:
-                for warning in shape_data.warnings:
-                    warnings.append(f"{slide_key}/{shape_key}: {warning}")
+        # Collect warnings from updated shapes
+        for warning in shape_data.warnings:
+            warnings.append(f"{slide_key}/{shape_key}: {warning}")
+
+    return overflow_errors, warnings
+
+
+def apply_replacements(pptx_file: str, json_file: str, output_file: str):
+    """Apply text replacements from JSON to PowerPoint presentation."""
+
+    # Load presentation
+    prs = Presentation(pptx_file)
+
+    # Get inventory of all text shapes (returns ShapeRecord objects)
+    # Pass prs to use same Presentation instance, and collect the live
+    # shapes in a side table so they can be modified below
+    shape_table: ShapeTable = {}
+    inventory = extract_text_inventory(Path(pptx_file), prs, shape_table=shape_table)
+
+    # Detect text overflow in original presentation
+    original_overflow = detect_frame_overflow(inventory)
+
+    # Load replacement data with duplicate key detection
+    replacements = load_replacements(json_file)
+
+    # Validate replacements
+    errors = validate_replacements(inventory, replacements)
+    if errors:
+        print("ERROR: Invalid shapes in replacement JSON:")
+        for error in errors:
+            print(f"  - {error}")
+        print("\nPlease check the inventory and update your replacement JSON.")
+        print(
+            "You can regenerate the inventory with: python inventory.py <input.pptx> <output.json>"
+        )
+        raise ValueError(f"Found {len(errors)} validation error(s)")
+
+    # Clear all shapes and apply replacement paragraphs
+    stats, replaced_shapes = replace_shape_text(
+        prs, inventory, shape_table, replacements
+    )
+
+    # Check for issues after replacements
+    overflow_errors, warnings = check_replaced_shapes(
+        original_overflow, replaced_shapes
+    )
 
     # Fail if there are any issues
     if overflow_errors or warnings:
@@ -348,9 +383,9 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
     # Report results
     print(f"Saved updated presentation to: {output_file}")
     print(f"Processed {len(prs.slides)} slides")
-    print(f"  - Shapes processed: {shapes_processed}")
-    print(f"  - Shapes cleared: {shapes_cleared}")
-    print(f"  - Shapes replaced: {shapes_replaced}")
+    print(f"  - Shapes processed: {stats['processed']}")
+    print(f"  - Shapes cleared: {stats['cleared']}")
+    print(f"  - Shapes replaced: {stats['replaced']}")
 
 
 def main():
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Apply many replacement JSON files to one PowerPoint template.
+
+The template and its text inventory are loaded once (once per worker when
+running in parallel). Each job clears and fills the inventoried shapes,
+checks the replaced shapes for overflow, saves its output, and then restores
+the original text bodies so the next job starts from the pristine template.
+
+A job with validation errors or overflow is reported and skipped; the rest of
+the batch still runs.
+
+Usage:
+    python replace_batch.py template.pptx output_dir jobs... [--workers N] [--report report.json]
+
+Each job is a replacement JSON file (same structure as for replace.py) or a
+directory of them. Outputs are written to output_dir/<json stem>.pptx.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from inventory import ShapeTable, extract_text_inventory
+from pptx import Presentation
+from replace import (
+    check_replaced_shapes,
+    detect_frame_overflow,
+    load_replacements,
+    replace_shape_text,
+    validate_replacements,
+)
+
+JobResult = Dict[str, Any]
+
+
+class TemplateSession:
+    """A template loaded once and reused for many replacement jobs."""
+
+    def __init__(self, template_path: Path):
+        """Load the template, its inventory and a snapshot of every text body.
+
+        Args:
+            template_path: Path to the template PPTX file
+        """
+        self.prs = Presentation(str(template_path))
+        self.shape_table: ShapeTable = {}
+        self.inventory = extract_text_inventory(
+            template_path, self.prs, shape_table=self.shape_table
+        )
+        self.original_overflow = detect_frame_overflow(self.inventory)
+
+        # Jobs only touch the text bodies of inventoried shapes, so restoring
+        # these is enough to get back to the template between jobs
+        self._text_bodies = [
+            (shape, deepcopy(shape.element.txBody))
+            for shapes in self.shape_table.values()
+            for shape in shapes.values()
+        ]
+
+    def _restore_text_bodies(self) -> None:
+        """Put back the template's original text bodies."""
+        for shape, txBody in self._text_bodies:
+            current = shape.element.txBody
+            current.getparent().replace(current, deepcopy(txBody))
+
+    def run(self, replacements_file: Path, output_file: Path) -> JobResult:
+        """Apply one replacement JSON and save the result.
+
+        Returns a result dict with the job's status, any errors, shape
+        statistics and elapsed time. Errors are reported, never raised.
+        """
+        start = time.perf_counter()
+        result: JobResult = {
+            "replacements": str(replacements_file),
+            "output": str(output_file),
+            "status": "ok",
+            "errors": [],
+        }
+
+        try:
+            replacements = load_replacements(str(replacements_file))
+
+            errors = validate_replacements(self.inventory, replacements)
+            if errors:
+                result.update(status="invalid", errors=errors)
+                return result
+
+            stats, replaced_shapes = replace_shape_text(
+                self.prs, self.inventory, self.shape_table, replacements
+            )
+            result["stats"] = stats
+
+            overflow_errors, warnings = check_replaced_shapes(
+                self.original_overflow, replaced_shapes
+            )
+            if overflow_errors or warnings:
+                result.update(status="failed", errors=overflow_errors + warnings)
+                return result
+
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            self.prs.save(str(output_file))
+        except Exception as e:
+            result.update(status="error", errors=[f"{type(e).__name__}: {e}"])
+        finally:
+            self._restore_text_bodies()
+            result["seconds"] = round(time.perf_counter() - start, 3)
+
+        return result
+
+
+# Template session loaded once per worker process by _init_batch_worker
+_worker_session: Optional[TemplateSession] = None
+
+
+def _init_batch_worker(template_path: str) -> None:
+    """Load the template once in each worker process."""
+    global _worker_session
+    _worker_session = TemplateSession(Path(template_path))
+
+
+def _run_job_in_worker(job: Tuple[Path, Path]) -> JobResult:
+    """Run one job using the worker's template session."""
+    assert _worker_session is not None, "Batch worker was not initialized"
+    return _worker_session.run(*job)
+
+
+def collect_jobs(job_paths: List[Path], output_dir: Path) -> List[Tuple[Path, Path]]:
+    """Expand job files and directories into (replacements_file, output_file) pairs.
+
+    Raises:
+        ValueError: If a path does not exist or two jobs would write the same output
+    """
+    jobs = []
+    outputs: Dict[Path, Path] = {}
+    for job_path in job_paths:
+        if job_path.is_dir():
+            files = sorted(job_path.glob("*.json"))
+        elif job_path.exists():
+            files = [job_path]
+        else:
+            raise ValueError(f"Replacements file not found: {job_path}")
+
+        for replacements_file in files:
+            output_file = output_dir / f"{replacements_file.stem}.pptx"
+            if output_file in outputs:
+                raise ValueError(
+                    f"'{replacements_file}' and '{outputs[output_file]}' "
+                    f"would both write {output_file}"
+                )
+            outputs[output_file] = replacements_file
+            jobs.append((replacements_file, output_file))
+    return jobs
+
+
+def run_batch(
+    template_path: Path, jobs: List[Tuple[Path, Path]], workers: int = 1
+) -> List[JobResult]:
+    """Run replacement jobs against one template.
+
+    Args:
+        template_path: Path to the template PPTX file
+        jobs: List of (replacements_file, output_file) pairs
+        workers: Number of worker processes (0 = one per CPU core). Each
+            worker loads the template and its inventory once.
+
+    Returns:
+        One result dict per job, in job order
+    """
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(jobs))
+
+    if workers <= 1:
+        session = TemplateSession(template_path)
+        return [session.run(*job) for job in jobs]
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_batch_worker,
+        initargs=(str(template_path),),
+    ) as executor:
+        return list(executor.map(_run_job_in_worker, jobs))
+
+
+def main():
+    """Main entry point for command-line usage."""
+    parser = argparse.ArgumentParser(
+        description="Apply many replacement JSON files to one PowerPoint template.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python replace_batch.py template.pptx out/ jobs/
+    Fills template.pptx once per JSON file in jobs/, writing out/<name>.pptx
+
+  python replace_batch.py template.pptx out/ a.json b.json --workers 4 --report report.json
+    Runs jobs in 4 worker processes and writes per-job results to report.json
+        """,
+    )
+    parser.add_argument("template", help="Path to template PPTX file")
+    parser.add_argument("output_dir", help="Directory for output PPTX files")
+    parser.add_argument(
+        "jobs", nargs="+", help="Replacement JSON files or directories of them"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes (default: 1, 0 = one per CPU core)",
+    )
+    parser.add_argument("--report", help="Write per-job results to this JSON file")
+
+    args = parser.parse_args()
+
+    template_path = Path(args.template)
+    if not template_path.exists():
+        print(f"Error: Template file not found: {args.template}")
+        sys.exit(1)
+
+    try:
+        jobs = collect_jobs([Path(p) for p in args.jobs], Path(args.output_dir))
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    if not jobs:
+        print("Error: No replacement JSON files found")
+        sys.exit(1)
+
+    print(f"Applying {len(jobs)} replacement file(s) to: {args.template}")
+    results = run_batch(template_path, jobs, args.workers)
+
+    failed = [r for r in results if r["status"] != "ok"]
+    for result in results:
+        if result["status"] == "ok":
+            print(f"  OK     {result['output']} ({result['seconds']}s)")
+        else:
+            print(f"  {result['status'].upper():<6} {result['replacements']}")
+            for error in result["errors"]:
+                print(f"    - {error}")
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"Report saved to: {args.report}")
+
+    print(f"Completed {len(results) - len(failed)} of {len(results)} job(s)")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,16 +3,20 @@
 Create thumbnail grids from PowerPoint presentation slides.
 
 Creates a grid layout of slide thumbnails with configurable columns (max 6).
-Each grid contains up to cols×(cols+1) images. For presentations with more
-slides, multiple numbered grid files are created automatically.
+Each grid contains up to cols×rows images (rows defaults to cols+1 and can be
+set with --rows). For presentations with more slides, multiple numbered grid
+files are created automatically.
 
 The program outputs the names of all files created.
 
 Output:
 - Single grid: {prefix}.jpg (if slides fit in one grid)
 - Multiple grids: {prefix}-1.jpg, {prefix}-2.jpg, etc.
+- With --format webp/avif/png the extension changes accordingly
+- With --tiles: one {prefix}-slide-N.<ext> per slide
+- With --sidecar: {prefix}.json mapping slide numbers to pixel rectangles
 
-Grid limits by column count:
+Grid limits by column count (default rows):
 - 3 cols: max 12 slides per grid (3×4)
 - 4 cols: max 20 slides per grid (4×5)
 - 5 cols: max 30 slides per grid (5×6) [default]
@@ -20,6 +24,9 @@ Grid limits by column count:
 
 Usage:
     python thumbnail.py input.pptx [output_prefix] [--cols N] [--outline-placeholders]
+                        [--workers N] [--thumbnail-resolution]
+                        [--cache-dir DIR] [--cache-max-mb N]
+                        [--format FMT] [--quality N] [--rows N] [--tiles] [--sidecar]
 
 Examples:
     python thumbnail.py presentation.pptx
@@ -38,17 +45,38 @@ Examples:
 
     python thumbnail.py template.pptx analysis --outline-placeholders
     # Creates thumbnail grids with red outlines around text placeholders
+
+    python thumbnail.py large-deck.pptx grid --workers 0 --thumbnail-resolution
+    # Renders page ranges and grids in parallel (one worker per CPU core),
+    # rasterizing slides straight to thumbnail width
+
+    python thumbnail.py working.pptx grid --cache-dir .thumbnail-cache
+    # Re-renders only slides that changed since the last run
+
+    python thumbnail.py deck.pptx review/deck --format webp --quality 75 --tiles --sidecar
+    # Creates: review/deck.webp, review/deck-slide-N.webp and review/deck.json
 """
 
 import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from inventory import extract_text_inventory
+from inventory import extract_shape_geometry
 from PIL import Image, ImageDraw, ImageFont
 from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+
+# LibreOffice conversion is shared with the OOXML tools
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "ooxml" / "scripts"))
+from soffice import ConversionError, convert_document  # noqa: E402
 
 # Constants
 THUMBNAIL_WIDTH = 300  # Fixed thumbnail width in pixels
@@ -57,6 +85,27 @@ MAX_COLS = 6  # Maximum number of columns
 DEFAULT_COLS = 5  # Default number of columns
 JPEG_QUALITY = 95  # JPEG compression quality
 
+# Output formats: name -> (Pillow format, file extension, default quality)
+OUTPUT_FORMATS = {
+    "jpeg": ("JPEG", ".jpg", JPEG_QUALITY),
+    "webp": ("WEBP", ".webp", 80),
+    "avif": ("AVIF", ".avif", 60),
+    "png": ("PNG", ".png", None),  # Lossless; quality is ignored
+}
+
+# Render cache constants
+RENDER_CACHE_VERSION = 1  # Bump when rendering changes to invalidate caches
+RENDER_CACHE_ENV = "PPTX_THUMBNAIL_CACHE"  # Enables the render cache when set
+DEFAULT_RENDER_CACHE_MB = 512  # Size limit before least recently used eviction
+# Relationships that do not affect how a slide renders (and, for a master's
+# layouts, would pull in every sibling layout)
+UNRENDERED_RELTYPES = {RT.NOTES_SLIDE, RT.SLIDE, RT.COMMENTS, RT.SLIDE_LAYOUT}
+# Slide number fields of a layout or master that render on its slides
+# (placeholders there only show through a slide's own placeholder)
+INHERITED_SLIDE_NUMBER_XPATH = (
+    ".//a:fld[@type='slidenum'][not(ancestor::p:sp[p:nvSpPr/p:nvPr/p:ph])]"
+)
+
 # Grid layout constants
 GRID_PADDING = 20  # Padding between thumbnails
 BORDER_WIDTH = 2  # Border width around thumbnails
@@ -86,6 +135,53 @@ def main():
         action="store_true",
         help="Outline text placeholders with a colored border",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Parallel pdftoppm page ranges and grid compositions (default: 1, 0 = one per CPU core)",
+    )
+    parser.add_argument(
+        "--thumbnail-resolution",
+        action="store_true",
+        help=f"Rasterize slides directly at thumbnail width instead of {CONVERSION_DPI} DPI (faster, lower-quality outlines)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help=f"Directory for the rendered slide cache (default: ${RENDER_CACHE_ENV} if set)",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=DEFAULT_RENDER_CACHE_MB,
+        help=f"Evict least recently used slides beyond this size (default: {DEFAULT_RENDER_CACHE_MB})",
+    )
+    parser.add_argument(
+        "--format",
+        choices=sorted(OUTPUT_FORMATS),
+        default="jpeg",
+        help="Image format for grids and tiles (default: jpeg)",
+    )
+    parser.add_argument(
+        "--quality",
+        type=quality_value,
+        help="Encoder quality 1-100 (default: 95 jpeg, 80 webp, 60 avif; ignored for png)",
+    )
+    parser.add_argument(
+        "--rows",
+        type=positive_int,
+        help="Maximum rows per grid (default: columns + 1)",
+    )
+    parser.add_argument(
+        "--tiles",
+        action="store_true",
+        help="Also write each slide's thumbnail as its own file",
+    )
+    parser.add_argument(
+        "--sidecar",
+        action="store_true",
+        help="Write {prefix}.json mapping slide numbers to grid pixel rectangles",
+    )
 
     args = parser.parse_args()
 
@@ -100,33 +196,60 @@ def main():
         print(f"Error: Invalid PowerPoint file: {args.input}")
         sys.exit(1)
 
-    # Construct output path (always JPG)
-    output_path = Path(f"{args.output_prefix}.jpg")
+    # Construct output path in the requested format
+    try:
+        check_output_format(args.format)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    output_path = Path(f"{args.output_prefix}{OUTPUT_FORMATS[args.format][1]}")
+    sidecar_path = Path(f"{args.output_prefix}.json") if args.sidecar else None
+
+    workers = args.workers if args.workers > 0 else os.cpu_count() or 1
+    cache_max_bytes = args.cache_max_mb * 1024 * 1024
+    cache = (
+        RenderCache(Path(args.cache_dir), cache_max_bytes)
+        if args.cache_dir
+        else RenderCache.from_env(cache_max_bytes)
+    )
 
     print(f"Processing: {args.input}")
 
     try:
         with tempfile.TemporaryDirectory() as temp_dir:
+            # Load once for hidden slides, cache keys and placeholder regions
+            prs = Presentation(str(input_path))
+
             # Get placeholder regions if outlining is enabled
             placeholder_regions = None
             slide_dimensions = None
             if args.outline_placeholders:
                 print("Extracting placeholder regions...")
                 placeholder_regions, slide_dimensions = get_placeholder_regions(
-                    input_path
+                    input_path, prs
                 )
                 if placeholder_regions:
                     print(f"Found placeholders on {len(placeholder_regions)} slides")
 
             # Convert slides to images
-            slide_images = convert_to_images(input_path, Path(temp_dir), CONVERSION_DPI)
+            slide_images = convert_to_images(
+                input_path,
+                Path(temp_dir),
+                CONVERSION_DPI,
+                workers,
+                THUMBNAIL_WIDTH if args.thumbnail_resolution else None,
+                cache,
+                prs,
+            )
+            if cache:
+                print(f"Render cache: {cache.hits} hit(s), {cache.misses} miss(es)")
             if not slide_images:
                 print("Error: No slides found")
                 sys.exit(1)
 
             print(f"Found {len(slide_images)} slides")
 
-            # Create grids (max cols×(cols+1) images per grid)
+            # Create grids (max cols×rows images per grid)
             grid_files = create_grids(
                 slide_images,
                 cols,
@@ -134,18 +257,42 @@ def main():
                 output_path,
                 placeholder_regions,
                 slide_dimensions,
+                workers,
+                args.format,
+                args.quality,
+                args.rows,
+                args.tiles,
+                sidecar_path,
             )
 
             # Print saved files
             print(f"Created {len(grid_files)} grid(s):")
             for grid_file in grid_files:
                 print(f"  - {grid_file}")
+            if sidecar_path:
+                print(f"Slide rectangles saved to: {sidecar_path}")
 
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
 
 
+def quality_value(value):
+    """Parse an encoder quality argument (an integer from 1 to 100)."""
+    quality = int(value)
+    if not 1 <= quality <= 100:
+        raise argparse.ArgumentTypeError(f"must be between 1 and 100, got {quality}")
+    return quality
+
+
+def positive_int(value):
+    """Parse a positive integer argument."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def create_hidden_slide_placeholder(size):
     """Create placeholder image for hidden slides."""
     img = Image.new("RGB", size, color="#F0F0F0")
@@ -156,37 +303,33 @@ def create_hidden_slide_placeholder(size):
     return img
 
 
-def get_placeholder_regions(pptx_path):
+def get_placeholder_regions(pptx_path, prs=None):
     """Extract ALL text regions from the presentation.
 
+    Only shape geometry is extracted (no font loading or text wrapping), and
+    the presentation is not modified, so `prs` can be shared with
+    convert_to_images.
+
     Returns a tuple of (placeholder_regions, slide_dimensions).
     text_regions is a dict mapping slide indices to lists of text regions.
     Each region is a dict with 'left', 'top', 'width', 'height' in inches.
     slide_dimensions is a tuple of (width_inches, height_inches).
     """
-    prs = Presentation(str(pptx_path))
-    inventory = extract_text_inventory(pptx_path, prs)
+    if prs is None:
+        prs = Presentation(str(pptx_path))
+    geometry = extract_shape_geometry(pptx_path, prs)
     placeholder_regions = {}
 
     # Get actual slide dimensions in inches (EMU to inches conversion)
     slide_width_inches = (prs.slide_width or 9144000) / 914400.0
     slide_height_inches = (prs.slide_height or 5143500) / 914400.0
 
-    for slide_key, shapes in inventory.items():
+    for slide_key, shapes in geometry.items():
         # Extract slide index from "slide-N" format
         slide_idx = int(slide_key.split("-")[1])
-        regions = []
-
-        for shape_key, shape_data in shapes.items():
-            # The inventory only contains shapes with text, so all shapes should be highlighted
-            regions.append(
-                {
-                    "left": shape_data.left,
-                    "top": shape_data.top,
-                    "width": shape_data.width,
-                    "height": shape_data.height,
-                }
-            )
+
+        # The geometry only contains shapes with text, so all shapes should be highlighted
+        regions = list(shapes.values())
 
         if regions:
             placeholder_regions[slide_idx] = regions
@@ -194,11 +337,223 @@ def get_placeholder_regions(pptx_path):
     return placeholder_regions, (slide_width_inches, slide_height_inches)
 
 
-def convert_to_images(pptx_path, temp_dir, dpi):
-    """Convert PowerPoint to images via PDF, handling hidden slides."""
+def split_page_ranges(page_count, parts):
+    """Split pages 1..page_count into at most `parts` contiguous (first, last) ranges."""
+    parts = max(1, min(parts, page_count))
+    size, extra = divmod(page_count, parts)
+    ranges = []
+    first = 1
+    for i in range(parts if page_count else 0):
+        last = first + size - 1 + (1 if i < extra else 0)
+        ranges.append((first, last))
+        first = last + 1
+    return ranges
+
+
+class RenderCache:
+    """Opt-in on-disk cache of rendered slide images.
+
+    Entries are keyed by a hash of the slide part and every part it draws
+    from (layout, master, theme, images and other media) plus the render
+    resolution, so only slides whose rendering inputs changed are sent to
+    LibreOffice again. Slides that show their slide number are also keyed by
+    that number, so moving them invalidates their images. Least recently used entries are evicted once the
+    cache grows past max_bytes.
+    """
+
+    def __init__(self, cache_dir, max_bytes=DEFAULT_RENDER_CACHE_MB * 1024 * 1024):
+        """Initialize the cache, creating cache_dir if needed.
+
+        Args:
+            cache_dir: Directory holding one JPEG file per cached slide
+            max_bytes: Total size of cached images to keep after eviction
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls, max_bytes=DEFAULT_RENDER_CACHE_MB * 1024 * 1024):
+        """Create a cache from the PPTX_THUMBNAIL_CACHE environment variable, if set."""
+        cache_dir = os.environ.get(RENDER_CACHE_ENV)
+        return cls(Path(cache_dir), max_bytes) if cache_dir else None
+
+    def slide_keys(self, prs, resolution):
+        """Compute the cache key of every slide in a presentation."""
+        # Layouts, masters and media are shared by many slides; hash each once
+        part_digests = {}
+
+        def part_digest(part):
+            if part.partname not in part_digests:
+                digest = hashlib.sha256(part.blob)
+                for rId, rel in sorted(part.rels.items()):
+                    if rel.reltype in UNRENDERED_RELTYPES:
+                        continue
+                    digest.update(f"{rId}:{rel.reltype}".encode())
+                    if rel.is_external:
+                        digest.update(rel.target_ref.encode())
+                    else:
+                        digest.update(part_digest(rel.target_part))
+                part_digests[part.partname] = digest.digest()
+            return part_digests[part.partname]
+
+        prefix = (
+            f"{RENDER_CACHE_VERSION}:{resolution}:{prs.slide_width}x{prs.slide_height}"
+        ).encode()
+        first_slide_num = int(prs.part._element.get("firstSlideNum", "1"))
+
+        keys = []
+        for idx, slide in enumerate(prs.slides):
+            # The layout is the one slideLayout relationship a slide has
+            digest = hashlib.sha256(prefix)
+            digest.update(part_digest(slide.part))
+            digest.update(part_digest(slide.slide_layout.part))
+            if shows_slide_number(slide):
+                digest.update(f"slidenum:{first_slide_num + idx}".encode())
+            keys.append(digest.hexdigest())
+        return keys
+
+    def get(self, key):
+        """Return the cached image for a key, or None on a miss."""
+        path = self.cache_dir / f"{key}.jpg"
+        try:
+            os.utime(path)  # Mark as recently used
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return path
+
+    def put(self, key, image_path):
+        """Store a rendered image, writing atomically, and return its cached path."""
+        path = self.cache_dir / f"{key}.jpg"
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        os.close(fd)
+        try:
+            shutil.copyfile(image_path, tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return path
+
+    def evict(self, keep=()):
+        """Delete least recently used images until the cache fits max_bytes.
+
+        Args:
+            keep: Keys that must survive (e.g. the images about to be used)
+        """
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob("*.jpg"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            total += stat.st_size
+            if path.stem not in keep:
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+def shows_slide_number(slide):
+    """Check whether a slide renders a slide number field, so its image depends on its position."""
+    if slide.element.xpath(".//a:fld[@type='slidenum']"):
+        return True
+    layout = slide.slide_layout
+    return any(
+        element.xpath(INHERITED_SLIDE_NUMBER_XPATH)
+        for element in (layout.element, layout.slide_master.element)
+    )
+
+
+def write_slide_subset(pptx_path, slide_indices, output_path):
+    """Save a copy of a presentation containing only the given slides (0-based)."""
+    prs = Presentation(str(pptx_path))
+    sld_id_lst = prs.slides._sldIdLst
+    keep = set(slide_indices)
+    for idx, sld_id in enumerate(list(sld_id_lst)):
+        if idx not in keep:
+            prs.part.drop_rel(sld_id.rId)
+            sld_id_lst.remove(sld_id)
+    prs.save(str(output_path))
+
+
+def render_pages(pptx_path, temp_dir, page_count, dpi, workers=1, scale_to_width=None):
+    """Render a presentation's visible slides to JPEGs via PDF.
+
+    The PDF is rasterized by up to `workers` pdftoppm processes, each taking
+    a contiguous page range. With `scale_to_width`, pages are rendered
+    straight to that pixel width instead of at `dpi`.
+
+    Returns the page images in page order.
+    """
+    pdf_path = temp_dir / f"{pptx_path.stem}.pdf"
+
+    # Convert to PDF (on a warm LibreOffice instance if a pool is running)
+    print("Converting to PDF...")
+    try:
+        convert_document(pptx_path, temp_dir, "pdf")
+    except ConversionError:
+        raise RuntimeError("PDF conversion failed")
+    if not pdf_path.exists():
+        raise RuntimeError("PDF conversion failed")
+
+    # Convert PDF to images (hidden slides are not exported to the PDF)
+    if scale_to_width:
+        print(f"Converting to images at {scale_to_width}px wide...")
+        resolution = ["-scale-to-x", str(scale_to_width), "-scale-to-y", "-1"]
+    else:
+        print(f"Converting to images at {dpi} DPI...")
+        resolution = ["-r", str(dpi)]
+
+    def rasterize(page_range):
+        first, last = page_range
+        return subprocess.run(
+            ["pdftoppm", "-jpeg", *resolution, "-f", str(first), "-l", str(last)]
+            + [str(pdf_path), str(temp_dir / "slide")],
+            capture_output=True,
+            text=True,
+        )
+
+    page_ranges = split_page_ranges(page_count, workers)
+    with ThreadPoolExecutor(max_workers=max(1, len(page_ranges))) as executor:
+        results = list(executor.map(rasterize, page_ranges))
+    if any(result.returncode != 0 for result in results):
+        raise RuntimeError("Image conversion failed")
+
+    # pdftoppm names pages slide-<page>.jpg; sort numerically by page
+    return sorted(
+        temp_dir.glob("slide-*.jpg"),
+        key=lambda path: int(re.search(r"(\d+)$", path.stem).group(1)),
+    )
+
+
+def convert_to_images(
+    pptx_path, temp_dir, dpi, workers=1, scale_to_width=None, cache=None, prs=None
+):
+    """Convert PowerPoint to images via PDF, handling hidden slides.
+
+    `prs` is an optional Presentation already loaded from pptx_path; it is
+    read but not modified.
+
+    With a RenderCache, unchanged slides are served from the cache and only
+    the rest are rendered, from a temporary deck holding just those slides.
+    If any of them shows its slide number, the whole deck is rendered
+    instead, since the number would otherwise be its position in the
+    temporary deck.
+    """
     # Detect hidden slides
     print("Analyzing presentation...")
-    prs = Presentation(str(pptx_path))
+    if prs is None:
+        prs = Presentation(str(pptx_path))
     total_slides = len(prs.slides)
 
     # Find hidden slides (1-based indexing for display)
@@ -212,45 +567,53 @@ def convert_to_images(pptx_path, temp_dir, dpi):
     if hidden_slides:
         print(f"Hidden slides: {sorted(hidden_slides)}")
 
-    pdf_path = temp_dir / f"{pptx_path.stem}.pdf"
-
-    # Convert to PDF
-    print("Converting to PDF...")
-    result = subprocess.run(
-        [
-            "soffice",
-            "--headless",
-            "--convert-to",
-            "pdf",
-            "--outdir",
-            str(temp_dir),
-            str(pptx_path),
-        ],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0 or not pdf_path.exists():
-        raise RuntimeError("PDF conversion failed")
-
-    # Convert PDF to images
-    print(f"Converting to images at {dpi} DPI...")
-    result = subprocess.run(
-        ["pdftoppm", "-jpeg", "-r", str(dpi), str(pdf_path), str(temp_dir / "slide")],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        raise RuntimeError("Image conversion failed")
+    visible_slides = [
+        num for num in range(1, total_slides + 1) if num not in hidden_slides
+    ]
+
+    # Serve unchanged slides from the cache
+    rendered = {}  # slide number -> image path
+    cache_keys = {}
+    if cache:
+        resolution = f"{scale_to_width}px" if scale_to_width else f"{dpi}dpi"
+        slide_keys = cache.slide_keys(prs, resolution)
+        for slide_num in visible_slides:
+            cache_keys[slide_num] = slide_keys[slide_num - 1]
+            cached = cache.get(cache_keys[slide_num])
+            if cached:
+                rendered[slide_num] = cached
+    to_render = [num for num in visible_slides if num not in rendered]
+
+    if to_render:
+        source_path = pptx_path
+        if len(to_render) < len(visible_slides):
+            slides = list(prs.slides)
+            if any(shows_slide_number(slides[num - 1]) for num in to_render):
+                # Render slide numbers in place rather than as subset positions
+                print("Changed slides show slide numbers; rendering all slides...")
+                to_render = visible_slides
+            else:
+                print(f"Rendering {len(to_render)} changed slide(s)...")
+                source_path = temp_dir / "changed-slides.pptx"
+                write_slide_subset(pptx_path, [num - 1 for num in to_render], source_path)
+
+        images = render_pages(
+            source_path, temp_dir, len(to_render), dpi, workers, scale_to_width
+        )
+        for slide_num, image_path in zip(to_render, images):
+            if cache:
+                image_path = cache.put(cache_keys[slide_num], image_path)
+            rendered[slide_num] = image_path
 
-    visible_images = sorted(temp_dir.glob("slide-*.jpg"))
+    if cache:
+        cache.evict(keep=set(cache_keys.values()))
 
     # Create full list with placeholders for hidden slides
     all_images = []
-    visible_idx = 0
 
     # Get placeholder dimensions from first visible slide
-    if visible_images:
-        with Image.open(visible_images[0]) as img:
+    if rendered:
+        with Image.open(next(iter(rendered.values()))) as img:
             placeholder_size = img.size
     else:
         placeholder_size = (1920, 1080)
@@ -262,11 +625,9 @@ def convert_to_images(pptx_path, temp_dir, dpi):
             placeholder_img = create_hidden_slide_placeholder(placeholder_size)
             placeholder_img.save(placeholder_path, "JPEG")
             all_images.append(placeholder_path)
-        else:
+        elif slide_num in rendered:
             # Use the actual visible slide image
-            if visible_idx < len(visible_images):
-                all_images.append(visible_images[visible_idx])
-                visible_idx += 1
+            all_images.append(rendered[slide_num])
 
     return all_images
 
@@ -278,10 +639,28 @@ def create_grids(
     output_path,
     placeholder_regions=None,
     slide_dimensions=None,
+    workers=1,
+    output_format="jpeg",
+    quality=None,
+    rows=None,
+    tiles=False,
+    sidecar_path=None,
 ):
-    """Create multiple thumbnail grids from slide images, max cols×(cols+1) images per grid."""
-    # Maximum images per grid is cols × (cols + 1) for better proportions
-    max_images_per_grid = cols * (cols + 1)
+    """Create multiple thumbnail grids from slide images, max cols×rows images per grid.
+
+    Up to `workers` grids are composed and saved concurrently; each grid is
+    encoded straight to its file and released before the worker moves on.
+
+    Args:
+        output_format: Key of OUTPUT_FORMATS used for grids and tiles
+        quality: Encoder quality (default: the format's default)
+        rows: Maximum rows per grid (default: cols + 1)
+        tiles: Also write each slide's thumbnail as {stem}-slide-N.<ext>
+        sidecar_path: Optional JSON file mapping slide numbers to their grid
+            file and pixel rectangle [x, y, width, height]
+    """
+    # By default a grid holds cols × (cols + 1) images for better proportions
+    max_images_per_grid = cols * (cols + 1 if rows is None else rows)
     grid_files = []
 
     print(
@@ -289,17 +668,13 @@ def create_grids(
     )
 
     # Split images into chunks
+    chunks = []
     for chunk_idx, start_idx in enumerate(
         range(0, len(image_paths), max_images_per_grid)
     ):
         end_idx = min(start_idx + max_images_per_grid, len(image_paths))
         chunk_images = image_paths[start_idx:end_idx]
 
-        # Create grid for this chunk
-        grid = create_grid(
-            chunk_images, cols, width, start_idx, placeholder_regions, slide_dimensions
-        )
-
         # Generate output filename
         if len(image_paths) <= max_images_per_grid:
             # Single grid - use base filename without suffix
@@ -309,15 +684,85 @@ def create_grids(
             stem = output_path.stem
             suffix = output_path.suffix
             grid_filename = output_path.parent / f"{stem}-{chunk_idx + 1}{suffix}"
+        chunks.append((chunk_images, start_idx, grid_filename))
 
-        # Save grid
+    def compose(chunk):
+        chunk_images, start_idx, grid_filename = chunk
+        tile_rects = {}
+        grid = create_grid(
+            chunk_images,
+            cols,
+            width,
+            start_idx,
+            placeholder_regions,
+            slide_dimensions,
+            tile_rects,
+        )
         grid_filename.parent.mkdir(parents=True, exist_ok=True)
-        grid.save(str(grid_filename), quality=JPEG_QUALITY)
-        grid_files.append(str(grid_filename))
+        save_image(grid, grid_filename, output_format, quality)
+
+        tile_files = {}
+        if tiles:
+            for slide_num, (x, y, w, h) in tile_rects.items():
+                tile_filename = output_path.parent / (
+                    f"{output_path.stem}-slide-{slide_num}{output_path.suffix}"
+                )
+                tile = grid.crop((x, y, x + w, y + h))
+                save_image(tile, tile_filename, output_format, quality)
+                tile_files[slide_num] = tile_filename
+        return grid_filename, grid.size, tile_rects, tile_files
+
+    # Pillow releases the GIL while decoding, resizing and encoding, so
+    # threads compose grids in parallel; map keeps grid order
+    sidecar = {"format": output_format, "grids": [], "slides": {}}
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(chunks)))) as executor:
+        for grid_filename, size, tile_rects, tile_files in executor.map(compose, chunks):
+            grid_files.append(str(grid_filename))
+            sidecar["grids"].append(
+                {"file": grid_filename.name, "width": size[0], "height": size[1]}
+            )
+            for slide_num, rect in tile_rects.items():
+                entry = {"grid": grid_filename.name, "rect": list(rect)}
+                if slide_num in tile_files:
+                    entry["tile"] = tile_files[slide_num].name
+                sidecar["slides"][str(slide_num)] = entry
+
+    if tiles:
+        print(f"Wrote {len(sidecar['slides'])} slide tile(s)")
+    if sidecar_path:
+        sidecar_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(sidecar_path, "w", encoding="utf-8") as f:
+            json.dump(sidecar, f, indent=2)
 
     return grid_files
 
 
+def check_output_format(output_format):
+    """Raise ValueError if this Pillow build cannot write the output format."""
+    pil_format = OUTPUT_FORMATS[output_format][0]
+    Image.init()
+    if pil_format not in Image.SAVE:
+        try:
+            # Pillow < 11.2 writes AVIF only through this plugin
+            import pillow_avif  # noqa: F401
+        except ImportError:
+            raise ValueError(
+                f"This Pillow build cannot write {output_format.upper()} "
+                f"(AVIF needs Pillow 11.2+ or pillow-avif-plugin)"
+            )
+
+
+def save_image(img, path, output_format, quality=None):
+    """Encode an image straight to a file in one of OUTPUT_FORMATS."""
+    pil_format, _, default_quality = OUTPUT_FORMATS[output_format]
+    if default_quality is None:
+        params = {"optimize": True}
+    else:
+        params = {"quality": default_quality if quality is None else quality}
+    with open(path, "wb") as f:
+        img.save(f, format=pil_format, **params)
+
+
 def create_grid(
     image_paths,
     cols,
@@ -325,8 +770,15 @@ def create_grid(
     start_slide_num=0,
     placeholder_regions=None,
     slide_dimensions=None,
+    tile_rects=None,
 ):
-    """Create thumbnail grid from slide images with optional placeholder outlining."""
+    """Create thumbnail grid from slide images with optional placeholder outlining.
+
+    Tiles are decoded at reduced scale and pasted one at a time, and outlines
+    are drawn at tile resolution on the grid, so peak memory is about one
+    grid plus one tile. If `tile_rects` is given, it is filled with
+    {slide number: (x, y, width, height)} of each pasted thumbnail.
+    """
     font_size = int(width * FONT_SIZE_RATIO)
     label_padding = int(font_size * LABEL_PADDING_RATIO)
 
@@ -378,71 +830,65 @@ def create_grid(
             # Get original dimensions before thumbnail
             orig_w, orig_h = img.size
 
-            # Apply placeholder outlines if enabled
-            if placeholder_regions and (start_slide_num + i) in placeholder_regions:
-                # Convert to RGBA for transparency support
-                if img.mode != "RGBA":
-                    img = img.convert("RGBA")
-
-                # Get the regions for this slide
-                regions = placeholder_regions[start_slide_num + i]
-
-                # Calculate scale factors using actual slide dimensions
-                if slide_dimensions:
-                    slide_width_inches, slide_height_inches = slide_dimensions
-                else:
-                    # Fallback: estimate from image size at CONVERSION_DPI
-                    slide_width_inches = orig_w / CONVERSION_DPI
-                    slide_height_inches = orig_h / CONVERSION_DPI
-
-                x_scale = orig_w / slide_width_inches
-                y_scale = orig_h / slide_height_inches
-
-                # Create a highlight overlay
-                overlay = Image.new("RGBA", img.size, (255, 255, 255, 0))
-                overlay_draw = ImageDraw.Draw(overlay)
-
-                # Highlight each placeholder region
-                for region in regions:
-                    # Convert from inches to pixels in the original image
-                    px_left = int(region["left"] * x_scale)
-                    px_top = int(region["top"] * y_scale)
-                    px_width = int(region["width"] * x_scale)
-                    px_height = int(region["height"] * y_scale)
-
-                    # Draw highlight outline with red color and thick stroke
-                    # Using a bright red outline instead of fill
-                    stroke_width = max(
-                        5, min(orig_w, orig_h) // 150
-                    )  # Thicker proportional stroke width
-                    overlay_draw.rectangle(
-                        [(px_left, px_top), (px_left + px_width, px_top + px_height)],
-                        outline=(255, 0, 0, 255),  # Bright red, fully opaque
-                        width=stroke_width,
-                    )
-
-                # Composite the overlay onto the image using alpha blending
-                img = Image.alpha_composite(img, overlay)
-                # Convert back to RGB for JPEG saving
-                img = img.convert("RGB")
-
+            # Decode JPEGs at the smallest DCT scale that still covers the
+            # tile, then paste right away so only one tile is held at a time
+            img.draft("RGB", (width, height))
             img.thumbnail((width, height), Image.Resampling.LANCZOS)
             w, h = img.size
             tx = x + (width - w) // 2
             ty = y_thumbnail + (height - h) // 2
             grid.paste(img, (tx, ty))
+        if tile_rects is not None:
+            tile_rects[start_slide_num + i] = (tx, ty, w, h)
+
+        # Apply placeholder outlines if enabled, drawn at tile resolution
+        # directly on the grid
+        if placeholder_regions and (start_slide_num + i) in placeholder_regions:
+            # Calculate scale factors using actual slide dimensions
+            if slide_dimensions:
+                slide_width_inches, slide_height_inches = slide_dimensions
+            else:
+                # Fallback: estimate from image size at CONVERSION_DPI
+                slide_width_inches = orig_w / CONVERSION_DPI
+                slide_height_inches = orig_h / CONVERSION_DPI
+
+            x_scale = w / slide_width_inches
+            y_scale = h / slide_height_inches
+
+            # Same proportional stroke as on the full-size slide, scaled to the tile
+            stroke_width = max(2, round(max(5, min(orig_w, orig_h) // 150) * w / orig_w))
+
+            for region in placeholder_regions[start_slide_num + i]:
+                # Convert from inches to tile pixels, clipped to the tile
+                px_left = max(tx, tx + int(region["left"] * x_scale))
+                px_top = max(ty, ty + int(region["top"] * y_scale))
+                px_right = min(
+                    tx + w - 1, tx + int((region["left"] + region["width"]) * x_scale)
+                )
+                px_bottom = min(
+                    ty + h - 1, ty + int((region["top"] + region["height"]) * y_scale)
+                )
+                if px_right <= px_left or px_bottom <= px_top:
+                    continue
 
-            # Add border
-            if BORDER_WIDTH > 0:
+                # Bright red outline instead of fill
                 draw.rectangle(
-                    [
-                        (tx - BORDER_WIDTH, ty - BORDER_WIDTH),
-                        (tx + w + BORDER_WIDTH - 1, ty + h + BORDER_WIDTH - 1),
-                    ],
-                    outline="gray",
-                    width=BORDER_WIDTH,
+                    [(px_left, px_top), (px_right, px_bottom)],
+                    outline=(255, 0, 0),
+                    width=stroke_width,
                 )
 
+        # Add border
+        if BORDER_WIDTH > 0:
+            draw.rectangle(
+                [
+                    (tx - BORDER_WIDTH, ty - BORDER_WIDTH),
+                    (tx + w + BORDER_WIDTH - 1, ty + h + BORDER_WIDTH - 1),
+                ],
+                outline="gray",
+                width=BORDER_WIDTH,
+            )
+
     return grid
 
 